@@ -1,4 +1,35 @@
-from ariadne_lambda.graphql import GraphQLLambda
-from ariadne_lambda.http_handler import GraphQLAWSAPIHTTPGatewayHandler
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
 
-__all__ = ["GraphQLLambda", "GraphQLAWSAPIHTTPGatewayHandler"]
+if TYPE_CHECKING:
+    from ariadne_lambda.batch_handler import GraphQLEventBatchHandler
+    from ariadne_lambda.cache import DocumentCache
+    from ariadne_lambda.direct_handler import GraphQLDirectInvokeHandler
+    from ariadne_lambda.graphql import GraphQLLambda
+    from ariadne_lambda.http_handler import GraphQLAWSAPIHTTPGatewayHandler
+
+__all__ = [
+    "DocumentCache",
+    "GraphQLLambda",
+    "GraphQLAWSAPIHTTPGatewayHandler",
+    "GraphQLEventBatchHandler",
+    "GraphQLDirectInvokeHandler",
+]
+
+# public names are imported from their modules on first access to keep cold start
+# of applications importing only some of the package's modules short
+LAZY_IMPORTS = {
+    "DocumentCache": "ariadne_lambda.cache",
+    "GraphQLLambda": "ariadne_lambda.graphql",
+    "GraphQLAWSAPIHTTPGatewayHandler": "ariadne_lambda.http_handler",
+    "GraphQLEventBatchHandler": "ariadne_lambda.batch_handler",
+    "GraphQLDirectInvokeHandler": "ariadne_lambda.direct_handler",
+}
+
+
+def __getattr__(name: str) -> Any:
+    if name in LAZY_IMPORTS:
+        value = getattr(import_module(LAZY_IMPORTS[name]), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -1,14 +1,198 @@
-from abc import abstractmethod
+from abc import ABC, abstractmethod
+from collections.abc import AsyncIterator, Awaitable, Callable, Mapping
+from functools import partial
 from inspect import isawaitable
-from typing import Any
+from logging import Logger, LoggerAdapter, getLogger
+from time import perf_counter_ns
+from typing import TYPE_CHECKING, Any
 
-from ariadne.asgi.handlers.base import GraphQLHandler
-from aws_lambda_powertools.utilities.typing import LambdaContext
+from ariadne.format_error import format_error
+from ariadne.graphql import graphql, parse_query, validate_query
+from ariadne.types import (
+    ContextValue,
+    ErrorFormatter,
+    ExtensionList,
+    Extensions,
+    GraphQLResult,
+    MiddlewareList,
+    Middlewares,
+    QueryParser,
+    QueryValidator,
+    RootValue,
+    ValidationRules,
+)
+from graphql import (
+    DocumentNode,
+    ExecutionContext,
+    GraphQLError,
+    GraphQLSchema,
+    MiddlewareManager,
+)
 
+from ariadne_lambda.cache import DOCUMENT_SIZE_FACTOR, CachedDocument, DocumentCache
+from ariadne_lambda.json_codec import JSONCodec, StdlibJSONCodec
+from ariadne_lambda.timing import Timing, get_phase_timer
+
+if TYPE_CHECKING:
+    from ariadne.explorer import Explorer
+    from aws_lambda_powertools.utilities.typing import LambdaContext
+
+    from ariadne_lambda.cost import QueryCost, QueryCostAnalyzer
+    from ariadne_lambda.dataloaders import DataLoaderFactory
+    from ariadne_lambda.deadline import DeadlinePropagation
+    from ariadne_lambda.persisted_queries import PersistedQueryStore
+    from ariadne_lambda.resources import Resources
+    from ariadne_lambda.result_cache import ResultCache
+    from ariadne_lambda.trusted_documents import TrustedDocuments
+
+
+class GraphQLLambdaHandler(ABC):
+    """Base class for AWS Lambda event handlers.
+
+    Mirrors the configuration API of Ariadne's ASGI `GraphQLHandler` without
+    importing `ariadne.asgi`, which pulls ASGI handlers and explorers into
+    the Lambda's cold start.
+    """
+
+    def __init__(
+        self,
+        extensions: Extensions | None = None,
+        middleware: Middlewares | None = None,
+        middleware_manager_class: type[MiddlewareManager] | None = None,
+    ) -> None:
+        """Initialize the handler instance with empty configuration.
+
+        # Optional arguments
+
+        `extensions`: a `list` of Ariadne extensions or callable returning it.
+
+        `middleware`: a `list` of middlewares or callable returning it.
+
+        `middleware_manager_class`: a `MiddlewareManager` type to combine middlewares.
+        """
+        self.extensions = extensions
+        self.middleware = middleware
+        self.middleware_manager_class = middleware_manager_class or MiddlewareManager
+        self.middleware_manager: MiddlewareManager | None = None
+
+        self.schema: GraphQLSchema | None = None
+        self.context_value: ContextValue | None = None
+        self.debug: bool = False
+        self.error_formatter: ErrorFormatter = format_error
+        self.introspection: bool = True
+        self.explorer: Explorer | None = None
+        self.logger: None | str | Logger | LoggerAdapter = None
+        self.root_value: RootValue | None = None
+        self.query_parser: QueryParser | None = None
+        self.query_validator: QueryValidator | None = None
+        self.validation_rules: ValidationRules | None = None
+        self.execute_get_queries: bool = False
+        self.execution_context_class: type[ExecutionContext] | None = None
+
+        self.document_cache: DocumentCache | None = None
+        self.persisted_query_store: PersistedQueryStore | None = None
+        self.json_codec: JSONCodec = StdlibJSONCodec()
+        self.timing: Timing | None = None
+        self.result_cache: ResultCache | None = None
+        self.dataloaders: Mapping[str, DataLoaderFactory] | None = None
+        self.cost_analyzer: QueryCostAnalyzer | None = None
+        self.trusted_documents: TrustedDocuments | None = None
+        self.deadline: DeadlinePropagation | None = None
+        self.resources: Resources | None = None
+
+    def configure(
+        self,
+        schema: GraphQLSchema,
+        context_value: ContextValue | None = None,
+        root_value: RootValue | None = None,
+        query_parser: QueryParser | None = None,
+        query_validator: QueryValidator | None = None,
+        validation_rules: ValidationRules | None = None,
+        execute_get_queries: bool = False,
+        debug: bool = False,
+        introspection: bool = True,
+        explorer: "Explorer | None" = None,
+        logger: None | str | Logger | LoggerAdapter = None,
+        error_formatter: ErrorFormatter = format_error,
+        execution_context_class: type[ExecutionContext] | None = None,
+        *,
+        document_cache: DocumentCache | None = None,
+        persisted_query_store: "PersistedQueryStore | None" = None,
+        json_codec: JSONCodec | None = None,
+        timing: Timing | None = None,
+        result_cache: "ResultCache | None" = None,
+        dataloaders: "Mapping[str, DataLoaderFactory] | None" = None,
+        cost_analyzer: "QueryCostAnalyzer | None" = None,
+        trusted_documents: "TrustedDocuments | None" = None,
+        deadline: "DeadlinePropagation | None" = None,
+        resources: "Resources | None" = None,
+    ):
+        """Configures the handler with options from the GraphQLLambda application.
+
+        Called by `GraphQLLambda` as part of its initialization. Accepts the same
+        options as Ariadne's ASGI `GraphQLHandler.configure`, and additionally:
+
+        # Optional arguments
+
+        `document_cache`: a `DocumentCache` instance to store parsed and validated
+        GraphQL documents in between the invocations.
+
+        `persisted_query_store`: a `PersistedQueryStore` instance enabling support
+        for Automatic Persisted Queries.
+
+        `json_codec`: a `JSONCodec` instance used to decode requests and encode
+        responses. Defaults to `StdlibJSONCodec`.
+
+        `timing`: a `Timing` instance enabling measurement of invocation phases.
+
+        `result_cache`: a `ResultCache` instance to store results of queries in
+        between the invocations.
+
+        `dataloaders`: a `dict` with data loaders names as keys and batch load
+        functions or `DataLoader` subclasses as values. Loaders are created for every
+        invocation in the `loaders` key of the context.
+
+        `cost_analyzer`: a `QueryCostAnalyzer` instance rejecting operations
+        exceeding cost limits before their execution.
+
+        `trusted_documents`: a `TrustedDocuments` instance with the only documents
+        that can be executed. Documents are parsed and validated here.
+
+        `deadline`: a `DeadlinePropagation` instance enabling cancellation of
+        resolvers that don't complete before the invocation's deadline.
+
+        `resources`: a `Resources` instance with container-scoped resources,
+        available in the `resources` key of the `dict` context.
+        """
+        self.context_value = context_value
+        self.debug = debug
+        self.error_formatter = error_formatter
+        self.execute_get_queries = execute_get_queries
+        self.execution_context_class = execution_context_class
+        self.introspection = introspection
+        self.explorer = explorer
+        self.logger = logger
+        self.query_parser = query_parser
+        self.query_validator = query_validator
+        self.root_value = root_value
+        self.schema = schema
+        self.validation_rules = validation_rules
+
+        self.document_cache = document_cache
+        self.persisted_query_store = persisted_query_store
+        self.json_codec = json_codec or StdlibJSONCodec()
+        self.timing = timing
+        self.result_cache = result_cache
+        self.dataloaders = dataloaders
+        self.cost_analyzer = cost_analyzer
+        self.trusted_documents = trusted_documents
+        self.deadline = deadline
+        self.resources = resources
+        if trusted_documents is not None:
+            trusted_documents.prepare(schema, validation_rules, introspection, query_validator)
 
-class GraphQLLambdaHandler(GraphQLHandler):
     @abstractmethod
-    async def handle(self, event: dict, context: LambdaContext):
+    async def handle(self, event: dict, context: "LambdaContext"):
         """An entrypoint for the AWS Lambda connection handler.
 
         This method is called by Ariadne AWS Lambda GraphQL application. Subclasses
@@ -25,6 +209,27 @@ class GraphQLLambdaHandler(GraphQLHandler):
             "Subclasses of GraphQLLambdaHandler must implement the 'handle' method"
         )
 
+    async def handle_streaming(
+        self, event: dict, context: "LambdaContext"
+    ) -> AsyncIterator[bytes]:
+        """An entrypoint for AWS Lambda response streaming.
+
+        Yields HTTP response prelude with status code and headers, followed by the
+        chunks of response body. Default implementation streams response returned
+        by `handle`. Subclasses can override it to stream the body incrementally.
+
+        # Required arguments
+
+        `event`: The AWS Lambda event dictionary.
+
+        `context`: The AWS Lambda context object.
+        """
+        from ariadne_lambda.streaming import iter_rendered_response
+
+        response = await self.handle(event, context)
+        for chunk in iter_rendered_response(response):
+            yield chunk
+
     async def get_context_for_request(
         self,
         request: Any,
@@ -36,6 +241,11 @@ class GraphQLLambdaHandler(GraphQLHandler):
         request. Subclasses can override it to provide custom context value
         based on the request.
 
+        When data loaders are configured, `dict` context receives a new
+        `DataLoaderRegistry` in the `loaders` key. When invocation has a deadline,
+        it's set in the `deadline` key, and container-scoped resources are set in
+        the `resources` key.
+
         # Required arguments
 
         `request`: The request object as defined by the 'handle' method.
@@ -50,6 +260,420 @@ class GraphQLLambdaHandler(GraphQLHandler):
 
             if isawaitable(context):
                 context = await context
-            return context
+        else:
+            context = self.context_value or {"request": request}
+
+        if isinstance(context, dict):
+            context = self.add_invocation_state_to_context(context)
+        return context
+
+    def add_invocation_state_to_context(self, context: dict) -> dict:
+        """Return context with data loaders registry, the deadline of the invocation
+        and container-scoped resources.
+
+        Context is copied, as static context value is shared by all invocations.
+        """
+        state: dict[str, Any] = {}
+        if self.dataloaders and "loaders" not in context:
+            from ariadne_lambda.dataloaders import DataLoaderRegistry
+
+            state["loaders"] = DataLoaderRegistry(self.dataloaders)
+        if self.deadline is not None and "deadline" not in context:
+            from ariadne_lambda.deadline import get_deadline
+
+            deadline = get_deadline()
+            if deadline is not None:
+                state["deadline"] = deadline
+        if self.resources is not None and "resources" not in context:
+            state["resources"] = self.resources
+        if state:
+            return {**context, **state}
+        return context
+
+    async def get_extensions_for_request(
+        self, request: Any, context: ContextValue | None
+    ) -> ExtensionList:
+        """Return the extensions to use for the request.
+
+        `DeadlineExtension` is added when the deadline propagation is configured.
+
+        # Required arguments
+
+        `request`: The request object as defined by the 'handle' method.
+
+        `context`: context value of the request.
+        """
+        extensions = self.extensions
+        if callable(extensions):
+            extensions = extensions(request, context)
+            if isawaitable(extensions):
+                extensions = await extensions  # type: ignore
+        if self.deadline is not None:
+            from ariadne_lambda.deadline import DeadlineExtension
+
+            extensions = [*(extensions or []), DeadlineExtension]
+        return extensions
+
+    def get_logger(self) -> Logger | LoggerAdapter:
+        """Return the logger configured for the handler, `ariadne` by default."""
+        if isinstance(self.logger, Logger | LoggerAdapter):
+            return self.logger
+        return getLogger(self.logger or "ariadne")
+
+    async def get_middleware_for_request(
+        self, request: Any, context: ContextValue | None
+    ) -> MiddlewareList:
+        """Return the middleware to use for the request.
+
+        # Required arguments
+
+        `request`: The request object as defined by the 'handle' method.
+
+        `context`: context value of the request.
+        """
+        if callable(self.middleware):
+            middleware = self.middleware(request, context)
+            if isawaitable(middleware):
+                middleware = await middleware  # type: ignore
+            return middleware
+        return self.middleware
+
+    def get_middleware_manager_class(
+        self, middleware: MiddlewareList, extensions: ExtensionList
+    ) -> Callable[..., MiddlewareManager]:
+        """Return middleware manager type, or a factory of the manager shared by
+        requests.
+
+        Middleware manager wraps every resolver with middleware once and keeps
+        wrapped resolvers. When the request uses static middleware list and no
+        extensions, which are created for every request, single manager is reused
+        by all invocations, so resolvers are not wrapped again.
+        """
+        if extensions or not middleware or middleware is not self.middleware:
+            return self.middleware_manager_class
+
+        if self.middleware_manager is None:
+            self.middleware_manager = self.middleware_manager_class(*middleware)
+        middleware_manager = self.middleware_manager
+        return lambda *_: middleware_manager
+
+    def is_query_required(self, request: Any) -> bool:
+        """Return `True` if only query operations can be executed for the request.
+
+        Default implementation allows all operations.
+        """
+        return False
+
+    def get_request_headers(self, request: Any) -> dict[str, str]:
+        """Return headers of the request with lowercase names, used by the result cache.
+
+        Default implementation returns no headers.
+        """
+        return {}
 
-        return self.context_value or {"request": request}
\ No newline at end of file
+    def create_warmup_request(self, data: dict) -> Any:
+        """Return synthetic request used to execute warm-up operations.
+
+        Default implementation returns the GraphQL data, like direct invocations.
+        """
+        return data
+
+    def prepare_document(self, request: Any, cached_document: CachedDocument) -> None:
+        """Hook called with the parsed document of the request before its execution.
+
+        Subclasses can override it to analyze the document. Default implementation
+        does nothing.
+        """
+
+    async def execute_graphql_query(
+        self,
+        request: Any,
+        data: Any,
+        *,
+        context_value: Any = None,
+        query_document: DocumentNode | None = None,
+        use_result_cache: bool = True,
+    ) -> GraphQLResult:
+        """Execute the GraphQL query and return its result.
+
+        Uses parsed document from the document cache and result from the result
+        cache when they are configured.
+
+        # Required arguments
+
+        `request`: The request object as defined by the 'handle' method.
+
+        `data`: a `dict` with the query, variables and operation name.
+
+        # Optional arguments
+
+        `context_value`: context value of the query. Created with
+        `get_context_for_request` if not set.
+
+        `query_document`: already parsed GraphQL query document.
+
+        `use_result_cache`: a `bool` controlling if result is read from and stored
+        in the result cache, e.g. `False` for results of stub context.
+        """
+        data, error_result = self.resolve_trusted_document(data)
+        if error_result is not None:
+            return error_result
+
+        if context_value is None:
+            context_value = await self.get_context_for_request(request, data)
+
+        extensions = await self.get_extensions_for_request(request, context_value)
+        middleware = await self.get_middleware_for_request(request, context_value)
+
+        if self.schema is None:
+            raise TypeError("schema is not set, call configure method to initialize it")
+
+        query_validator = self.query_validator
+        result_cache_key = None
+        query_cost = None
+        cached_document = None
+        if query_document is None:
+            cached_document = self.get_cached_document(context_value, data)
+        if cached_document is not None:
+            query_document = cached_document.document
+            if cached_document.validation_errors is not None:
+                query_validator = cached_document.validate
+
+            query_cost = self.get_query_cost(data, cached_document)
+            if query_cost is not None and self.cost_analyzer.get_error(query_cost):  # type: ignore
+                return self.create_query_cost_error_result(query_cost)
+
+            self.prepare_document(request, cached_document)
+            result_cache_key = (
+                self.get_result_cache_key(request, data, context_value, cached_document.document)
+                if use_result_cache
+                else None
+            )
+
+        timer = get_phase_timer()
+        started = perf_counter_ns() if timer else 0
+        if timer:
+            timer.set_operation_name(data)
+
+        execute = partial(
+            graphql,
+            self.schema,
+            data,
+            context_value=context_value,
+            root_value=self.root_value,
+            query_parser=self.query_parser,
+            query_validator=query_validator,
+            query_document=query_document,
+            validation_rules=self.validation_rules,
+            require_query=self.is_query_required(request),
+            debug=self.debug,
+            introspection=self.introspection,
+            logger=self.logger,
+            error_formatter=self.error_formatter,
+            extensions=extensions,
+            middleware=middleware,
+            middleware_manager_class=self.get_middleware_manager_class(middleware, extensions),
+            execution_context_class=self.execution_context_class,
+        )
+        result = await self.get_or_execute_result(result_cache_key, execute)
+        if timer:
+            timer.record("execute", started)
+        return self.add_query_cost_extension(result, query_cost)
+
+    async def get_or_execute_result(
+        self, result_cache_key: bytes | None, execute: Callable[[], Awaitable[GraphQLResult]]
+    ) -> GraphQLResult:
+        """Return result from the result cache, or execute the query if its result
+        can't be cached."""
+        if result_cache_key is None:
+            return await execute()
+        return await self.result_cache.get_or_execute(  # type: ignore
+            result_cache_key, execute, self.json_codec
+        )
+
+    def resolve_trusted_document(self, data: Any) -> tuple[Any, GraphQLResult | None]:
+        """Return GraphQL data with the requested trusted document.
+
+        When trusted documents are configured, returns error result as second item
+        if data doesn't reference one of them.
+        """
+        if self.trusted_documents is None:
+            return data, None
+
+        from ariadne_lambda.trusted_documents import TrustedDocumentError
+
+        try:
+            return self.trusted_documents.resolve(data), None
+        except TrustedDocumentError as error:
+            return data, (False, {"errors": [error.format()]})
+
+    def get_query_cost(self, data: Any, cached_document: CachedDocument) -> "QueryCost | None":
+        """Return cost of the operation to execute from the document.
+
+        Returns `None` if cost analyzer is not configured or the document is not valid.
+        """
+        if self.cost_analyzer is None or cached_document.validation_errors:
+            return None
+        return self.cost_analyzer.get_cost(
+            self.schema,  # type: ignore
+            cached_document,
+            data,
+        )
+
+    def create_query_cost_error_result(self, query_cost: "QueryCost") -> GraphQLResult:
+        """Return result of the operation rejected by the cost analyzer."""
+        error = self.cost_analyzer.get_error(query_cost)  # type: ignore
+        return False, {
+            "errors": [self.error_formatter(error, self.debug)],  # type: ignore
+            "extensions": {"cost": self.cost_analyzer.get_extension(query_cost)},  # type: ignore
+        }
+
+    def add_query_cost_extension(
+        self, result: GraphQLResult, query_cost: "QueryCost | None"
+    ) -> GraphQLResult:
+        """Return result with cost of the operation in its `extensions`.
+
+        Result is copied, as it may be stored in the result cache.
+        """
+        success, data = result
+        if query_cost is None or not isinstance(data, dict):
+            return result
+        extensions = {
+            **(data.get("extensions") or {}),
+            "cost": self.cost_analyzer.get_extension(query_cost),  # type: ignore
+        }
+        return success, {**data, "extensions": extensions}
+
+    def get_result_cache_key(
+        self, request: Any, data: Any, context_value: Any, document: DocumentNode
+    ) -> bytes | None:
+        """Return the key of query's result in the result cache.
+
+        Returns `None` if result cache is not configured or the operation is not
+        a query.
+        """
+        if self.result_cache is None or not isinstance(data, dict):
+            return None
+        if not self.result_cache.is_cacheable(document, data):
+            return None
+        headers = self.get_request_headers(request)
+        return self.result_cache.get_key(data, headers, context_value)
+
+    def get_cached_document(self, context_value: Any, data: Any) -> CachedDocument | None:
+        """Return parsed and validated document for the request from the document cache.
+
+        Parses and validates the query on cache miss. Returns `None` if document
+        cache is not configured or query could not be parsed, leaving error reporting
+        to the GraphQL executor.
+
+        Query is parsed and validated here even without the document cache when
+        `is_document_required` returns `True`.
+
+        Validation is only cached when `validation_rules` are not a callable, as
+        callable rules may depend on the request's context. Operations exceeding
+        limits of the cost analyzer are rejected before validation, so their
+        documents are validated only when executed with smaller costs.
+
+        # Required arguments
+
+        `context_value`: context value for the request, passed to `query_parser`.
+
+        `data`: GraphQL data from connection.
+        """
+        if (
+            self.document_cache is None
+            and self.trusted_documents is None
+            and not self.is_document_required()
+        ):
+            return None
+        if not isinstance(data, dict):
+            return None
+
+        query = data.get("query")
+        if not query or not isinstance(query, str):
+            return None
+        if self.trusted_documents is not None:
+            return self.trusted_documents.get_cached_document(query)
+
+        cache_key = self.get_document_cache_key(query)
+        validation_rules = cache_key[2]
+        cached_document = None
+        if self.document_cache is not None:
+            cached_document = self.document_cache.get(cache_key)
+        if cached_document is None:
+            cached_document = self.parse_query_document(context_value, data)
+            if cached_document is None:
+                return None
+            if self.document_cache is not None:
+                self.document_cache.set(cache_key, cached_document)
+
+        if (
+            cached_document.validation_errors is None
+            and not callable(validation_rules)
+            and not self.exceeds_query_cost_limits(data, cached_document)
+        ):
+            self.validate_cached_document(cached_document, validation_rules)
+        return cached_document
+
+    def get_document_cache_key(self, query: str) -> tuple:
+        """Return key of the query's document in the document cache."""
+        validation_rules = self.validation_rules
+        if validation_rules is not None and not callable(validation_rules):
+            validation_rules = tuple(validation_rules)
+        return (query, self.introspection, validation_rules, self.query_validator)
+
+    def is_document_required(self) -> bool:
+        """Return `True` if document must be parsed before the execution.
+
+        Document is required to measure durations of parsing and validation
+        separately, or to analyze it for result caching and its cost.
+        """
+        return (
+            self.result_cache is not None
+            or self.cost_analyzer is not None
+            or get_phase_timer() is not None
+        )
+
+    def parse_query_document(self, context_value: Any, data: dict) -> CachedDocument | None:
+        """Parse the query, recording duration of parsing.
+
+        Returns not validated document, or `None` if query could not be parsed.
+        """
+        timer = get_phase_timer()
+        started = perf_counter_ns() if timer else 0
+        try:
+            document = parse_query(context_value, self.query_parser, data)
+        except GraphQLError:
+            return None
+        finally:
+            if timer:
+                timer.record("parse", started)
+
+        return CachedDocument(document, None, len(data["query"]) * DOCUMENT_SIZE_FACTOR)
+
+    def exceeds_query_cost_limits(self, data: dict, cached_document: CachedDocument) -> bool:
+        """Return `True` if the operation exceeds limits of the cost analyzer.
+
+        Checked on parsed document, so too complex operations aren't validated.
+        """
+        if self.cost_analyzer is None:
+            return False
+        query_cost = self.cost_analyzer.get_cost(self.schema, cached_document, data)  # type: ignore
+        return query_cost is not None and self.cost_analyzer.get_error(query_cost) is not None
+
+    def validate_cached_document(
+        self, cached_document: CachedDocument, validation_rules: Any
+    ) -> None:
+        """Validate the document, storing errors in it and recording duration of
+        validation."""
+        timer = get_phase_timer()
+        started = perf_counter_ns() if timer else 0
+        cached_document.validation_errors = validate_query(
+            self.schema,  # type: ignore
+            cached_document.document,
+            validation_rules,
+            enable_introspection=self.introspection,
+            query_validator=self.query_validator,
+        )
+        if timer:
+            timer.record("validate", started)
@@ -0,0 +1,212 @@
+from asyncio import Semaphore, gather
+from base64 import b64decode
+from typing import TYPE_CHECKING, Any
+
+from ariadne.types import Extensions, GraphQLResult, Middlewares
+from graphql import MiddlewareManager
+
+from ariadne_lambda.base import GraphQLLambdaHandler
+from ariadne_lambda.cache import DocumentCache
+from ariadne_lambda.json_codec import JSONCodec
+
+if TYPE_CHECKING:
+    from aws_lambda_powertools.utilities.typing import LambdaContext
+
+
+class GraphQLEventError(Exception):
+    """Raised when operation from single EventBridge event failed, so the event is
+    retried by Lambda's asynchronous invocation, or when event comes from
+    unsupported source."""
+
+
+class EventRecord:
+    """Single record of the batch event with GraphQL operation to execute.
+
+    Passed as `request` to `context_value` callable and extensions.
+    """
+
+    __slots__ = ("identifier", "source", "record")
+
+    def __init__(self, identifier: str, source: str, record: dict) -> None:
+        self.identifier = identifier
+        self.source = source
+        self.record = record
+
+    @property
+    def group_id(self) -> str | None:
+        """Message group id of the SQS FIFO queue's message, `None` for other records."""
+        if self.source != "aws:sqs":
+            return None
+        return (self.record.get("attributes") or {}).get("MessageGroupId")
+
+    def get_body(self, json_codec: JSONCodec) -> Any:
+        """Return decoded GraphQL data from the record."""
+        if self.source == "aws:sqs":
+            return json_codec.loads(self.record["body"])
+        if self.source == "aws:kinesis":
+            return json_codec.loads(b64decode(self.record["kinesis"]["data"]))
+        if self.source == "aws:events":
+            return self.record["detail"]
+        raise ValueError(f"Unsupported event source: {self.source}")
+
+
+def get_event_records(event: dict | list) -> list[EventRecord]:
+    """Return records of SQS, Kinesis, EventBridge or EventBridge Pipes event.
+
+    Raises `GraphQLEventError` if event contains records from other sources.
+    """
+    if isinstance(event, list):
+        # EventBridge Pipes deliver batches of source's records as a list
+        items = event
+    elif "Records" in event:
+        items = event["Records"]
+    else:
+        items = [event]
+
+    records = []
+    for item in items:
+        if "detail-type" in item:
+            records.append(EventRecord(item["id"], "aws:events", item))
+        elif "kinesis" in item:
+            records.append(EventRecord(item["kinesis"]["sequenceNumber"], "aws:kinesis", item))
+        else:
+            source = item.get("eventSource") or item.get("EventSource")
+            if source not in (None, "aws:sqs") or "messageId" not in item:
+                raise GraphQLEventError(f"Unsupported event source: {source or 'unknown'}")
+            records.append(EventRecord(item["messageId"], "aws:sqs", item))
+    return records
+
+
+def group_records(records: list[EventRecord]) -> list[list[EventRecord]]:
+    """Return groups of records which must be executed in order.
+
+    Messages of SQS FIFO queues are grouped by their message group id, and every
+    other record is in a group of its own.
+    """
+    groups: list[list[EventRecord]] = []
+    message_groups: dict[str, list[EventRecord]] = {}
+    for record in records:
+        group_id = record.group_id
+        if group_id is None:
+            groups.append([record])
+        elif group_id in message_groups:
+            message_groups[group_id].append(record)
+        else:
+            message_groups[group_id] = [record]
+            groups.append(message_groups[group_id])
+    return groups
+
+
+class GraphQLEventBatchHandler(GraphQLLambdaHandler):
+    """Handler for AWS Lambda functions triggered by batches of SQS or Kinesis records,
+    or EventBridge events.
+
+    Every record contains single GraphQL operation (`query`, `variables` and
+    `operationName`), in SQS message's body, Kinesis record's data or EventBridge
+    event's detail. Operations are executed concurrently, and records which
+    operations failed are reported in `batchItemFailures` partial batch response,
+    so only they are retried.
+
+    Messages of SQS FIFO queues from the same message group are executed in order.
+    When one of them fails, following messages of its group are not executed and
+    are reported as failed too, so the group's order is kept when they're retried.
+
+    Function's event source mapping must have `ReportBatchItemFailures` enabled.
+    Failure of operation from single event sent by EventBridge rule raises
+    `GraphQLEventError`, so the event is retried.
+
+    # Optional arguments
+
+    `extensions`: a `list` of Ariadne extensions or callable returning it.
+
+    `middleware`: a `list` of middlewares or callable returning it.
+
+    `middleware_manager_class`: a `MiddlewareManager` type to combine middlewares.
+
+    `concurrency`: maximum number of operations executed concurrently, or `None`
+    for no limit.
+
+    `fail_on_errors`: a `bool` controlling if records which results contain GraphQL
+    errors are reported as failed. Records which data can't be decoded are always
+    reported as failed.
+    """
+
+    def __init__(
+        self,
+        extensions: Extensions | None = None,
+        middleware: Middlewares | None = None,
+        middleware_manager_class: type[MiddlewareManager] | None = None,
+        *,
+        concurrency: int | None = 10,
+        fail_on_errors: bool = True,
+    ) -> None:
+        super().__init__(extensions, middleware, middleware_manager_class)
+
+        self.concurrency = concurrency
+        self.fail_on_errors = fail_on_errors
+
+    def configure(self, *args, **kwargs) -> None:
+        """Configures the handler with options from the GraphQLLambda application.
+
+        Creates document cache if it's not configured, as records in a batch usually
+        repeat the same operations.
+        """
+        super().configure(*args, **kwargs)
+        if self.document_cache is None:
+            self.document_cache = DocumentCache()
+
+    async def handle(self, event: dict, context: "LambdaContext") -> dict:
+        """Executes operations from records of the event.
+
+        Returns partial batch response with identifiers of failed records.
+        """
+        records = get_event_records(event)
+        semaphore = Semaphore(self.concurrency) if self.concurrency else None
+
+        async def execute_records(group: list[EventRecord]) -> list[EventRecord]:
+            for index, record in enumerate(group):
+                if semaphore is None:
+                    success = await self.execute_record(record)
+                else:
+                    async with semaphore:
+                        success = await self.execute_record(record)
+                if not success:
+                    return group[index:]
+            return []
+
+        results = await gather(*(execute_records(group) for group in group_records(records)))
+        failed = {id(record) for group_failures in results for record in group_failures}
+        failures = [
+            {"itemIdentifier": record.identifier} for record in records if id(record) in failed
+        ]
+        if failures and isinstance(event, dict) and "detail-type" in event:
+            # EventBridge rules invoke function asynchronously with single event,
+            # which is retried only when invocation fails
+            raise GraphQLEventError(f"GraphQL operation from event {event['id']} failed")
+        return {"batchItemFailures": failures}
+
+    async def execute_record(self, record: EventRecord) -> bool:
+        """Executes operation from the record, returning `True` if it succeeded."""
+        try:
+            data = record.get_body(self.json_codec)
+        except (KeyError, TypeError, ValueError):
+            self.get_logger().exception(
+                "Could not decode GraphQL operation from record %s", record.identifier
+            )
+            return False
+
+        try:
+            result = await self.execute_graphql_query(record, data)
+        except Exception:
+            self.get_logger().exception(
+                "Could not execute GraphQL operation from record %s", record.identifier
+            )
+            return False
+
+        return self.is_successful(result)
+
+    def is_successful(self, result: GraphQLResult) -> bool:
+        success, data = result
+        if not success:
+            return False
+        return not (self.fail_on_errors and data.get("errors"))
@@ -0,0 +1,74 @@
+from binascii import Error as BinasciiError
+from binascii import a2b_base64
+
+from ariadne.exceptions import HttpBadRequestError
+
+from ariadne_lambda.exceptions import HttpPayloadTooLargeError
+
+# Number of base64 characters decoded at once, must be a multiple of 4
+BASE64_CHUNK_SIZE = 64 * 1024
+
+# Maximum number of bytes of UTF-8 encoded character
+UTF8_MAX_CHAR_SIZE = 4
+
+
+def decode_body(
+    body: str, is_base64_encoded: bool, max_size: int | None = None
+) -> str | bytearray:
+    """Return request body ready for the JSON parser, enforcing `max_size`.
+
+    Base64 encoded body is decoded once into bytes, other bodies are returned as
+    they are, without copying.
+
+    Raises `HttpPayloadTooLargeError` if body is larger than `max_size` bytes and
+    `HttpBadRequestError` if body is not valid base64.
+    """
+    if is_base64_encoded:
+        return decode_base64_body(body, max_size)
+    check_body_size(body, max_size)
+    return body
+
+
+def check_body_size(body: str, max_size: int | None) -> None:
+    """Raise `HttpPayloadTooLargeError` if UTF-8 encoded body is larger than
+    `max_size` bytes.
+
+    Body is encoded to measure its size only when it contains non-ASCII characters
+    and its length doesn't determine the result.
+    """
+    if max_size is None or len(body) <= max_size // UTF8_MAX_CHAR_SIZE:
+        return
+    if len(body) > max_size or (not body.isascii() and len(body.encode("utf-8")) > max_size):
+        raise HttpPayloadTooLargeError("Request body is too large")
+
+
+def decode_base64_body(body: str, max_size: int | None = None) -> bytearray:
+    """Decode base64 encoded body in chunks into single preallocated buffer.
+
+    Avoids intermediate copy of the whole body that `base64.b64decode` makes when
+    encoding `str` to `bytes`.
+
+    Raises `HttpPayloadTooLargeError` if decoded body would be larger than
+    `max_size` and `HttpBadRequestError` if body is not valid base64.
+    """
+    estimated_size = len(body) // 4 * 3
+    if max_size is not None and estimated_size > max_size + 2:
+        raise HttpPayloadTooLargeError("Request body is too large")
+
+    buffer = bytearray(estimated_size)
+    view = memoryview(buffer)
+    position = 0
+    try:
+        for offset in range(0, len(body), BASE64_CHUNK_SIZE):
+            chunk = a2b_base64(body[offset : offset + BASE64_CHUNK_SIZE])
+            view[position : position + len(chunk)] = chunk
+            position += len(chunk)
+    except (BinasciiError, ValueError) as ex:
+        raise HttpBadRequestError("Request body is not a valid base64") from ex
+    finally:
+        view.release()
+
+    del buffer[position:]
+    if max_size is not None and position > max_size:
+        raise HttpPayloadTooLargeError("Request body is too large")
+    return buffer
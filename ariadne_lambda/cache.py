@@ -0,0 +1,116 @@
+from collections import OrderedDict
+from collections.abc import Hashable
+from typing import Any
+
+from graphql import DocumentNode, GraphQLError
+
+# Rough ratio between the size of query text and the memory used by its parsed AST,
+# used to estimate memory footprint of cached documents without walking the tree.
+DOCUMENT_SIZE_FACTOR = 40
+
+
+class CachedDocument:
+    """Parsed GraphQL document together with the result of its validation.
+
+    `validation_errors` is `None` when document was not validated at the time it was
+    cached (e.g. when validation rules depend on the request).
+
+    `metadata` is a `dict` for results of static analysis of the document, computed
+    once and reused by all requests executing it.
+    """
+
+    __slots__ = ("document", "validation_errors", "size", "metadata")
+
+    def __init__(
+        self,
+        document: DocumentNode,
+        validation_errors: list[GraphQLError] | None = None,
+        size: int = 0,
+    ) -> None:
+        self.document = document
+        self.validation_errors = validation_errors
+        self.size = size
+        self.metadata: dict[str, Any] = {}
+
+    def validate(self, *args, **kwargs) -> list[GraphQLError]:
+        """Query validator returning errors found when the document was cached.
+
+        Passed to `ariadne.graphql.graphql` as `query_validator` so cached documents
+        are not validated again.
+        """
+        return self.validation_errors or []
+
+
+class DocumentCache:
+    """Bounded LRU cache of parsed and validated GraphQL documents.
+
+    Lives on the handler, so its entries survive across warm Lambda invocations.
+
+    # Optional arguments
+
+    `max_size`: maximum number of documents kept in the cache.
+
+    `max_memory`: approximate memory budget in bytes for cached documents, or `None`
+    to only limit the cache by number of entries. Entry size is estimated from
+    the length of the query text.
+    """
+
+    def __init__(self, max_size: int = 128, max_memory: int | None = 16 * 1024 * 1024) -> None:
+        self.max_size = max_size
+        self.max_memory = max_memory
+
+        self.hits = 0
+        self.misses = 0
+        self.memory = 0
+
+        self._entries: OrderedDict[Hashable, CachedDocument] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._entries
+
+    def get(self, key: Hashable) -> CachedDocument | None:
+        """Return cached document for the key, or `None` if its not cached."""
+        cached = self._entries.get(key)
+        if cached is None:
+            self.misses += 1
+            return None
+
+        self.hits += 1
+        self._entries.move_to_end(key)
+        return cached
+
+    def set(self, key: Hashable, cached: CachedDocument) -> None:
+        """Store document in the cache, evicting least recently used entries."""
+        if self.max_memory is not None and cached.size > self.max_memory:
+            return
+
+        if key in self._entries:
+            self.memory -= self._entries.pop(key).size
+
+        self._entries[key] = cached
+        self.memory += cached.size
+
+        while len(self._entries) > self.max_size or (
+            self.max_memory is not None and self.memory > self.max_memory
+        ):
+            _, evicted = self._entries.popitem(last=False)
+            self.memory -= evicted.size
+
+    def clear(self) -> None:
+        """Remove all documents from the cache and reset its counters."""
+        self._entries.clear()
+        self.hits = 0
+        self.misses = 0
+        self.memory = 0
+
+    def stats(self) -> dict:
+        """Return a `dict` with cache counters."""
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "size": len(self._entries),
+            "memory": self.memory,
+        }
@@ -0,0 +1,286 @@
+import gzip
+import zlib
+from abc import ABC, abstractmethod
+from base64 import b64encode
+from collections.abc import Callable
+from functools import partial
+from time import perf_counter
+
+from ariadne_lambda.schema import Response
+
+# Weight of the latest measurement in moving average of compression speed
+THROUGHPUT_SMOOTHING = 0.2
+
+
+class CompressorStream:
+    """Compresses body streamed in chunks.
+
+    Compressed data is flushed after every chunk, so clients can decompress it
+    without waiting for the rest of the body.
+    """
+
+    __slots__ = ("encoding", "_process", "_flush", "_finish")
+
+    def __init__(
+        self,
+        encoding: str,
+        process: Callable[[bytes], bytes],
+        flush: Callable[[], bytes],
+        finish: Callable[[], bytes],
+    ) -> None:
+        self.encoding = encoding
+        self._process = process
+        self._flush = flush
+        self._finish = finish
+
+    def compress(self, data: bytes) -> bytes:
+        """Return compressed chunk of the body."""
+        return self._process(data) + self._flush()
+
+    def finish(self) -> bytes:
+        """Return end of the compressed body."""
+        return self._finish()
+
+
+class Compressor(ABC):
+    """Base class for response body compressors."""
+
+    encoding: str
+    default_level: int
+
+    def __init__(self, level: int | None = None) -> None:
+        self.level = self.default_level if level is None else level
+
+    @abstractmethod
+    def compress(self, data: bytes) -> bytes:
+        """Return compressed data."""
+
+    def create_stream(self) -> CompressorStream | None:
+        """Return `CompressorStream` compressing body in chunks, or `None` if
+        compressor doesn't support streamed bodies."""
+        return None
+
+
+class GzipCompressor(Compressor):
+    encoding = "gzip"
+    default_level = 6
+
+    def compress(self, data: bytes) -> bytes:
+        return gzip.compress(data, compresslevel=self.level, mtime=0)
+
+    def create_stream(self) -> CompressorStream:
+        # 31 window bits write gzip header and trailer
+        compressobj = zlib.compressobj(self.level, zlib.DEFLATED, 31)
+        return CompressorStream(
+            self.encoding,
+            compressobj.compress,
+            partial(compressobj.flush, zlib.Z_SYNC_FLUSH),
+            compressobj.flush,
+        )
+
+
+class BrotliCompressor(Compressor):
+    """Brotli compressor. Requires the `brotli` library."""
+
+    encoding = "br"
+    default_level = 4
+
+    def __init__(self, level: int | None = None) -> None:
+        import brotli
+
+        super().__init__(level)
+        self._compress = brotli.compress
+        self._compressor_class = brotli.Compressor
+
+    def compress(self, data: bytes) -> bytes:
+        return self._compress(data, quality=self.level)
+
+    def create_stream(self) -> CompressorStream:
+        compressor = self._compressor_class(quality=self.level)
+        return CompressorStream(
+            self.encoding, compressor.process, compressor.flush, compressor.finish
+        )
+
+
+class ZstdCompressor(Compressor):
+    """Zstandard compressor. Requires the `zstandard` library."""
+
+    encoding = "zstd"
+    default_level = 3
+
+    def __init__(self, level: int | None = None) -> None:
+        import zstandard
+
+        super().__init__(level)
+        self._compressor = zstandard.ZstdCompressor(level=self.level)
+        self._flush_block = zstandard.COMPRESSOBJ_FLUSH_BLOCK
+
+    def compress(self, data: bytes) -> bytes:
+        return self._compressor.compress(data)
+
+    def create_stream(self) -> CompressorStream:
+        compressobj = self._compressor.compressobj()
+        return CompressorStream(
+            self.encoding,
+            compressobj.compress,
+            partial(compressobj.flush, self._flush_block),
+            compressobj.flush,
+        )
+
+
+COMPRESSORS: dict[str, type[Compressor]] = {
+    compressor.encoding: compressor
+    for compressor in (BrotliCompressor, ZstdCompressor, GzipCompressor)
+}
+
+
+def parse_accept_encoding(accept_encoding: str) -> dict[str, float]:
+    """Return a `dict` of encodings accepted by client with their quality values."""
+    encodings: dict[str, float] = {}
+    for item in accept_encoding.split(","):
+        encoding, _, params = item.partition(";")
+        encoding = encoding.strip().lower()
+        if not encoding:
+            continue
+        quality = 1.0
+        params = params.strip()
+        if params.startswith("q="):
+            try:
+                quality = float(params[2:])
+            except ValueError:
+                quality = 0.0
+        encodings[encoding] = quality
+    return encodings
+
+
+class ResponseCompression:
+    """Compresses response bodies with encoding negotiated from `Accept-Encoding`.
+
+    Compressed bodies are base64 encoded, as required by API Gateway and Lambda
+    Function URLs for binary responses.
+
+    # Optional arguments
+
+    `min_size`: minimum size of response body in bytes to compress it.
+
+    `encodings`: encodings to use in order of preference. Encodings which libraries
+    are not installed are skipped.
+
+    `levels`: a `dict` with compression level for encodings, eg. `{"gzip": 5}`.
+
+    `cpu_budget`: maximum time in milliseconds to spend on compressing single
+    response. Compression time is estimated from speed of previous compressions,
+    and responses estimated to take longer are sent uncompressed.
+    """
+
+    def __init__(
+        self,
+        *,
+        min_size: int = 1024,
+        encodings: tuple[str, ...] = ("br", "zstd", "gzip"),
+        levels: dict[str, int] | None = None,
+        cpu_budget: float | None = None,
+    ) -> None:
+        self.min_size = min_size
+        self.cpu_budget = cpu_budget
+
+        levels = levels or {}
+        self.compressors: dict[str, Compressor] = {}
+        for encoding in encodings:
+            try:
+                self.compressors[encoding] = COMPRESSORS[encoding](levels.get(encoding))
+            except ImportError:
+                continue
+
+        # moving average of compression speed per encoding in milliseconds per byte
+        self.speed: dict[str, float] = {}
+
+    def negotiate(self, accept_encoding: str) -> Compressor | None:
+        """Return compressor for the best encoding accepted by client."""
+        accepted = parse_accept_encoding(accept_encoding)
+        wildcard = accepted.get("*", 0.0)
+
+        best_compressor = None
+        best_quality = 0.0
+        for encoding, compressor in self.compressors.items():
+            quality = accepted.get(encoding, wildcard)
+            if quality > best_quality:
+                best_compressor = compressor
+                best_quality = quality
+        return best_compressor
+
+    def is_within_budget(self, compressor: Compressor, size: int) -> bool:
+        if self.cpu_budget is None or compressor.encoding not in self.speed:
+            return True
+        return self.speed[compressor.encoding] * size <= self.cpu_budget
+
+    def compress(self, compressor: Compressor, data: bytes) -> bytes:
+        """Compress data, updating compression speed statistics."""
+        start = perf_counter()
+        compressed = compressor.compress(data)
+        speed = (perf_counter() - start) * 1000 / len(data)
+
+        if compressor.encoding in self.speed:
+            previous_speed = self.speed[compressor.encoding]
+            speed = previous_speed + THROUGHPUT_SMOOTHING * (speed - previous_speed)
+        self.speed[compressor.encoding] = speed
+
+        return compressed
+
+    def create_stream(self, request_headers: dict) -> CompressorStream | None:
+        """Return `CompressorStream` for the streamed response body, or `None` if
+        client doesn't accept compression.
+
+        Size of streamed body is not known, so `min_size` and `cpu_budget` are not
+        applied.
+
+        # Required arguments
+
+        `request_headers`: a `dict` with request headers with lowercase names.
+        """
+        accept_encoding = request_headers.get("accept-encoding")
+        if not accept_encoding:
+            return None
+        compressor = self.negotiate(accept_encoding)
+        return compressor.create_stream() if compressor else None
+
+    def compress_response(self, request_headers: dict, response: Response) -> Response:
+        """Return response with compressed body if client accepts compression and
+        response is large enough.
+
+        # Required arguments
+
+        `request_headers`: a `dict` with request headers with lowercase names.
+
+        `response`: a `Response` to compress.
+        """
+        if response.is_base64_encoded or "Content-Encoding" in response.headers:
+            return response
+
+        # response depends on accept-encoding, even when sent uncompressed
+        response.headers.setdefault("Vary", "Accept-Encoding")
+
+        accept_encoding = request_headers.get("accept-encoding")
+        if not accept_encoding:
+            return response
+
+        body = response.body
+        if isinstance(body, str):
+            if len(body) < self.min_size:
+                return response
+            body = body.encode("utf-8")
+        if len(body) < self.min_size:
+            return response
+
+        compressor = self.negotiate(accept_encoding)
+        if not compressor or not self.is_within_budget(compressor, len(body)):
+            return response
+
+        compressed_body = self.compress(compressor, body)
+        if len(compressed_body) >= len(body):
+            return response
+
+        response.body = b64encode(compressed_body).decode("ascii")
+        response.is_base64_encoded = True
+        response.headers["Content-Encoding"] = compressor.encoding
+        return response
@@ -0,0 +1,362 @@
+from collections.abc import Collection, Mapping
+from typing import Any
+
+from graphql import (
+    DocumentNode,
+    FieldNode,
+    FragmentDefinitionNode,
+    FragmentSpreadNode,
+    GraphQLError,
+    GraphQLList,
+    GraphQLNamedType,
+    GraphQLSchema,
+    InlineFragmentNode,
+    IntValueNode,
+    OperationDefinitionNode,
+    SelectionSetNode,
+    VariableNode,
+    get_named_type,
+    get_nullable_type,
+    get_operation_ast,
+)
+
+from ariadne_lambda.cache import CachedDocument
+
+# Field's cost, list size multiplier (number or name of the variable) and its children
+CostNode = tuple[int, int | str, list["CostNode"]]
+
+
+class QueryCost:
+    """Cost, depth and number of aliases of the operation."""
+
+    __slots__ = ("cost", "depth", "aliases")
+
+    def __init__(self, cost: int, depth: int, aliases: int) -> None:
+        self.cost = cost
+        self.depth = depth
+        self.aliases = aliases
+
+
+class CostPlan:
+    """Result of static cost analysis of the operation.
+
+    Cost of lists which sizes are set by variables is computed for every request
+    from the cost tree, otherwise it's computed once.
+    """
+
+    __slots__ = ("nodes", "depth", "aliases", "variable_defaults", "static_cost")
+
+    def __init__(
+        self,
+        nodes: list[CostNode],
+        depth: int,
+        aliases: int,
+        variable_defaults: dict[str, Any],
+        default_list_size: int,
+    ) -> None:
+        self.nodes = nodes
+        self.depth = depth
+        self.aliases = aliases
+        self.variable_defaults = variable_defaults
+        self.static_cost: int | None = None
+        if not is_variable_nodes(nodes, {}):
+            self.static_cost = get_nodes_cost(nodes, {}, default_list_size)
+
+    def get_cost(self, variables: Mapping[str, Any] | None, default_list_size: int) -> int:
+        if self.static_cost is not None:
+            return self.static_cost
+        return get_nodes_cost(
+            self.nodes, {**self.variable_defaults, **(variables or {})}, default_list_size
+        )
+
+
+def is_variable_nodes(nodes: list[CostNode], memo: dict[int, bool]) -> bool:
+    """Return `True` if cost of the nodes depends on variables.
+
+    Nodes of the fragment are shared by all its spreads, so results are memoized
+    by id of the nodes list, instead of expanding the spreads again.
+    """
+    if id(nodes) not in memo:
+        memo[id(nodes)] = any(
+            isinstance(multiplier, str) or is_variable_nodes(children, memo)
+            for _, multiplier, children in nodes
+        )
+    return memo[id(nodes)]
+
+
+def get_nodes_cost(
+    nodes: list[CostNode],
+    variables: Mapping[str, Any],
+    default_list_size: int,
+    memo: dict[int, int] | None = None,
+) -> int:
+    """Return cost of the nodes, memoized like in `is_variable_nodes`."""
+    if memo is None:
+        memo = {}
+    if id(nodes) in memo:
+        return memo[id(nodes)]
+
+    cost = 0
+    for field_cost, multiplier, children in nodes:
+        if isinstance(multiplier, str):
+            multiplier = variables.get(multiplier)
+            if not isinstance(multiplier, int) or isinstance(multiplier, bool):
+                multiplier = default_list_size
+        cost += field_cost + max(multiplier, 0) * get_nodes_cost(
+            children, variables, default_list_size, memo
+        )
+    memo[id(nodes)] = cost
+    return cost
+
+
+class QueryCostAnalyzer:
+    """Rejects operations exceeding the cost, depth or aliases limits before their
+    execution.
+
+    Cost of the operation is a sum of costs of its fields. Cost of fields returning
+    lists is multiplied by list's size, taken from the field's `first`, `last` or
+    `limit` argument. Limits are checked before the document is validated. Static
+    analysis of the document is cached in the document's metadata, so with the
+    `DocumentCache` only costs of lists which sizes are set by variables are
+    computed for every request. Without it, analysis runs for every request.
+
+    Introspection fields are not counted.
+
+    # Optional arguments
+
+    `max_cost`: maximum cost of the operation, or `None` for no limit.
+
+    `max_depth`: maximum depth of fields selections, or `None` for no limit.
+
+    `max_aliases`: maximum number of aliased fields, or `None` for no limit.
+
+    `default_field_cost`: cost of fields not present in `field_costs`.
+
+    `field_costs`: a `dict` with costs of fields, with `"Type.field"` strings
+    as keys.
+
+    `list_size_arguments`: names of arguments setting the size of returned list.
+
+    `default_list_size`: size of lists without size arguments.
+    """
+
+    def __init__(
+        self,
+        *,
+        max_cost: int | None = None,
+        max_depth: int | None = None,
+        max_aliases: int | None = None,
+        default_field_cost: int = 1,
+        field_costs: Mapping[str, int] | None = None,
+        list_size_arguments: Collection[str] = ("first", "last", "limit"),
+        default_list_size: int = 10,
+    ) -> None:
+        self.max_cost = max_cost
+        self.max_depth = max_depth
+        self.max_aliases = max_aliases
+        self.default_field_cost = default_field_cost
+        self.field_costs = field_costs or {}
+        self.list_size_arguments = tuple(list_size_arguments)
+        self.default_list_size = default_list_size
+
+    def get_cost(
+        self, schema: GraphQLSchema, cached_document: CachedDocument, data: dict
+    ) -> QueryCost | None:
+        """Return cost of the operation from the document, or `None` if document
+        has no operation to execute."""
+        operation_name = data.get("operationName")
+        cost_plans = cached_document.metadata.setdefault("cost_plans", {})
+        if operation_name not in cost_plans:
+            cost_plans[operation_name] = self.create_cost_plan(
+                schema, cached_document.document, operation_name
+            )
+
+        cost_plan = cost_plans[operation_name]
+        if cost_plan is None:
+            return None
+
+        variables = data.get("variables")
+        if not isinstance(variables, dict):
+            variables = None
+        cost = cost_plan.get_cost(variables, self.default_list_size)
+        return QueryCost(cost, cost_plan.depth, cost_plan.aliases)
+
+    def get_error(self, cost: QueryCost) -> GraphQLError | None:
+        """Return error if the cost exceeds the limits."""
+        if self.max_depth is not None and cost.depth > self.max_depth:
+            message = f"Query depth {cost.depth} exceeds the maximum depth of {self.max_depth}."
+        elif self.max_aliases is not None and cost.aliases > self.max_aliases:
+            message = (
+                f"Query has {cost.aliases} aliases, exceeding the maximum of {self.max_aliases}."
+            )
+        elif self.max_cost is not None and cost.cost > self.max_cost:
+            message = f"Query cost {cost.cost} exceeds the maximum cost of {self.max_cost}."
+        else:
+            return None
+        return GraphQLError(message, extensions={"code": "QUERY_TOO_COMPLEX"})
+
+    def get_extension(self, cost: QueryCost) -> dict:
+        """Return cost reported in the result's `extensions`."""
+        return {
+            "requestedQueryCost": cost.cost,
+            "maximumAvailable": self.max_cost,
+            "depth": cost.depth,
+            "aliases": cost.aliases,
+        }
+
+    def create_cost_plan(
+        self, schema: GraphQLSchema, document: DocumentNode, operation_name: str | None
+    ) -> CostPlan | None:
+        operation = get_operation_ast(document, operation_name)
+        if operation is None:
+            return None
+        root_type = schema.get_root_type(operation.operation)
+        if root_type is None:
+            return None
+
+        fragments = {
+            definition.name.value: definition
+            for definition in document.definitions
+            if isinstance(definition, FragmentDefinitionNode)
+        }
+        visitor = CostPlanBuilder(self, schema, fragments)
+        nodes = visitor.visit_selection_set(operation.selection_set, root_type, 1, frozenset())
+        return CostPlan(
+            nodes,
+            visitor.depth,
+            visitor.aliases,
+            get_variable_defaults(operation),
+            self.default_list_size,
+        )
+
+
+class CostPlanBuilder:
+    """Builds cost tree of the operation, counting its depth and aliases.
+
+    Every fragment is analyzed once and its nodes, relative depth and aliases are
+    reused by its spreads, so nested fragments spreads aren't expanded.
+    """
+
+    def __init__(
+        self,
+        analyzer: QueryCostAnalyzer,
+        schema: GraphQLSchema,
+        fragments: dict[str, FragmentDefinitionNode],
+    ) -> None:
+        self.analyzer = analyzer
+        self.schema = schema
+        self.fragments = fragments
+        self.depth = 0
+        self.aliases = 0
+        self.fragments_plans: dict[str, tuple[list[CostNode], int, int]] = {}
+
+    def visit_selection_set(
+        self,
+        selection_set: SelectionSetNode | None,
+        parent_type: GraphQLNamedType | None,
+        depth: int,
+        visited_fragments: frozenset[str],
+    ) -> list[CostNode]:
+        nodes: list[CostNode] = []
+        if selection_set is None:
+            return nodes
+
+        for selection in selection_set.selections:
+            if isinstance(selection, FieldNode):
+                node = self.visit_field(selection, parent_type, depth, visited_fragments)
+                if node is not None:
+                    nodes.append(node)
+            elif isinstance(selection, InlineFragmentNode):
+                fragment_type = parent_type
+                if selection.type_condition:
+                    fragment_type = self.schema.get_type(selection.type_condition.name.value)
+                nodes += self.visit_selection_set(
+                    selection.selection_set, fragment_type, depth, visited_fragments
+                )
+            elif isinstance(selection, FragmentSpreadNode):
+                name = selection.name.value
+                fragment = self.fragments.get(name)
+                if fragment is None or name in visited_fragments:
+                    continue
+                # spread is a zero cost node, so fragment's nodes aren't copied
+                nodes.append((0, 1, self.visit_fragment(fragment, depth, visited_fragments)))
+        return nodes
+
+    def visit_fragment(
+        self,
+        fragment: FragmentDefinitionNode,
+        depth: int,
+        visited_fragments: frozenset[str],
+    ) -> list[CostNode]:
+        name = fragment.name.value
+        if name not in self.fragments_plans:
+            depth_before, aliases_before = self.depth, self.aliases
+            self.depth = self.aliases = 0
+            nodes = self.visit_selection_set(
+                fragment.selection_set,
+                self.schema.get_type(fragment.type_condition.name.value),
+                1,
+                visited_fragments | {name},
+            )
+            self.fragments_plans[name] = (nodes, self.depth, self.aliases)
+            self.depth, self.aliases = depth_before, aliases_before
+
+        nodes, fragment_depth, fragment_aliases = self.fragments_plans[name]
+        if fragment_depth:
+            self.depth = max(self.depth, depth - 1 + fragment_depth)
+        self.aliases += fragment_aliases
+        return nodes
+
+    def visit_field(
+        self,
+        node: FieldNode,
+        parent_type: GraphQLNamedType | None,
+        depth: int,
+        visited_fragments: frozenset[str],
+    ) -> CostNode | None:
+        field_name = node.name.value
+        if field_name.startswith("__"):
+            return None
+
+        self.depth = max(self.depth, depth)
+        if node.alias:
+            self.aliases += 1
+
+        fields = getattr(parent_type, "fields", None) or {}
+        field_def = fields.get(field_name)
+        field_type = field_def.type if field_def else None
+
+        cost = self.analyzer.field_costs.get(
+            f"{getattr(parent_type, 'name', None)}.{field_name}",
+            self.analyzer.default_field_cost,
+        )
+        multiplier: int | str = 1
+        if isinstance(get_nullable_type(field_type), GraphQLList):  # type: ignore
+            multiplier = self.get_list_size(node)
+
+        children = self.visit_selection_set(
+            node.selection_set,
+            get_named_type(field_type) if field_type else None,
+            depth + 1,
+            visited_fragments,
+        )
+        return (cost, multiplier, children)
+
+    def get_list_size(self, node: FieldNode) -> int | str:
+        for argument in node.arguments or ():
+            if argument.name.value not in self.analyzer.list_size_arguments:
+                continue
+            if isinstance(argument.value, IntValueNode):
+                return int(argument.value.value)
+            if isinstance(argument.value, VariableNode):
+                return argument.value.name.value
+        return self.analyzer.default_list_size
+
+
+def get_variable_defaults(operation: OperationDefinitionNode) -> dict[str, Any]:
+    """Return integer default values of operation's variables."""
+    return {
+        definition.variable.name.value: int(definition.default_value.value)
+        for definition in operation.variable_definitions or ()
+        if isinstance(definition.default_value, IntValueNode)
+    }
@@ -0,0 +1,269 @@
+from asyncio import CancelledError, Future, get_running_loop, shield
+from collections.abc import Awaitable, Callable, Hashable, Iterable, Mapping, Sequence
+from contextvars import ContextVar
+from typing import Any
+
+from ariadne.types import ContextValue, Extension, Resolver
+from graphql import GraphQLResolveInfo
+from graphql.pyutils import is_awaitable
+
+BatchLoadFn = Callable[[list[Any]], Awaitable[Sequence[Any]]]
+DataLoaderFactory = BatchLoadFn | type["DataLoader"]
+
+# Name of the field which resolver is currently executed, set by diagnostics extension
+current_field_var: ContextVar[str | None] = ContextVar("current_field", default=None)
+
+
+class DataLoader:
+    """Batches loads of keys requested in the same event loop tick into single call
+    of batch load function, caching loaded values for the rest of the invocation.
+
+    Subclasses can implement `batch_load` instead of passing `batch_load_fn`.
+
+    # Optional arguments
+
+    `batch_load_fn`: an async function taking a `list` of keys and returning a
+    sequence of values (or `Exception` instances) in the same order.
+
+    `max_batch_size`: maximum number of keys passed to single `batch_load` call.
+
+    `cache`: a `bool` controlling if loaded values are cached.
+
+    `name`: name of the loader used in diagnostics.
+    """
+
+    def __init__(
+        self,
+        batch_load_fn: BatchLoadFn | None = None,
+        *,
+        max_batch_size: int | None = None,
+        cache: bool = True,
+        name: str | None = None,
+    ) -> None:
+        if batch_load_fn is not None:
+            self.batch_load_fn = batch_load_fn
+        self.max_batch_size = max_batch_size
+        self.cache = cache
+        self.name = name or type(self).__name__
+        self.diagnostics: DataLoaderDiagnostics | None = None
+
+        self._cache: dict[Hashable, Future] = {}
+        self._queue: list[tuple[Hashable, Future]] = []
+
+    async def batch_load(self, keys: list[Any]) -> Sequence[Any]:
+        """Return values for the keys in the same order as keys."""
+        return await self.batch_load_fn(keys)
+
+    def load(self, key: Hashable) -> Awaitable[Any]:
+        """Return awaitable resolving to value for the key."""
+        if self.cache and key in self._cache:
+            return shield(self._cache[key])
+
+        loop = get_running_loop()
+        future = loop.create_future()
+        if self.cache:
+            self._cache[key] = future
+        if not self._queue:
+            loop.call_soon(self.dispatch)
+        self._queue.append((key, future))
+
+        if self.diagnostics is not None:
+            self.diagnostics.record_load(self.name, current_field_var.get())
+
+        return shield(future) if self.cache else future
+
+    async def load_many(self, keys: Iterable[Hashable]) -> list[Any]:
+        """Return values for all keys."""
+        return [await value for value in [self.load(key) for key in keys]]
+
+    def prime(self, key: Hashable, value: Any) -> None:
+        """Store value for the key in the cache, unless it's already there."""
+        if self.cache and key not in self._cache:
+            future = get_running_loop().create_future()
+            future.set_result(value)
+            self._cache[key] = future
+
+    def clear(self, key: Hashable) -> None:
+        """Remove value for the key from the cache."""
+        self._cache.pop(key, None)
+
+    def dispatch(self) -> None:
+        """Start batch loads of all keys queued in the current tick."""
+        queue, self._queue = self._queue, []
+        batch_size = self.max_batch_size or len(queue)
+        for start in range(0, len(queue), batch_size):
+            batch = queue[start : start + batch_size]
+            if self.diagnostics is not None:
+                self.diagnostics.record_batch(self.name, len(batch))
+            get_running_loop().create_task(self.load_batch(batch))
+
+    async def load_batch(self, batch: list[tuple[Hashable, Future]]) -> None:
+        """Load values of the batch, setting them as results of keys' futures.
+
+        When batch load is cancelled, futures are cancelled too, so loads awaiting
+        them don't wait forever.
+        """
+        keys = [key for key, _ in batch]
+        try:
+            values = await self.batch_load(keys)
+            if len(values) != len(keys):
+                raise ValueError(
+                    f"{self.name} batch load must return a sequence of the same length "
+                    f"as keys ({len(keys)}), got {len(values)}"
+                )
+        except Exception as error:
+            for key, future in batch:
+                self.clear(key)
+                if not future.done():
+                    future.set_exception(error)
+            return
+        except CancelledError:
+            for key, future in batch:
+                self.clear(key)
+                future.cancel()
+            raise
+        self.set_batch_values(batch, values)
+
+    def set_batch_values(self, batch: list[tuple[Hashable, Future]], values: Sequence) -> None:
+        """Set loaded values as results of keys' futures. Keys which values are
+        exceptions are removed from the cache."""
+        for (key, future), value in zip(batch, values, strict=True):
+            if isinstance(value, Exception):
+                self.clear(key)
+                if not future.done():
+                    future.set_exception(value)
+            elif not future.done():
+                future.set_result(value)
+
+
+class DataLoaderDiagnostics:
+    """Counts batch sizes of loaders and loads triggered by fields in single
+    invocation."""
+
+    def __init__(self) -> None:
+        self.batch_sizes: dict[str, list[int]] = {}
+        self.field_loads: dict[str, dict[str, int]] = {}
+        self._pending_fields: dict[str, list[str | None]] = {}
+
+    def record_load(self, loader: str, field: str | None) -> None:
+        self._pending_fields.setdefault(loader, []).append(field)
+
+    def record_batch(self, loader: str, size: int) -> None:
+        self.batch_sizes.setdefault(loader, []).append(size)
+        pending_fields = self._pending_fields.get(loader, [])
+        fields, self._pending_fields[loader] = pending_fields[:size], pending_fields[size:]
+        for field in fields:
+            if field is None:
+                continue
+            field_loads = self.field_loads.setdefault(field, {"loads": 0, "unbatched": 0})
+            field_loads["loads"] += 1
+            if size == 1:
+                field_loads["unbatched"] += 1
+
+    def get_unbatched_fields(self) -> list[str]:
+        """Return fields that triggered more than one load dispatched alone, which
+        indicates keys are loaded one by one (e.g. awaited in a loop)."""
+        return [field for field, loads in self.field_loads.items() if loads["unbatched"] > 1]
+
+    def get_report(self) -> dict:
+        return {
+            "batches": {
+                loader: {
+                    "count": len(sizes),
+                    "keys": sum(sizes),
+                    "max_size": max(sizes),
+                }
+                for loader, sizes in self.batch_sizes.items()
+            },
+            "unbatched_fields": self.get_unbatched_fields(),
+        }
+
+
+class DataLoaderRegistry:
+    """Per-invocation registry of data loaders, created lazily on first access.
+
+    Loaders are accessed by name as attributes or items, e.g. `loaders.users` or
+    `loaders["users"]`.
+
+    # Required arguments
+
+    `factories`: a `dict` with loaders names as keys and batch load functions or
+    `DataLoader` subclasses as values.
+    """
+
+    def __init__(self, factories: Mapping[str, DataLoaderFactory]) -> None:
+        self._factories = factories
+        self._loaders: dict[str, DataLoader] = {}
+        self.diagnostics: DataLoaderDiagnostics | None = None
+
+    def __getitem__(self, name: str) -> DataLoader:
+        loader = self._loaders.get(name)
+        if loader is None:
+            factory = self._factories[name]
+            if isinstance(factory, type) and issubclass(factory, DataLoader):
+                loader = factory(name=name)
+            else:
+                loader = DataLoader(factory, name=name)
+            loader.diagnostics = self.diagnostics
+            self._loaders[name] = loader
+        return loader
+
+    def __getattr__(self, name: str) -> DataLoader:
+        if name.startswith("_"):
+            raise AttributeError(name)
+        try:
+            return self[name]
+        except KeyError as ex:
+            raise AttributeError(f"DataLoader '{name}' is not registered") from ex
+
+    def __contains__(self, name: str) -> bool:
+        return name in self._factories
+
+
+class DataLoaderDiagnosticsExtension(Extension):
+    """Extension reporting batch sizes of data loaders and fields that load keys
+    one by one in the `dataloaders` key of result's `extensions`.
+
+    Requires data loaders registry in the `loaders` key of the context.
+    """
+
+    def request_started(self, context: ContextValue) -> None:
+        registry = get_registry(context)
+        if registry is not None and registry.diagnostics is None:
+            registry.diagnostics = DataLoaderDiagnostics()
+
+    def resolve(self, next_: Resolver, obj: Any, info: GraphQLResolveInfo, **kwargs) -> Any:
+        field = f"{info.parent_type.name}.{info.field_name}"
+
+        token = current_field_var.set(field)
+        try:
+            result = next_(obj, info, **kwargs)
+        finally:
+            current_field_var.reset(token)
+
+        if not is_awaitable(result):
+            return result
+
+        # async resolver's code runs when result is awaited by the executor
+        async def await_result():
+            token = current_field_var.set(field)
+            try:
+                return await result
+            finally:
+                current_field_var.reset(token)
+
+        return await_result()
+
+    def format(self, context: ContextValue) -> dict | None:
+        registry = get_registry(context)
+        if registry is None or registry.diagnostics is None:
+            return None
+        return {"dataloaders": registry.diagnostics.get_report()}
+
+
+def get_registry(context: ContextValue) -> DataLoaderRegistry | None:
+    if isinstance(context, dict):
+        registry = context.get("loaders")
+        if isinstance(registry, DataLoaderRegistry):
+            return registry
+    return None
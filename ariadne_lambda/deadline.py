@@ -0,0 +1,159 @@
+import asyncio
+from contextvars import ContextVar, Token
+from time import monotonic
+from typing import Any
+
+from ariadne.types import Extension, Resolver
+from graphql import GraphQLError, GraphQLResolveInfo
+from graphql.pyutils import is_awaitable
+
+deadline_var: ContextVar["Deadline | None"] = ContextVar("deadline", default=None)
+
+
+class DeadlineExceededError(GraphQLError):
+    """Reported for fields which resolvers didn't complete before the deadline."""
+
+    def __init__(self) -> None:
+        super().__init__(
+            "Field could not be resolved before the deadline.",
+            extensions={"code": "DEADLINE_EXCEEDED"},
+        )
+
+
+class Deadline:
+    """Time by which the invocation's operations must be executed, measured with
+    monotonic clock."""
+
+    __slots__ = ("expires_at",)
+
+    def __init__(self, expires_at: float) -> None:
+        self.expires_at = expires_at
+
+    def remaining(self) -> float:
+        """Return time in seconds remaining until the deadline, `0` if it passed."""
+        return max(self.expires_at - monotonic(), 0.0)
+
+    def expired(self) -> bool:
+        return monotonic() >= self.expires_at
+
+    def timeout(self, timeout: float | None = None) -> float:
+        """Return timeout in seconds for I/O operations of the resolvers, the lower
+        of the `timeout` and time remaining until the deadline."""
+        remaining = self.remaining()
+        if timeout is None:
+            return remaining
+        return min(timeout, remaining)
+
+
+def get_deadline() -> Deadline | None:
+    """Return deadline of the current invocation, or `None` if it's not set."""
+    return deadline_var.get()
+
+
+class DeadlinePropagation:
+    """Configuration of the deadline of operations executed by invocations.
+
+    Deadline is computed from the time remaining until Lambda's timeout, reduced
+    by the safety margin reserved for encoding and returning the result. Resolvers
+    that don't complete before the deadline are cancelled, and their fields
+    resolve to errors, keeping data of other fields in the result.
+
+    Deadline is available in the `deadline` key of the `dict` context and from
+    `get_deadline()`.
+
+    # Optional arguments
+
+    `safety_margin`: time in seconds reserved before Lambda's timeout.
+
+    `max_duration`: maximum time in seconds for executing operations, also used
+    when Lambda context doesn't provide remaining time.
+    """
+
+    def __init__(self, *, safety_margin: float = 0.5, max_duration: float | None = None) -> None:
+        self.safety_margin = safety_margin
+        self.max_duration = max_duration
+
+    def get_duration(self, lambda_context: Any) -> float | None:
+        """Return time in seconds available for the invocation's operations."""
+        duration = self.max_duration
+        get_remaining_time = getattr(lambda_context, "get_remaining_time_in_millis", None)
+        remaining_ms = get_remaining_time() if callable(get_remaining_time) else None
+        if isinstance(remaining_ms, int | float):
+            remaining = remaining_ms / 1000 - self.safety_margin
+            duration = remaining if duration is None else min(duration, remaining)
+        return duration
+
+    def start(self, lambda_context: Any) -> Token | None:
+        """Set the deadline of the invocation.
+
+        Returns token to pass to `stop`, or `None` if deadline is unknown.
+        """
+        duration = self.get_duration(lambda_context)
+        if duration is None:
+            return None
+        return deadline_var.set(Deadline(monotonic() + max(duration, 0.0)))
+
+    def stop(self, token: Token | None) -> None:
+        """Reset the deadline to previous value."""
+        if token is not None:
+            deadline_var.reset(token)
+
+
+class DeadlineExtension(Extension):
+    """Extension cancelling resolvers which don't complete before the deadline.
+
+    Single timer is scheduled for the operation when first resolver returns an
+    awaitable. When the deadline passes, it cancels resolvers being awaited, and
+    fields resolved later fail without calling their resolvers.
+
+    Used automatically when the handler is configured with `DeadlinePropagation`.
+    """
+
+    def __init__(self) -> None:
+        self.timer: asyncio.TimerHandle | None = None
+        self.exceeded = False
+        self.awaiting: set[asyncio.Task] = set()
+
+    def request_finished(self, context: Any) -> None:
+        if self.timer is not None:
+            self.timer.cancel()
+            self.timer = None
+
+    def resolve(self, next_: Resolver, obj: Any, info: GraphQLResolveInfo, **kwargs) -> Any:
+        deadline = deadline_var.get()
+        if deadline is None:
+            return next_(obj, info, **kwargs)
+        if self.exceeded or deadline.expired():
+            raise DeadlineExceededError()
+
+        result = next_(obj, info, **kwargs)
+        if not is_awaitable(result):
+            return result
+
+        if self.timer is None:
+            self.timer = asyncio.get_running_loop().call_later(
+                deadline.remaining(), self.cancel_awaiting
+            )
+        return self.await_result(result)
+
+    def cancel_awaiting(self) -> None:
+        """Cancel tasks awaiting results of resolvers when the deadline passes."""
+        self.exceeded = True
+        for task in self.awaiting:
+            task.cancel()
+
+    async def await_result(self, result: Any) -> Any:
+        task = asyncio.current_task()
+        self.awaiting.add(task)  # type: ignore
+        try:
+            return await result
+        except asyncio.CancelledError as error:
+            if not self.exceeded:
+                raise
+            # cancellation by the deadline's timer is reported as field's error
+            uncancel = getattr(task, "uncancel", None)
+            if uncancel is not None:
+                uncancel()
+            raise DeadlineExceededError() from error
+        finally:
+            self.awaiting.discard(task)  # type: ignore
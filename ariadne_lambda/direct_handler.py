@@ -0,0 +1,144 @@
+from asyncio import gather
+from typing import TYPE_CHECKING, Any
+
+from graphql import GraphQLObjectType, GraphQLSchema
+
+from ariadne_lambda.base import GraphQLLambdaHandler
+from ariadne_lambda.cache import DocumentCache
+
+if TYPE_CHECKING:
+    from aws_lambda_powertools.utilities.typing import LambdaContext
+
+
+class AppSyncResolverError(Exception):
+    """Raised when operation built from AppSync resolver event returned errors, so
+    AppSync reports the error for resolved field."""
+
+
+def is_appsync_event(event: Any) -> bool:
+    """Return `True` if event is AppSync's direct Lambda resolver event."""
+    return isinstance(event, dict) and "info" in event and "arguments" in event
+
+
+def get_appsync_operation_type(schema: GraphQLSchema, type_name: str) -> str:
+    """Return operation type of the root type with given name."""
+    for operation_type, root_type in (
+        ("query", schema.query_type),
+        ("mutation", schema.mutation_type),
+    ):
+        if root_type is not None and root_type.name == type_name:
+            return operation_type
+    raise ValueError(f"AppSync resolvers of '{type_name}' fields are not supported")
+
+
+def build_appsync_query(schema: GraphQLSchema, event: dict) -> dict:
+    """Return GraphQL data with operation resolving field from AppSync resolver event.
+
+    Field's arguments are passed as variables, which types are taken from the field's
+    definition in the schema.
+    """
+    info = event["info"]
+    type_name = info["parentTypeName"]
+    field_name = info["fieldName"]
+    operation_type = get_appsync_operation_type(schema, type_name)
+
+    root_type = schema.get_type(type_name)
+    if not isinstance(root_type, GraphQLObjectType) or field_name not in root_type.fields:
+        raise ValueError(f"Field '{type_name}.{field_name}' is not defined in the schema")
+
+    field_args = root_type.fields[field_name].args
+    arguments = {
+        name: value for name, value in (event.get("arguments") or {}).items() if name in field_args
+    }
+
+    query = operation_type
+    if arguments:
+        definitions = ", ".join(f"${name}: {field_args[name].type}" for name in arguments)
+        query += f"({definitions})"
+    query += " { " + field_name
+    if arguments:
+        query += "(" + ", ".join(f"{name}: ${name}" for name in arguments) + ")"
+    selection_set = info.get("selectionSetGraphQL")
+    if selection_set:
+        query += " " + selection_set
+    query += " }"
+
+    return {"query": query, "variables": arguments}
+
+
+class GraphQLDirectInvokeHandler(GraphQLLambdaHandler):
+    """Handler for AWS Lambda functions invoked directly or as AppSync resolvers.
+
+    Events are not wrapped in HTTP envelopes, and results are returned as they are,
+    without encoding them to HTTP response's body.
+
+    Direct invocation's event is GraphQL data (`query`, `variables` and
+    `operationName`) and the result is GraphQL result `dict` with `data` and
+    `errors`.
+
+    AppSync's direct Lambda resolver event resolves single `Query` or `Mutation`
+    field. Operation selecting the field is built from the event and the result is
+    field's value. Errors are raised as `AppSyncResolverError`. Batched resolver
+    events are executed concurrently, and return `None` for fields that failed.
+
+    Event is passed as `request` to `context_value` callable and extensions.
+
+    # Optional arguments
+
+    `extensions`: a `list` of Ariadne extensions or callable returning it.
+
+    `middleware`: a `list` of middlewares or callable returning it.
+
+    `middleware_manager_class`: a `MiddlewareManager` type to combine middlewares.
+    """
+
+    def configure(self, *args, **kwargs) -> None:
+        """Configures the handler with options from the GraphQLLambda application.
+
+        Creates document cache if it's not configured, as AppSync resolvers repeat
+        the same operations.
+        """
+        super().configure(*args, **kwargs)
+        if self.document_cache is None:
+            self.document_cache = DocumentCache()
+
+    async def handle(self, event: Any, context: "LambdaContext") -> Any:
+        """Executes the operation from the event and returns its result."""
+        if isinstance(event, list) and all(is_appsync_event(item) for item in event):
+            return await self.handle_appsync_batch(event)
+        if is_appsync_event(event):
+            return await self.handle_appsync_event(event)
+
+        _, result = await self.execute_graphql_query(event, event)
+        return result
+
+    async def handle_appsync_event(self, event: dict) -> Any:
+        """Executes the operation built from AppSync resolver event and returns
+        resolved field's value."""
+        data = build_appsync_query(self.schema, event)  # type: ignore
+        _, result = await self.execute_graphql_query(event, data)
+        if result.get("errors"):
+            raise AppSyncResolverError(result["errors"][0]["message"])
+        return result["data"][event["info"]["fieldName"]]
+
+    async def handle_appsync_batch(self, events: list[dict]) -> list[Any]:
+        """Executes operations from batched AppSync resolver events concurrently."""
+        results = await gather(
+            *(self.handle_appsync_event(event) for event in events), return_exceptions=True
+        )
+        for event, result in zip(events, results, strict=True):
+            if isinstance(result, Exception):
+                self.get_logger().error(
+                    "Could not resolve AppSync field %s.%s",
+                    event["info"]["parentTypeName"],
+                    event["info"]["fieldName"],
+                    exc_info=result,
+                )
+        return [None if isinstance(result, Exception) else result for result in results]
+
+    def get_request_headers(self, request: Any) -> dict[str, str]:
+        """Return headers of the AppSync request, used by the result cache."""
+        if isinstance(request, dict) and isinstance(request.get("request"), dict):
+            headers = request["request"].get("headers") or {}
+            return {name.lower(): value for name, value in headers.items()}
+        return {}
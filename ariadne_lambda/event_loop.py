@@ -0,0 +1,81 @@
+import asyncio
+import signal
+import sys
+from collections.abc import Callable, Coroutine
+from typing import Any, TypeVar
+
+T = TypeVar("T")
+
+
+class EventLoopRunner:
+    """Runs coroutines on single event loop kept for the lifetime of the Lambda container.
+
+    Reusing the loop between invocations avoids creating new loop for every event
+    and keeps loop-bound resources (e.g. HTTP client connection pools) alive
+    between warm invocations.
+
+    # Optional arguments
+
+    `use_uvloop`: a `bool` controlling if loop should be created with `uvloop`.
+    Requires the `uvloop` library.
+    """
+
+    def __init__(self, use_uvloop: bool = False) -> None:
+        self.use_uvloop = use_uvloop
+        self.loop: asyncio.AbstractEventLoop | None = None
+        self.shutdown_callbacks: list[Callable[[], Coroutine[Any, Any, Any]]] = []
+        self.previous_sigterm_handler: Any = None
+
+    def get_loop(self) -> asyncio.AbstractEventLoop:
+        """Return the event loop, creating it on first call or if it was closed."""
+        if self.loop is None or self.loop.is_closed():
+            if self.use_uvloop:
+                import uvloop
+
+                self.loop = uvloop.new_event_loop()
+            else:
+                self.loop = asyncio.new_event_loop()
+            asyncio.set_event_loop(self.loop)
+        return self.loop
+
+    def run(self, coroutine: Coroutine[Any, Any, T]) -> T:
+        """Run coroutine on the event loop and return its result."""
+        return self.get_loop().run_until_complete(coroutine)
+
+    def close(self) -> None:
+        """Close the event loop. New loop is created if runner is used again."""
+        if self.loop is not None and not self.loop.is_closed():
+            self.loop.run_until_complete(self.loop.shutdown_asyncgens())
+            self.loop.close()
+        self.loop = None
+
+    def on_shutdown(self, callback: Callable[[], Coroutine[Any, Any, Any]]) -> None:
+        """Run coroutine returned by the callback on the event loop when Lambda
+        shuts down the container, and close the loop.
+
+        Lambda sends `SIGTERM` signal to the runtime before shutting down the
+        container only when the function has extensions registered. Handler of the
+        signal set before, e.g. by an observability library, is called after the
+        callbacks.
+        """
+        if not self.shutdown_callbacks:
+            self.previous_sigterm_handler = signal.signal(signal.SIGTERM, self.handle_sigterm)
+        self.shutdown_callbacks.append(callback)
+
+    def handle_sigterm(self, signum: int, frame: Any) -> None:
+        try:
+            self.shutdown()
+        finally:
+            try:
+                if callable(self.previous_sigterm_handler):
+                    self.previous_sigterm_handler(signum, frame)
+            finally:
+                sys.exit(0)
+
+    def shutdown(self) -> None:
+        """Run shutdown callbacks and close the event loop."""
+        # signal can't be handled during invocation, when loop is running
+        if self.loop is not None and not self.loop.is_running():
+            for callback in reversed(self.shutdown_callbacks):
+                self.run(callback())
+        self.close()
@@ -0,0 +1,17 @@
+from ariadne.exceptions import HttpError
+
+HTTP_STATUS_413_PAYLOAD_TOO_LARGE = "413 Payload Too Large"
+
+
+class HttpPayloadTooLargeError(HttpError):
+    """Raised when request body or uploaded file exceeds configured size limit."""
+
+    status = HTTP_STATUS_413_PAYLOAD_TOO_LARGE
+
+
+def get_http_error_status_code(error: HttpError) -> int:
+    """Return numeric status code of the `HttpError`, defaulting to 400."""
+    status_code, _, _ = error.status.partition(" ")
+    if status_code.isdigit():
+        return int(status_code)
+    return 400
@@ -0,0 +1,31 @@
+from typing import Any
+
+
+class LazyExplorer:
+    """Explorer deferring import and creation of Ariadne's explorer to first use.
+
+    Keeps `ariadne.explorer` and its HTML templates out of the Lambda's cold start
+    until explorer is actually requested.
+
+    # Optional arguments
+
+    `explorer_class`: a `str` with name of explorer class from `ariadne.explorer`.
+
+    `**kwargs`: arguments to pass to explorer class.
+    """
+
+    def __init__(self, explorer_class: str = "ExplorerGraphiQL", **kwargs: Any) -> None:
+        self.explorer_class = explorer_class
+        self.kwargs = kwargs
+        self._explorer: Any = None
+
+    def get_explorer(self) -> Any:
+        """Return wrapped explorer, creating it on first call."""
+        if self._explorer is None:
+            from ariadne import explorer
+
+            self._explorer = getattr(explorer, self.explorer_class)(**self.kwargs)
+        return self._explorer
+
+    def html(self, request: Any):
+        return self.get_explorer().html(request)
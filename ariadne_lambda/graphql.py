@@ -1,7 +1,8 @@
+from collections.abc import Callable, Iterable, Mapping, Sequence
+from inspect import isawaitable
 from logging import Logger, LoggerAdapter
-from typing import Any
+from typing import TYPE_CHECKING, Any, Literal
 
-from ariadne.explorer import Explorer, ExplorerGraphiQL
 from ariadne.format_error import format_error
 from ariadne.types import (
     ContextValue,
@@ -14,7 +15,25 @@ from ariadne.types import (
 from graphql import ExecutionContext, GraphQLSchema
 
 from ariadne_lambda.base import GraphQLLambdaHandler
+from ariadne_lambda.cache import DocumentCache
+from ariadne_lambda.event_loop import EventLoopRunner
+from ariadne_lambda.explorer import LazyExplorer
 from ariadne_lambda.http_handler import GraphQLAWSAPIHTTPGatewayHandler
+from ariadne_lambda.json_codec import JSONCodec
+from ariadne_lambda.timing import Timing
+
+if TYPE_CHECKING:
+    from ariadne.explorer import Explorer
+
+    from ariadne_lambda.cost import QueryCostAnalyzer
+    from ariadne_lambda.dataloaders import DataLoaderFactory
+    from ariadne_lambda.deadline import DeadlinePropagation
+    from ariadne_lambda.persisted_queries import PersistedQueryStore
+    from ariadne_lambda.resources import LifespanHook, Resource, Resources
+    from ariadne_lambda.result_cache import ResultCache
+    from ariadne_lambda.streaming import StreamWriter
+    from ariadne_lambda.trusted_documents import TrustedDocuments
+    from ariadne_lambda.warmup import WarmupReport
 
 
 class GraphQLLambda:
@@ -30,19 +49,40 @@ class GraphQLLambda:
         execute_get_queries: bool = False,
         debug: bool = False,
         introspection: bool = True,
-        explorer: Explorer | None = None,
+        explorer: "Explorer | Literal[False] | None" = None,
         logger: None | str | Logger | LoggerAdapter = None,
         error_formatter: ErrorFormatter = format_error,
         execution_context_class: type[ExecutionContext] | None = None,
         http_handler: GraphQLLambdaHandler | None = None,
+        document_cache: DocumentCache | None = None,
+        persisted_query_store: "PersistedQueryStore | None" = None,
+        json_codec: JSONCodec | None = None,
+        timing: Timing | None = None,
+        result_cache: "ResultCache | None" = None,
+        dataloaders: "Mapping[str, DataLoaderFactory] | None" = None,
+        cost_analyzer: "QueryCostAnalyzer | None" = None,
+        trusted_documents: "TrustedDocuments | None" = None,
+        deadline: "DeadlinePropagation | None" = None,
+        resources: "Mapping[str, Resource] | None" = None,
+        on_startup: "Sequence[LifespanHook]" = (),
+        on_shutdown: "Sequence[LifespanHook]" = (),
     ) -> None:
+        self.event_loop_runner: EventLoopRunner | None = None
+        self.deadline = deadline
+
+        self.resources = self.create_resources(resources, on_startup, on_shutdown)
+
         if http_handler:
             self.http_handler = http_handler
         else:
             self.http_handler = GraphQLAWSAPIHTTPGatewayHandler()
 
-        if not explorer:
-            explorer = ExplorerGraphiQL()
+        if explorer is None:
+            explorer = LazyExplorer()
+        elif explorer is False:
+            # minimal configuration without explorer, GET requests are not allowed
+            # unless they execute queries
+            explorer = None
 
         self.http_handler.configure(
             schema,
@@ -58,8 +98,145 @@ class GraphQLLambda:
             logger,
             error_formatter,
             execution_context_class,
+            document_cache=document_cache,
+            persisted_query_store=persisted_query_store,
+            json_codec=json_codec,
+            timing=timing,
+            result_cache=result_cache,
+            dataloaders=dataloaders,
+            cost_analyzer=cost_analyzer,
+            trusted_documents=trusted_documents,
+            deadline=deadline,
+            resources=self.resources,
         )
 
+    def create_resources(
+        self,
+        resources: "Mapping[str, Resource] | None",
+        on_startup: "Sequence[LifespanHook]",
+        on_shutdown: "Sequence[LifespanHook]",
+    ) -> "Resources | None":
+        """Return `Resources` of the application, or `None` if it has no resources
+        nor lifecycle hooks."""
+        if not (resources or on_startup or on_shutdown):
+            return None
+
+        from ariadne_lambda.resources import Resources
+
+        return Resources(resources, on_startup=on_startup, on_shutdown=on_shutdown)
+
     async def __call__(self, event: dict, context: Any) -> dict:
-        response = await self.http_handler.handle(event, context)
+        if self.resources is not None and not self.resources.started:
+            await self.resources.startup()
+        token = self.deadline.start(context) if self.deadline else None
+        try:
+            response = await self.http_handler.handle(event, context)
+        finally:
+            if self.deadline:
+                self.deadline.stop(token)
         return response
+
+    async def stream(self, event: dict, context: Any, response_stream: "StreamWriter") -> None:
+        """Handle the event, writing response to the AWS Lambda response stream.
+
+        Stream receives HTTP response prelude with status code and headers followed
+        by chunks of the body, as expected by Lambda Function URLs with
+        `RESPONSE_STREAM` invoke mode. Stream is closed after the response is written.
+
+        # Required arguments
+
+        `event`: The AWS Lambda event dictionary.
+
+        `context`: The AWS Lambda context object.
+
+        `response_stream`: a `StreamWriter` to write the response to.
+        """
+        if self.resources is not None and not self.resources.started:
+            await self.resources.startup()
+        token = self.deadline.start(context) if self.deadline else None
+        try:
+            async for chunk in self.http_handler.handle_streaming(event, context):
+                written = response_stream.write(chunk)
+                if isawaitable(written):
+                    await written
+        finally:
+            if self.deadline:
+                self.deadline.stop(token)
+            closed = response_stream.close()
+            if isawaitable(closed):
+                await closed
+
+    def as_handler(self, *, use_uvloop: bool = False) -> Callable[[dict, Any], dict]:
+        """Return synchronous AWS Lambda handler function for this application.
+
+        Handler runs the application on single event loop that's reused by all
+        invocations within the Lambda container.
+
+        # Optional arguments
+
+        `use_uvloop`: a `bool` controlling if event loop should be created with
+        `uvloop`. Ignored if handler was already created for this application.
+
+        When resources or lifecycle hooks are configured, resources are created and
+        startup hooks are run here, during the Lambda's init phase. Shutdown hooks
+        are run when Lambda shuts down the container.
+        """
+        runner = self.get_event_loop_runner(use_uvloop)
+        self.start_resources(runner)
+
+        def handler(event: dict, context: Any) -> dict:
+            return runner.run(self(event, context))
+
+        return handler
+
+    def start_resources(self, runner: EventLoopRunner) -> None:
+        """Create resources and run startup hooks on the runner's event loop,
+        registering shutdown hooks to run when Lambda shuts down the container."""
+        if self.resources is not None:
+            runner.run(self.resources.startup())
+            if self.resources.shutdown not in runner.shutdown_callbacks:
+                runner.on_shutdown(self.resources.shutdown)
+
+    def get_event_loop_runner(self, use_uvloop: bool = False) -> EventLoopRunner:
+        """Return runner of the event loop shared by invocations, creating it on
+        first call."""
+        if self.event_loop_runner is None:
+            self.event_loop_runner = EventLoopRunner(use_uvloop=use_uvloop)
+        return self.event_loop_runner
+
+    def warmup(
+        self,
+        operations: Iterable[str | dict],
+        *,
+        context_value: Any = None,
+        use_uvloop: bool = False,
+    ) -> "WarmupReport":
+        """Execute representative queries during the Lambda's init phase.
+
+        Fills the document cache with parsed and validated documents, imports
+        modules loaded lazily and runs resolvers, moving this work from the first
+        invocation to the init phase. Call it at module level, before the snapshot
+        of the function is taken when using provisioned concurrency or SnapStart.
+
+        Operations run on the event loop shared with the handler from `as_handler`.
+        Only queries can be executed. Returns `WarmupReport` with durations of
+        the warm-up and its operations.
+
+        # Required arguments
+
+        `operations`: queries as `str`, or `dict`s with `query`, `variables` and
+        `operationName` keys.
+
+        # Optional arguments
+
+        `context_value`: context value for the operations. Defaults to `dict` with
+        synthetic `request` and `warmup` key set to `True`.
+
+        `use_uvloop`: a `bool` controlling if event loop should be created with
+        `uvloop`. Ignored if the loop was already created for this application.
+        """
+        from ariadne_lambda.warmup import warmup
+
+        runner = self.get_event_loop_runner(use_uvloop)
+        self.start_resources(runner)
+        return runner.run(warmup(self.http_handler, operations, context_value))
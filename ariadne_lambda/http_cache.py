@@ -0,0 +1,214 @@
+from contextvars import ContextVar
+from hashlib import blake2b
+from typing import Literal
+
+from graphql import (
+    DocumentNode,
+    FieldNode,
+    GraphQLSchema,
+    TypeInfo,
+    TypeInfoVisitor,
+    get_directive_values,
+    get_named_type,
+    is_composite_type,
+    visit,
+)
+from graphql.language import Visitor
+
+from ariadne_lambda.cache import CachedDocument
+
+CacheScope = Literal["PUBLIC", "PRIVATE"]
+
+# Type definitions of the `@cacheControl` directive, to include in the schema
+CACHE_CONTROL_TYPE_DEFS = """
+enum CacheControlScope {
+    PUBLIC
+    PRIVATE
+}
+
+directive @cacheControl(
+    maxAge: Int
+    scope: CacheControlScope
+    inheritMaxAge: Boolean
+) on FIELD_DEFINITION | OBJECT | INTERFACE | UNION
+"""
+
+cache_policy_var: ContextVar["CachePolicy | None"] = ContextVar("cache_policy", default=None)
+
+
+class CachePolicy:
+    """Cache policy of the response, restricted by every field in the result.
+
+    `max_age` is `None` until any field restricts it.
+    """
+
+    __slots__ = ("max_age", "scope")
+
+    def __init__(self, max_age: int | None = None, scope: CacheScope = "PUBLIC") -> None:
+        self.max_age = max_age
+        self.scope = scope
+
+    def restrict(self, max_age: int | None = None, scope: CacheScope | None = None) -> None:
+        """Lower the policy's `max_age` and narrow its scope to `PRIVATE`."""
+        if max_age is not None and (self.max_age is None or max_age < self.max_age):
+            self.max_age = max_age
+        if scope == "PRIVATE":
+            self.scope = "PRIVATE"
+
+    def get_cache_control_header(self) -> str:
+        """Return value for the `Cache-Control` HTTP header."""
+        if not self.max_age:
+            return "no-store"
+        return f"max-age={self.max_age}, {self.scope.lower()}"
+
+
+def get_cache_policy() -> CachePolicy | None:
+    """Return cache policy of the current request, or `None` if it's not cacheable."""
+    return cache_policy_var.get()
+
+
+def set_cache_hint(max_age: int | None = None, scope: CacheScope | None = None) -> None:
+    """Restrict cache policy of the current response from the resolver.
+
+    Does nothing when current request is not cacheable (e.g. is a POST request).
+
+    # Optional arguments
+
+    `max_age`: maximum time in seconds the response can be cached for.
+
+    `scope`: `"PRIVATE"` if response depends on the user and may only be cached
+    by the client.
+    """
+    cache_policy = cache_policy_var.get()
+    if cache_policy is not None:
+        cache_policy.restrict(max_age, scope)
+
+
+def get_etag(body: str | bytes) -> str:
+    """Return weak ETag of the response body.
+
+    ETag is weak because same entity may be sent with different content encodings.
+    """
+    if isinstance(body, str):
+        body = body.encode("utf-8")
+    return f'W/"{blake2b(body, digest_size=16).hexdigest()}"'
+
+
+def is_etag_matching(if_none_match: str, etag: str) -> bool:
+    """Return `True` if `If-None-Match` header value matches the ETag, using weak
+    comparison."""
+    if if_none_match.strip() == "*":
+        return True
+    opaque_tag = etag.removeprefix("W/")
+    return any(
+        candidate.strip().removeprefix("W/") == opaque_tag
+        for candidate in if_none_match.split(",")
+    )
+
+
+class CacheControlVisitor(Visitor):
+    """Computes static cache policy of the document from `@cacheControl` directives.
+
+    Follows the rules of Apollo's cache control: field's policy comes from the field's
+    directive, then from its type's directive. Root fields and fields returning
+    composite types without hints use `default_max_age`, and leaf fields without
+    hints inherit the policy of their parent.
+    """
+
+    def __init__(
+        self,
+        schema: GraphQLSchema,
+        type_info: TypeInfo,
+        cache_policy: CachePolicy,
+        default_max_age: int,
+    ) -> None:
+        super().__init__()
+        self.type_info = type_info
+        self.cache_policy = cache_policy
+        self.default_max_age = default_max_age
+        self.directive = schema.get_directive("cacheControl")
+        self.root_types = {
+            root_type
+            for root_type in (
+                schema.query_type,
+                schema.mutation_type,
+                schema.subscription_type,
+            )
+            if root_type
+        }
+
+    def get_hint(self, node) -> dict:
+        if self.directive is None or node is None:
+            return {}
+        return get_directive_values(self.directive, node) or {}
+
+    def enter_field(self, node: FieldNode, *_) -> None:
+        field_def = self.type_info.get_field_def()
+        if field_def is None:
+            return
+
+        hint = self.get_hint(field_def.ast_node)
+        named_type = get_named_type(field_def.type)
+        if is_composite_type(named_type) and "maxAge" not in hint:
+            type_hint = self.get_hint(named_type.ast_node)
+            hint = {**type_hint, **hint}
+
+        max_age = hint.get("maxAge")
+        if max_age is None and not hint.get("inheritMaxAge"):
+            is_root_field = self.type_info.get_parent_type() in self.root_types
+            if is_root_field or is_composite_type(named_type):
+                max_age = self.default_max_age
+
+        self.cache_policy.restrict(max_age, hint.get("scope"))
+
+
+def get_static_cache_policy(
+    schema: GraphQLSchema, document: DocumentNode, default_max_age: int = 0
+) -> CachePolicy:
+    """Return cache policy of the document computed from `@cacheControl` directives
+    in the schema."""
+    cache_policy = CachePolicy()
+    type_info = TypeInfo(schema)
+    visitor = CacheControlVisitor(schema, type_info, cache_policy, default_max_age)
+    visit(document, TypeInfoVisitor(type_info, visitor))
+    return cache_policy
+
+
+class HttpCache:
+    """Configuration of HTTP caching of GraphQL queries sent with GET requests.
+
+    # Optional arguments
+
+    `default_max_age`: max age in seconds of root fields and fields returning
+    objects without `@cacheControl` hints. Responses are not cached by default.
+
+    `etag`: a `bool` controlling if responses have the `ETag` header, and
+    requests with matching `If-None-Match` header receive `304 Not Modified`
+    response without body.
+
+    `cache_control`: a `bool` controlling if responses have the `Cache-Control`
+    header computed from `@cacheControl` directives and `set_cache_hint` calls.
+    """
+
+    def __init__(
+        self,
+        *,
+        default_max_age: int = 0,
+        etag: bool = True,
+        cache_control: bool = True,
+    ) -> None:
+        self.default_max_age = default_max_age
+        self.etag = etag
+        self.cache_control = cache_control
+
+    def get_document_cache_policy(
+        self, schema: GraphQLSchema, cached_document: CachedDocument
+    ) -> CachePolicy:
+        """Return static cache policy of the document, computing it on first use."""
+        cache_policy = cached_document.metadata.get("cache_policy")
+        if cache_policy is None:
+            cache_policy = get_static_cache_policy(
+                schema, cached_document.document, self.default_max_age
+            )
+            cached_document.metadata["cache_policy"] = cache_policy
+        return cache_policy
@@ -1,26 +1,37 @@
-import json
+from asyncio import Semaphore, Task, ensure_future, gather
+from collections.abc import AsyncIterator
 from inspect import isawaitable
-from typing import Any
+from time import perf_counter_ns
+from typing import TYPE_CHECKING, Any
 
 from ariadne.constants import (
     DATA_TYPE_JSON,
     DATA_TYPE_MULTIPART,
 )
 from ariadne.exceptions import HttpBadRequestError, HttpError
-from ariadne.explorer import Explorer
-from ariadne.graphql import graphql
+from ariadne.file_uploads import combine_multipart_data
 from ariadne.types import (
-    ContextValue,
-    ExtensionList,
     Extensions,
     GraphQLResult,
     Middlewares,
 )
-from aws_lambda_powertools.utilities.typing import LambdaContext
-from graphql import DocumentNode, MiddlewareManager
+from graphql import MiddlewareManager
 
 from ariadne_lambda.base import GraphQLLambdaHandler
+from ariadne_lambda.body import decode_body
+from ariadne_lambda.cache import CachedDocument
+from ariadne_lambda.exceptions import get_http_error_status_code
 from ariadne_lambda.schema import Request, Response
+from ariadne_lambda.timing import get_phase_timer
+
+if TYPE_CHECKING:
+    from ariadne.explorer import Explorer
+    from aws_lambda_powertools.utilities.typing import LambdaContext
+
+    from ariadne_lambda.compression import ResponseCompression
+    from ariadne_lambda.http_cache import CachePolicy, HttpCache
+    from ariadne_lambda.multipart import MultipartParser
+    from ariadne_lambda.static_responses import StaticResponses
 
 
 class GraphQLAWSAPIHTTPGatewayHandler(GraphQLLambdaHandler):
@@ -35,21 +46,222 @@ class GraphQLAWSAPIHTTPGatewayHandler(GraphQLLambdaHandler):
         extensions: Extensions | None = None,
         middleware: Middlewares | None = None,
         middleware_manager_class: type[MiddlewareManager] | None = None,
+        response_compression: "ResponseCompression | None" = None,
+        batch_max_size: int | None = None,
+        batch_concurrency: int | None = None,
+        batch_shared_context: bool = True,
+        multipart_parser: "MultipartParser | None" = None,
+        http_cache: "HttpCache | None" = None,
+        stream_chunk_size: int = 64 * 1024,
+        static_responses: "StaticResponses | None" = None,
+        max_body_size: int | None = 6 * 1024 * 1024,
     ) -> None:
-        super().__init__()
-
-        self.extensions = extensions
-        self.middleware = middleware
-        self.middleware_manager_class = middleware_manager_class or MiddlewareManager
+        """Initializes the handler.
 
-    async def handle(self, event: dict, context: LambdaContext):
+        Args:
+            extensions: Extensions list or callable returning it.
+            middleware: Middlewares list or callable returning it.
+            middleware_manager_class: A `MiddlewareManager` type to combine middlewares.
+            response_compression: An optional `ResponseCompression` instance, enabling
+                compression of responses negotiated from the `Accept-Encoding` header.
+            batch_max_size: Maximum number of operations in batched request. Requests
+                with list of operations are not supported when it's `None`.
+            batch_concurrency: Maximum number of batched operations executed
+                concurrently, or `None` for no limit.
+            batch_shared_context: Use single context value for all batched operations.
+            multipart_parser: A `MultipartParser` used for file uploads. Parser with
+                default limits is created on first multipart request if not set.
+            http_cache: An optional `HttpCache` instance, enabling `ETag` and
+                `Cache-Control` headers for queries executed with GET requests.
+            stream_chunk_size: Minimum size of body chunks in streamed responses.
+                Defaults to 64 KB.
+            static_responses: An optional `StaticResponses` instance, enabling
+                precomputed explorer and introspection responses.
+            max_body_size: Maximum size of JSON request body in bytes, or `None` for
+                no limit. Defaults to 6 MB, which is AWS Lambda's limit for synchronous
+                invocation payload.
+        """
+        super().__init__(extensions, middleware, middleware_manager_class)
+
+        self.response_compression = response_compression
+        self.batch_max_size = batch_max_size
+        self.batch_concurrency = batch_concurrency
+        self.batch_shared_context = batch_shared_context
+        self.multipart_parser = multipart_parser
+        self.http_cache = http_cache
+        self.stream_chunk_size = stream_chunk_size
+        self.static_responses = static_responses
+        self.max_body_size = max_body_size
+
+    async def handle(self, event: dict, context: "LambdaContext"):
         """Processes AWS Lambda event triggered by an API Gateway HTTP request.
 
         Extracts the HTTP request from the Lambda event,
         and delegates to the appropriate handler based on the HTTP method.
         """
         request = Request.create_from_event(event)
-        return (await self.handle_request(request)).render()
+        response = await self.process_request(request)
+        return response.render()
+
+    async def process_request(self, request: Request) -> Response:
+        """Handles the HTTP request, measuring its phases and compressing the response.
+
+        Args:
+            request: The request extracted from the Lambda event.
+
+        Returns:
+            A `Response` with the `Server-Timing` header, if enabled.
+        """
+        token = self.timing.start() if self.timing else None
+        try:
+            response = await self.handle_request(request)
+            if self.response_compression:
+                timer = get_phase_timer()
+                started = perf_counter_ns() if timer else 0
+                response = self.response_compression.compress_response(request.headers, response)
+                if timer:
+                    timer.record("compress", started)
+        finally:
+            if token is not None:
+                finished_timer = self.timing.stop(token)  # type: ignore
+        if token is not None and self.timing.server_timing:  # type: ignore
+            response.headers["Server-Timing"] = finished_timer.get_server_timing_header()
+        return response
+
+    async def handle_streaming(
+        self, event: dict, context: "LambdaContext"
+    ) -> AsyncIterator[bytes]:
+        """Processes AWS Lambda event triggered by an API Gateway HTTP request, streaming
+        the response.
+
+        GraphQL results are encoded and compressed incrementally in chunks, so they
+        are never held in memory as whole body. Results of batched operations are
+        streamed in the order of operations as soon as they are available, with `200`
+        status code. Other responses, like explorer, errors, static introspection
+        results or queries cached with `http_cache`, are created by `process_request`
+        and streamed whole.
+        """
+        from ariadne_lambda.streaming import iter_rendered_response
+
+        request = Request.create_from_event(event)
+        if self.is_streamed_request(request):
+            response = None
+            token = self.timing.start() if self.timing else None
+            try:
+                try:
+                    data = await self.extract_data_from_request(request)
+                    if isinstance(data, list) and self.batch_max_size:
+                        self.validate_batch_size(data)
+                except HttpError as error:
+                    response = self.create_http_error_response(error)
+                else:
+                    if self.is_static_introspection_query(data):
+                        response = await self.execute_static_operation(request, data)
+                    else:
+                        async for chunk in self.stream_graphql_result(request, data):
+                            yield chunk
+            finally:
+                if token is not None:
+                    self.timing.stop(token)  # type: ignore
+        else:
+            response = await self.process_request(request)
+
+        if response is not None:
+            for chunk in iter_rendered_response(response.render()):
+                yield chunk
+
+    def is_streamed_request(self, request: Request) -> bool:
+        """
+        Checks if GraphQL result of the request is streamed incrementally.
+
+        GET queries are not streamed when HTTP cache is enabled, as their `ETag`
+        is computed from the whole body.
+
+        Args:
+            request: The request extracted from the Lambda event.
+
+        Returns:
+            A boolean flag indicating if result of the request is streamed.
+        """
+        if request.method == "POST":
+            return True
+        return self.http_cache is None and self.is_get_query_request(request)
+
+    def is_static_introspection_query(self, data: Any) -> bool:
+        """
+        Checks if data is an introspection query, which result is returned from
+        static responses.
+
+        Args:
+            data: GraphQL data from the request.
+
+        Returns:
+            A boolean flag indicating if the query's result is static.
+        """
+        if self.static_responses is None or isinstance(data, list):
+            return False
+        if not self.is_static_introspection_allowed():
+            return False
+        return self.static_responses.get_introspection_key(self.schema, data) is not None
+
+    async def stream_graphql_result(self, request: Request, data: Any) -> AsyncIterator[bytes]:
+        """Executes GraphQL operations and yields response prelude and chunks of JSON
+        encoded result, compressed if client accepts compression."""
+        headers = {"Content-Type": "application/json"}
+        compressor_stream = None
+        if self.response_compression is not None:
+            headers["Vary"] = "Accept-Encoding"
+            compressor_stream = self.response_compression.create_stream(request.headers)
+            if compressor_stream is not None:
+                headers["Content-Encoding"] = compressor_stream.encoding
+
+        chunks = self.stream_graphql_chunks(request, data, headers)
+        try:
+            # prelude is never compressed
+            yield await chunks.__anext__()
+            async for chunk in chunks:
+                yield compressor_stream.compress(chunk) if compressor_stream else chunk
+        finally:
+            await chunks.aclose()
+        if compressor_stream is not None:
+            yield compressor_stream.finish()
+
+    async def stream_graphql_chunks(
+        self, request: Request, data: Any, headers: dict[str, str]
+    ) -> AsyncIterator[bytes]:
+        """Executes GraphQL operations and yields response prelude and chunks of JSON
+        encoded result.
+
+        Result of single operation is encoded after it's executed, so durations of
+        its phases are returned in the `Server-Timing` header if enabled.
+        """
+        from ariadne_lambda.streaming import encode_json_chunks, encode_prelude
+
+        if not isinstance(data, list) or not self.batch_max_size:
+            success, result = await self.execute_operation(request, data)
+            timer = get_phase_timer()
+            if timer and self.timing.server_timing:  # type: ignore
+                headers["Server-Timing"] = timer.get_server_timing_header()
+            yield encode_prelude(200 if success else 400, headers)
+            for chunk in encode_json_chunks(self.json_codec, result, self.stream_chunk_size):
+                yield chunk
+            return
+
+        # status code is sent before operations complete, errors are in results
+        yield encode_prelude(200, headers)
+        tasks = await self.start_graphql_batch(request, data)
+        try:
+            separator = b"["
+            for task in tasks:
+                _, result = await task
+                yield separator
+                for chunk in encode_json_chunks(self.json_codec, result, self.stream_chunk_size):
+                    yield chunk
+                separator = b","
+            yield b"]"
+        finally:
+            for task in tasks:
+                task.cancel()
 
     async def handle_request(self, request: Request) -> Response:
         """Determines the request type (GET or POST) and routes to the corresponding GraphQL
@@ -57,8 +269,16 @@ class GraphQLAWSAPIHTTPGatewayHandler(GraphQLLambdaHandler):
         Supports executing queries directly from GET requests, or handling
         introspection and GraphQL explorers."""
         if request.method == "GET":
-            if self.execute_get_queries and request.params and request.params.get("query"):
-                return await self.graphql_http_server(request)
+            if self.is_get_query_request(request):
+                if self.http_cache is None:
+                    return await self.graphql_http_server(request)
+                from ariadne_lambda.http_cache import CachePolicy, cache_policy_var
+
+                token = cache_policy_var.set(CachePolicy())
+                try:
+                    return await self.graphql_http_server(request)
+                finally:
+                    cache_policy_var.reset(token)
             if self.introspection and self.explorer:
                 # only render explorer when introspection is enabled
                 return await self.render_explorer(request, self.explorer)
@@ -68,7 +288,7 @@ class GraphQLAWSAPIHTTPGatewayHandler(GraphQLLambdaHandler):
 
         return self.handle_not_allowed_method(request)
 
-    async def render_explorer(self, request: Request, explorer: Explorer) -> Response:
+    async def render_explorer(self, request: Request, explorer: "Explorer") -> Response:
         """Return a HTML response with GraphQL explorer.
 
         # Required arguments:
@@ -79,32 +299,263 @@ class GraphQLAWSAPIHTTPGatewayHandler(GraphQLLambdaHandler):
         `html(request: Request)` method which returns either the `str` with HTML
         or `None`. If explorer returns `None`, `405` method not allowed response
         is returned instead.
+
+        When static responses are enabled, explorer is rendered only once and its
+        encoded and compressed response is reused.
         """
+        static_responses = self.static_responses
+        if static_responses is not None and static_responses.explorer_body is not None:
+            return static_responses.explorer_body.create_response(
+                request.headers, "text/html", self.response_compression
+            )
+
         explorer_html = explorer.html(request)
         if isawaitable(explorer_html):
             explorer_html = await explorer_html
-        if explorer_html:
-            return Response(body=explorer_html, headers={"Content-Type": "text/html"})
+        if not explorer_html:
+            return self.handle_not_allowed_method(request)
 
-        return self.handle_not_allowed_method(request)
+        if static_responses is not None and static_responses.explorer:
+            from ariadne_lambda.static_responses import StaticBody
+
+            static_responses.explorer_body = StaticBody(explorer_html, self.response_compression)
+            return static_responses.explorer_body.create_response(
+                request.headers, "text/html", self.response_compression
+            )
+        return Response(body=explorer_html, headers={"Content-Type": "text/html"})
 
     async def graphql_http_server(self, request: Request) -> Response:
         """Executes GraphQL queries or mutations based on the POST request's body.
 
         Parses the request, executes the GraphQL query, and formats the response as JSON.
         """
+        timer = get_phase_timer()
+        started = perf_counter_ns() if timer else 0
         try:
             data = await self.extract_data_from_request(request)
+            if isinstance(data, list) and self.batch_max_size:
+                self.validate_batch_size(data)
         except HttpError as error:
-            return Response(
-                status_code=400,
-                body=error.message or error.status,
-                headers={"Content-Type": "text/plain"},
-            )
+            return self.create_http_error_response(error)
+        finally:
+            if timer:
+                timer.record("request", started)
+
+        if isinstance(data, list) and self.batch_max_size:
+            success, result = await self.execute_graphql_batch(request, data)
+        elif self.static_responses is not None and self.is_static_introspection_allowed():
+            return await self.execute_static_operation(request, data)
+        else:
+            success, result = await self.execute_operation(request, data)
+        return await self.create_json_response(request, result, success)
 
-        success, result = await self.execute_graphql_query(request, data)
+    def is_static_introspection_allowed(self) -> bool:
+        """
+        Returns `True` if results of introspection queries can be returned from
+        static responses.
+
+        Static introspection results are returned without creating the context or
+        executing the query, so they are not used when introspection could be
+        restricted per request: by middleware, extensions (including deadline's
+        extension), callable context value or callable validation rules.
+
+        Returns:
+            A boolean flag indicating if static introspection results can be used.
+        """
+        return (
+            self.introspection is True
+            and not self.middleware
+            and not self.extensions
+            and self.deadline is None
+            and not callable(self.context_value)
+            and not callable(self.validation_rules)
+        )
+
+    async def execute_static_operation(self, request: Request, data: Any) -> Response:
+        """
+        Executes single GraphQL operation, returning precomputed response for
+        introspection queries.
+
+        Results of introspection queries are stored encoded and compressed, keyed
+        by schema's hash and the query, so they are executed only once.
+
+        Args:
+            request: The original request object.
+            data: A dictionary containing the query, variables, and operation name.
+
+        Returns:
+            A `Response` object containing the JSON-formatted GraphQL result.
+        """
+        static_responses: StaticResponses = self.static_responses  # type: ignore
+        key = static_responses.get_introspection_key(self.schema, data)  # type: ignore
+        if key is not None:
+            static_body = static_responses.get_introspection_body(key)
+            if static_body is not None:
+                return static_body.create_response(
+                    request.headers, "application/json", self.response_compression
+                )
+
+        success, result = await self.execute_operation(request, data)
+        if key is not None and success:
+            cached_document = None
+            if self.document_cache is not None:
+                cached_document = self.document_cache.get(self.get_document_cache_key(key[1]))
+            static_body = static_responses.set_introspection_body(
+                key,
+                result,
+                self.json_codec.dumps_bytes(result),
+                self.response_compression,
+                cached_document.document if cached_document else None,
+            )
+            if static_body is not None:
+                return static_body.create_response(
+                    request.headers, "application/json", self.response_compression
+                )
         return await self.create_json_response(request, result, success)
 
+    def create_http_error_response(self, error: HttpError) -> Response:
+        """
+        Formats the HTTP error raised while reading the request into a plain text
+        response.
+
+        Args:
+            error: The `HttpError` raised by the handler.
+
+        Returns:
+            A `Response` object with error's status code and message.
+        """
+        return Response(
+            status_code=get_http_error_status_code(error),
+            body=error.message or error.status,
+            headers={"Content-Type": "text/plain"},
+        )
+
+    def validate_batch_size(self, operations: list) -> None:
+        """
+        Checks if the batched request contains allowed number of operations.
+
+        Raises:
+            HttpBadRequestError: If the batch is empty or exceeds `batch_max_size`.
+        """
+        if not operations:
+            raise HttpBadRequestError("Batched request must contain at least one operation")
+        if len(operations) > self.batch_max_size:  # type: ignore
+            raise HttpBadRequestError(
+                f"Batched request can't contain more than {self.batch_max_size} operations"
+            )
+
+    async def execute_graphql_batch(self, request: Request, operations: list) -> GraphQLResult:
+        """
+        Executes batched GraphQL operations concurrently.
+
+        When `batch_shared_context` is enabled, single context value is created for
+        the whole batch, with the list of operations passed as `data`, so resolvers
+        (e.g. DataLoaders) can share state across the operations.
+
+        Args:
+            request: The original request object.
+            operations: A list of GraphQL data dictionaries.
+
+        Returns:
+            A tuple of success flag and a list of results in the order of operations.
+            Success flag is `False` only if all operations failed, as errors of
+            other operations are reported in their results.
+        """
+        tasks = await self.start_graphql_batch(request, operations)
+        results = await gather(*tasks)
+        return any(success for success, _ in results), [result for _, result in results]
+
+    async def start_graphql_batch(
+        self, request: Request, operations: list
+    ) -> list[Task[GraphQLResult]]:
+        """
+        Starts concurrent execution of batched GraphQL operations.
+
+        Args:
+            request: The original request object.
+            operations: A list of GraphQL data dictionaries.
+
+        Returns:
+            A list of tasks executing the operations, in the order of operations.
+        """
+        context_value = None
+        if self.batch_shared_context:
+            context_value = await self.get_context_for_request(request, operations)  # type: ignore
+
+        semaphore = Semaphore(self.batch_concurrency) if self.batch_concurrency else None
+
+        async def execute_batched_operation(data: Any) -> GraphQLResult:
+            if semaphore is None:
+                return await self.execute_operation(request, data, context_value=context_value)
+            async with semaphore:
+                return await self.execute_operation(request, data, context_value=context_value)
+
+        return [ensure_future(execute_batched_operation(data)) for data in operations]
+
+    async def execute_operation(
+        self, request: Request, data: Any, *, context_value: Any = None
+    ) -> GraphQLResult:
+        """
+        Executes single GraphQL operation from the HTTP request.
+
+        Resolves Automatic Persisted Query if enabled and executes the query.
+        Registered persisted query is stored after it was parsed and validated.
+        When trusted documents are configured, they resolve queries hashes instead
+        of the store, and registering new queries is rejected.
+
+        Args:
+            request: The original request object.
+            data: A dictionary containing the query, variables, and operation name.
+            context_value: Optional context passed to the GraphQL execution.
+
+        Returns:
+            A `GraphQLResult` tuple with success flag and the result dictionary.
+        """
+        registration = None
+        if self.persisted_query_store is not None and isinstance(data, dict):
+            from ariadne_lambda.persisted_queries import (
+                PersistedQueryError,
+                PersistedQueryNotFoundError,
+                PersistedQueryRegistrationError,
+                get_persisted_query_registration,
+                resolve_persisted_query,
+            )
+
+            registration = get_persisted_query_registration(data)
+            try:
+                if self.trusted_documents is None:
+                    data = await resolve_persisted_query(self.persisted_query_store, data)
+                elif registration is not None:
+                    raise PersistedQueryRegistrationError()
+            except PersistedQueryError as error:
+                # Apollo clients expect not found error with 200 status code
+                success = isinstance(error, PersistedQueryNotFoundError)
+                return success, {"errors": [error.format()]}
+
+        success, result = await self.execute_graphql_query(
+            request, data, context_value=context_value
+        )
+        # unsuccessful result means that query could not be parsed or validated
+        if registration is not None and success:
+            await self.persisted_query_store.set(*registration)  # type: ignore
+        return success, result
+
+    def is_get_query_request(self, request: Request) -> bool:
+        """Checks if the request is a GET request with GraphQL query to execute.
+
+        Query is either passed in `query` param, as trusted document's id in
+        `documentId` param, or when Automatic Persisted Queries are enabled, as query
+        hash in the `extensions` param.
+        """
+        if request.method != "GET" or not self.execute_get_queries or not request.params:
+            return False
+        if request.params.get("query") or request.params.get("documentId"):
+            return True
+        return bool(
+            (self.persisted_query_store or self.trusted_documents)
+            and request.params.get("extensions")
+        )
+
     async def extract_data_from_request(self, request: Request):
         """
         Executes a GraphQL query or mutation based on the parsed request data.
@@ -126,12 +577,7 @@ class GraphQLAWSAPIHTTPGatewayHandler(GraphQLLambdaHandler):
             return await self.extract_data_from_json_request(request)
         if content_type == DATA_TYPE_MULTIPART:
             return await self.extract_data_from_multipart_request(request)
-        if (
-            request.method == "GET"
-            and self.execute_get_queries
-            and request.params
-            and request.params.get("query")
-        ):
+        if self.is_get_query_request(request):
             return self.extract_data_from_get_request(request)
 
         raise HttpBadRequestError(
@@ -150,16 +596,57 @@ class GraphQLAWSAPIHTTPGatewayHandler(GraphQLLambdaHandler):
         Returns:
             A dictionary containing the extracted GraphQL query data.
 
+        Base64 encoded body is decoded to bytes passed to the JSON parser directly.
+
         Raises:
             HttpBadRequestError: If the request body is not valid JSON.
+            HttpPayloadTooLargeError: If the request body exceeds `max_body_size`.
         """
+        body = decode_body(request.body, request.is_base64_encoded, self.max_body_size)
         try:
-            return json.loads(request.body)
+            return self.json_codec.loads(body)
         except (TypeError, ValueError) as ex:
             raise HttpBadRequestError("Request body is not a valid JSON") from ex
 
-    async def extract_data_from_multipart_request(self, request: Request):
-        raise NotImplementedError("Multipart requests are not yet supported in AWS Lambda")
+    async def extract_data_from_multipart_request(self, request: Request) -> dict | list:
+        """
+        Extracts the GraphQL query data with uploaded files from the multipart request,
+        implementing the GraphQL multipart request specification.
+
+        Args:
+            request: A `Request` object containing the parsed HTTP request from API Gateway.
+
+        Returns:
+            A dictionary or list of dictionaries with GraphQL query data, with file
+            variables populated with `UploadedFile` instances.
+
+        Raises:
+            HttpBadRequestError: If the request body is not valid multipart request.
+            HttpPayloadTooLargeError: If the request body or any of the files exceeds
+                parser's size limits.
+        """
+        from ariadne_lambda.multipart import MultipartParser, get_boundary
+
+        if self.multipart_parser is None:
+            self.multipart_parser = MultipartParser()
+
+        boundary = get_boundary(request.headers.get("content-type", ""))
+        body = self.multipart_parser.decode_body(request.body, request.is_base64_encoded)
+        fields, files = self.multipart_parser.parse(body, boundary)
+        del body
+
+        try:
+            operations = self.json_codec.loads(fields["operations"])
+        except (KeyError, TypeError, ValueError) as ex:
+            raise HttpBadRequestError(
+                "Request 'operations' multipart field is not a valid JSON"
+            ) from ex
+        try:
+            files_map = self.json_codec.loads(fields["map"])
+        except (KeyError, TypeError, ValueError) as ex:
+            raise HttpBadRequestError("Request 'map' multipart field is not a valid JSON") from ex
+
+        return combine_multipart_data(operations, files_map, files)
 
     def extract_data_from_get_request(self, request: Request) -> dict:
         """
@@ -176,104 +663,122 @@ class GraphQLAWSAPIHTTPGatewayHandler(GraphQLLambdaHandler):
         """
         if not request.params:
             raise HttpBadRequestError("Query variables are not valid")
-        query = request.params["query"].strip()
+        query = request.params.get("query", "").strip()
         operation_name = request.params.get("operationName", "").strip()
         variables = request.params.get("variables", "").strip()
+        extensions = request.params.get("extensions", "").strip()
 
         clean_variables = None
 
         if variables:
             try:
-                clean_variables = json.loads(variables)
+                clean_variables = self.json_codec.loads(variables)
             except (TypeError, ValueError) as ex:
                 raise HttpBadRequestError("Variables query arg is not a valid JSON") from ex
 
-        return {
+        data = {
             "query": query,
             "operationName": operation_name or None,
             "variables": clean_variables,
         }
 
-    async def execute_graphql_query(
-        self,
-        request: Any,
-        data: Any,
-        *,
-        context_value: Any = None,
-        query_document: DocumentNode | None = None,
-    ) -> GraphQLResult:
+        document_id = request.params.get("documentId", "").strip()
+        if document_id:
+            data["documentId"] = document_id
+
+        if extensions:
+            try:
+                data["extensions"] = self.json_codec.loads(extensions)
+            except (TypeError, ValueError) as ex:
+                raise HttpBadRequestError("Extensions query arg is not a valid JSON") from ex
+
+        return data
+
+    def is_query_required(self, request: Any) -> bool:
         """
-        Executes the GraphQL query using the provided data and optional context.
+        Checks if only query operations can be executed for the request.
 
         Args:
-            request: The request object, typically containing metadata and headers.
-            data: A dictionary containing the query, variables, and operation name.
-            context_value: Optional context passed to the GraphQL execution.
-            query_document: An optional pre-parsed GraphQL query document.
+            request: The original request object.
 
         Returns:
-            A `GraphQLResult` object containing the results of the query execution.
+            `True` for GET requests, as they must not have side effects.
         """
-        if context_value is None:
-            context_value = await self.get_context_for_request(request, data)
+        return isinstance(request, Request) and request.method == "GET"
 
-        extensions = await self.get_extensions_for_request(request, context_value)
-        # TODO: figure out how to mix those with powertools middleware
-        # middleware = await self.get_middleware_for_request(request, context_value)
-        middleware = None
+    def create_warmup_request(self, data: dict) -> Request:
+        """
+        Returns synthetic POST request used to execute warm-up operations.
 
-        if self.schema is None:
-            raise TypeError("schema is not set, call configure method to initialize it")
+        Args:
+            data: A dictionary containing the query, variables, and operation name.
 
-        if isinstance(request, Request):
-            require_query = request.method == "GET"
-        else:
-            require_query = False
-
-        return await graphql(
-            self.schema,
-            data,
-            context_value=context_value,
-            root_value=self.root_value,
-            query_parser=self.query_parser,
-            query_validator=self.query_validator,
-            query_document=query_document,
-            validation_rules=self.validation_rules,
-            require_query=require_query,
-            debug=self.debug,
-            introspection=self.introspection,
-            logger=self.logger,
-            error_formatter=self.error_formatter,
-            extensions=extensions,
-            middleware=middleware,
-            middleware_manager_class=self.middleware_manager_class,
-            execution_context_class=self.execution_context_class,
+        Returns:
+            A `Request` object with API Gateway V2 event.
+        """
+        return Request.create_from_event(
+            {
+                "version": "2.0",
+                "requestContext": {"http": {"method": "POST", "path": "/"}},
+                "headers": {"content-type": DATA_TYPE_JSON},
+            }
         )
 
-    async def get_extensions_for_request(
-        self, request: Any, context: ContextValue | None
-    ) -> ExtensionList:
+    def get_request_headers(self, request: Any) -> dict[str, str]:
         """
-        Determines the extensions to be used for the current GraphQL request.
+        Returns headers of the request with lowercase names.
 
         Args:
-            request: The request object, providing access to request-specific data.
-            context: Optional context associated with the request.
+            request: The original request object.
 
         Returns:
-            A list of extensions to be used during the execution of the GraphQL query.
+            A dictionary with request headers.
+        """
+        return request.headers if isinstance(request, Request) else {}
+
+    def is_document_required(self) -> bool:
+        """
+        Returns `True` if document must be parsed before the execution, also to
+        compute HTTP cache policy of the query.
+
+        Returns:
+            A boolean flag indicating if document is required.
+        """
+        if super().is_document_required():
+            return True
+        if self.http_cache is None:
+            return False
+
+        from ariadne_lambda.http_cache import get_cache_policy
+
+        return get_cache_policy() is not None
+
+    def prepare_document(self, request: Any, cached_document: CachedDocument) -> None:
         """
-        if callable(self.extensions):
-            extensions = self.extensions(request, context)
-            if isawaitable(extensions):
-                extensions = await extensions  # type: ignore
-            return extensions
-        return self.extensions
+        Restricts HTTP cache policy of the response with policy of the query document
+        computed from `@cacheControl` directives.
+
+        Args:
+            request: The original request object.
+            cached_document: The parsed GraphQL query document.
+        """
+        if self.http_cache is None:
+            return
+
+        from ariadne_lambda.http_cache import get_cache_policy
+
+        cache_policy = get_cache_policy()
+        if cache_policy is not None:
+            static_cache_policy = self.http_cache.get_document_cache_policy(
+                self.schema,  # type: ignore
+                cached_document,
+            )
+            cache_policy.restrict(static_cache_policy.max_age, static_cache_policy.scope)
 
     async def create_json_response(
         self,
         request: Request,  # pylint: disable=unused-argument
-        result: dict,
+        result: dict | list,
         success: bool,
     ) -> Response:
         """
@@ -281,19 +786,87 @@ class GraphQLAWSAPIHTTPGatewayHandler(GraphQLLambdaHandler):
 
         Args:
             request: The original request object.
-            result: The result dictionary from GraphQL execution.
+            result: The result dictionary from GraphQL execution, or list of results
+                for batched operations.
             success: A boolean flag indicating if the query execution was successful.
 
         Returns:
             A `Response` object containing the JSON-formatted GraphQL result.
         """
         status_code = 200 if success else 400
-        return Response(
+        # results from the result cache are cached encoded
+        body: str | bytes | None = None
+        if self.result_cache is not None:
+            body = self.result_cache.get_body(result)
+        if body is None:
+            timer = get_phase_timer()
+            started = perf_counter_ns() if timer else 0
+            if self.response_compression:
+                # compression works on bytes, skip encoding result to intermediate str
+                body = self.json_codec.dumps_bytes(result)
+            else:
+                body = self.json_codec.dumps(result)
+            if timer:
+                timer.record("encode", started)
+        response = Response(
             status_code=status_code,
-            body=json.dumps(result),
+            body=body,
             headers={"Content-Type": "application/json"},
         )
 
+        if self.http_cache is None:
+            return response
+
+        from ariadne_lambda.http_cache import get_cache_policy
+
+        cache_policy = get_cache_policy()
+        if cache_policy is not None:
+            cacheable = success and isinstance(result, dict) and not result.get("errors")
+            return self.apply_http_cache(request, response, cache_policy, cacheable)
+        return response
+
+    def apply_http_cache(
+        self,
+        request: Request,
+        response: Response,
+        cache_policy: "CachePolicy",
+        cacheable: bool,
+    ) -> Response:
+        """
+        Sets caching headers of the query result's response.
+
+        Responses with body matching the `If-None-Match` request header are
+        replaced with `304 Not Modified` responses without body.
+
+        Args:
+            request: The original request object.
+            response: The response with JSON-formatted GraphQL result.
+            cache_policy: Cache policy restricted by the query and its resolvers.
+            cacheable: A boolean flag indicating if the result can be cached, `False`
+                for results with errors.
+
+        Returns:
+            A `Response` object with caching headers.
+        """
+        if self.http_cache.cache_control:  # type: ignore
+            if cacheable:
+                cache_control = cache_policy.get_cache_control_header()
+            else:
+                cache_control = "no-store"
+            response.headers["Cache-Control"] = cache_control
+
+        if self.http_cache.etag and response.status_code == 200:  # type: ignore
+            from ariadne_lambda.http_cache import get_etag, is_etag_matching
+
+            etag = get_etag(response.body)
+            response.headers["ETag"] = etag
+            if_none_match = request.headers.get("if-none-match")
+            if if_none_match and is_etag_matching(if_none_match, etag):
+                response.status_code = 304
+                response.body = ""
+
+        return response
+
     def handle_not_allowed_method(self, request: Request):
         """
         Generates a response for HTTP methods not supported by the GraphQL handler.
@@ -0,0 +1,132 @@
+import json
+from abc import ABC, abstractmethod
+from typing import Any
+
+
+class JSONCodec(ABC):
+    """Base class for JSON codecs used by handlers to decode requests and encode
+    responses.
+
+    `loads` implementations should raise `ValueError` or `TypeError` for invalid data.
+    """
+
+    name: str
+
+    @abstractmethod
+    def loads(self, data: str | bytes | bytearray) -> Any:
+        """Decode JSON document from `str`, `bytes` or `bytearray`."""
+
+    @abstractmethod
+    def dumps(self, obj: Any) -> str:
+        """Encode object to JSON `str`."""
+
+    def dumps_bytes(self, obj: Any) -> bytes:
+        """Encode object to UTF-8 encoded JSON `bytes`."""
+        return self.dumps(obj).encode("utf-8")
+
+
+class StdlibJSONCodec(JSONCodec):
+    """JSON codec using Python's `json` module."""
+
+    name = "json"
+
+    def loads(self, data: str | bytes | bytearray) -> Any:
+        return json.loads(data)
+
+    def dumps(self, obj: Any) -> str:
+        return json.dumps(obj)
+
+
+class OrjsonCodec(JSONCodec):
+    """JSON codec using `orjson` library. Encodes to `bytes` without intermediate `str`."""
+
+    name = "orjson"
+
+    def __init__(self) -> None:
+        import orjson
+
+        self._loads = orjson.loads
+        self._dumps = orjson.dumps
+
+    def loads(self, data: str | bytes | bytearray) -> Any:
+        return self._loads(data)
+
+    def dumps(self, obj: Any) -> str:
+        return self._dumps(obj).decode("utf-8")
+
+    def dumps_bytes(self, obj: Any) -> bytes:
+        return self._dumps(obj)
+
+
+class UjsonCodec(JSONCodec):
+    """JSON codec using `ujson` library."""
+
+    name = "ujson"
+
+    def __init__(self) -> None:
+        import ujson
+
+        self._loads = ujson.loads
+        self._dumps = ujson.dumps
+
+    def loads(self, data: str | bytes | bytearray) -> Any:
+        return self._loads(data)
+
+    def dumps(self, obj: Any) -> str:
+        return self._dumps(obj, ensure_ascii=False, escape_forward_slashes=False)
+
+
+class MsgspecCodec(JSONCodec):
+    """JSON codec using `msgspec` library. Encodes to `bytes` without intermediate
+    `str`."""
+
+    name = "msgspec"
+
+    def __init__(self) -> None:
+        import msgspec
+
+        self._decoder = msgspec.json.Decoder()
+        self._encoder = msgspec.json.Encoder()
+        self._decode_error = msgspec.DecodeError
+
+    def loads(self, data: str | bytes | bytearray) -> Any:
+        try:
+            return self._decoder.decode(data)
+        except self._decode_error as error:
+            raise ValueError(str(error)) from error
+
+    def dumps(self, obj: Any) -> str:
+        return self._encoder.encode(obj).decode("utf-8")
+
+    def dumps_bytes(self, obj: Any) -> bytes:
+        return self._encoder.encode(obj)
+
+
+JSON_CODECS: dict[str, type[JSONCodec]] = {
+    codec.name: codec for codec in (OrjsonCodec, MsgspecCodec, UjsonCodec, StdlibJSONCodec)
+}
+
+
+def get_json_codec(name: str = "auto") -> JSONCodec:
+    """Return JSON codec instance for the name.
+
+    For `auto` name returns the fastest codec which library is installed, falling
+    back to `StdlibJSONCodec`.
+
+    # Optional arguments
+
+    `name`: a `str` with codec name: `auto`, `orjson`, `msgspec`, `ujson` or `json`.
+    """
+    if name != "auto":
+        try:
+            return JSON_CODECS[name]()
+        except KeyError as error:
+            raise ValueError(f"Unknown JSON codec '{name}'") from error
+
+    for codec_class in JSON_CODECS.values():
+        try:
+            return codec_class()
+        except ImportError:
+            continue
+
+    return StdlibJSONCodec()
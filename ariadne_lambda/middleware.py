@@ -0,0 +1,78 @@
+from inspect import iscoroutinefunction
+from traceback import extract_stack
+from typing import TYPE_CHECKING, Any
+
+from ariadne.types import Resolver
+from graphql import GraphQLResolveInfo
+from graphql.pyutils import is_awaitable
+
+if TYPE_CHECKING:
+    from aws_lambda_powertools import Tracer
+
+
+def is_default_resolver(info: GraphQLResolveInfo) -> bool:
+    """Return `True` if field doesn't have its own resolver."""
+    field = info.parent_type.fields.get(info.field_name)
+    return field is None or field.resolve is None
+
+
+class TracingMiddleware:
+    """Middleware recording resolvers in AWS X-Ray subsegments of AWS Lambda
+    Powertools `Tracer`.
+
+    Subsegments are named after the resolved field (e.g. `## Query.user`) and
+    annotated with field's path. Resolvers' exceptions are added to subsegments.
+
+    # Required arguments
+
+    `tracer`: a `Tracer` instance from AWS Lambda Powertools.
+
+    # Optional arguments
+
+    `trace_default_resolvers`: a `bool` controlling if fields without their own
+    resolvers are traced. They only read attributes of their parents, so they are
+    not traced by default to avoid overhead of subsegments.
+    """
+
+    def __init__(self, tracer: "Tracer", *, trace_default_resolvers: bool = False) -> None:
+        self.tracer = tracer
+        self.trace_default_resolvers = trace_default_resolvers
+
+    def resolve(self, next_: Resolver, obj: Any, info: GraphQLResolveInfo, **kwargs) -> Any:
+        if info.field_name.startswith("__") or (
+            not self.trace_default_resolvers and is_default_resolver(info)
+        ):
+            return next_(obj, info, **kwargs)
+
+        name = f"## {info.parent_type.name}.{info.field_name}"
+        path = ".".join(str(key) for key in info.path.as_list())
+
+        if self.is_async_resolver(info):
+            # coroutine's code runs when it's awaited, so it's traced only then
+            result = next_(obj, info, **kwargs)
+        else:
+            with self.tracer.provider.in_subsegment(name=name) as subsegment:
+                subsegment.put_annotation("graphql_path", path)
+                try:
+                    result = next_(obj, info, **kwargs)
+                except Exception as error:
+                    subsegment.add_exception(error, extract_stack())
+                    raise
+
+        if not is_awaitable(result):
+            return result
+
+        async def await_result():
+            async with self.tracer.provider.in_subsegment_async(name=name) as subsegment:
+                subsegment.put_annotation("graphql_path", path)
+                try:
+                    return await result
+                except Exception as error:
+                    subsegment.add_exception(error, extract_stack())
+                    raise
+
+        return await_result()
+
+    def is_async_resolver(self, info: GraphQLResolveInfo) -> bool:
+        field = info.parent_type.fields.get(info.field_name)
+        return field is not None and iscoroutinefunction(field.resolve)
@@ -0,0 +1,203 @@
+import re
+from collections.abc import Iterator
+from tempfile import SpooledTemporaryFile
+from typing import IO, Any
+
+from ariadne.exceptions import HttpBadRequestError
+
+from ariadne_lambda.body import check_body_size, decode_base64_body
+from ariadne_lambda.exceptions import HttpPayloadTooLargeError
+
+INVALID_MULTIPART_MESSAGE = "Request body is not a valid multipart/form-data"
+
+HEADER_PARAM_RE = re.compile(r';\s*([\w*-]+)\s*=\s*(?:"((?:[^"\\]|\\.)*)"|([^;\s]*))')
+
+
+class UploadedFile:
+    """File uploaded in multipart request.
+
+    File contents are kept in memory when they are smaller than the parser's
+    `spool_max_size` and in temporary file otherwise.
+    """
+
+    __slots__ = ("filename", "content_type", "size", "file")
+
+    def __init__(
+        self,
+        filename: str,
+        content_type: str | None,
+        size: int,
+        file: IO[bytes],
+    ) -> None:
+        self.filename = filename
+        self.content_type = content_type
+        self.size = size
+        self.file = file
+
+    def read(self, size: int = -1) -> bytes:
+        return self.file.read(size)
+
+    def seek(self, offset: int) -> int:
+        return self.file.seek(offset)
+
+    def close(self) -> None:
+        self.file.close()
+
+    def __repr__(self) -> str:
+        return f"<UploadedFile {self.filename!r} ({self.size} bytes)>"
+
+
+def get_boundary(content_type: str) -> bytes:
+    """Return multipart boundary from the `Content-Type` header."""
+    for match in HEADER_PARAM_RE.finditer(content_type):
+        if match.group(1).lower() == "boundary":
+            boundary = match.group(2) if match.group(2) is not None else match.group(3)
+            if boundary:
+                return boundary.encode("latin-1")
+    raise HttpBadRequestError("Multipart request is missing boundary")
+
+
+def parse_part_headers(headers: bytes) -> tuple[dict[str, str], str | None]:
+    """Return `Content-Disposition` params and content type of the multipart part."""
+    disposition: dict[str, str] = {}
+    content_type = None
+    for line in headers.decode("utf-8", errors="replace").split("\r\n"):
+        name, _, value = line.partition(":")
+        name = name.strip().lower()
+        if name == "content-disposition":
+            for match in HEADER_PARAM_RE.finditer(value):
+                param_value = match.group(2) if match.group(2) is not None else match.group(3)
+                disposition[match.group(1).lower()] = param_value
+        elif name == "content-type":
+            content_type = value.strip()
+    return disposition, content_type
+
+
+def decode_field(content: memoryview) -> str:
+    """Return value of the form field, which must be UTF-8 encoded."""
+    try:
+        return str(content, "utf-8")
+    except UnicodeDecodeError as ex:
+        raise HttpBadRequestError(INVALID_MULTIPART_MESSAGE) from ex
+
+
+def iter_parts(
+    data: bytes | bytearray, view: memoryview, boundary: bytes
+) -> Iterator[tuple[bytes, memoryview]]:
+    """Yield headers and content of every part of multipart body.
+
+    Content is yielded as a slice of `view`, without copying it.
+    """
+    delimiter = b"\r\n--" + boundary
+    # first delimiter is not preceded by line break
+    position = data.find(delimiter[2:])
+    if position == -1:
+        raise HttpBadRequestError(INVALID_MULTIPART_MESSAGE)
+    position += len(delimiter) - 2
+
+    while data[position : position + 2] != b"--":
+        if data[position : position + 2] != b"\r\n":
+            raise HttpBadRequestError(INVALID_MULTIPART_MESSAGE)
+        headers_end = data.find(b"\r\n\r\n", position + 2)
+        if headers_end == -1:
+            raise HttpBadRequestError(INVALID_MULTIPART_MESSAGE)
+        content_end = data.find(delimiter, headers_end + 4)
+        if content_end == -1:
+            raise HttpBadRequestError(INVALID_MULTIPART_MESSAGE)
+
+        yield bytes(view[position + 2 : headers_end]), view[headers_end + 4 : content_end]
+        position = content_end + len(delimiter)
+
+
+class MultipartParser:
+    """Parser of `multipart/form-data` bodies of GraphQL multipart requests.
+
+    Parts are sliced from the body with `memoryview`, so file contents are copied
+    only once, into the file storage.
+
+    # Optional arguments
+
+    `max_file_size`: maximum size of single uploaded file in bytes, or `None`.
+
+    `max_total_size`: maximum size of the request body in bytes, or `None`.
+    Defaults to 6 MB, which is AWS Lambda's limit for synchronous invocation payload.
+
+    `spool_max_size`: size in bytes above which uploaded file is moved from memory
+    to temporary file.
+
+    `temp_dir`: directory for temporary files. `/tmp` is the only writable
+    location in AWS Lambda.
+    """
+
+    def __init__(
+        self,
+        *,
+        max_file_size: int | None = None,
+        max_total_size: int | None = 6 * 1024 * 1024,
+        spool_max_size: int = 1024 * 1024,
+        temp_dir: str = "/tmp",
+    ) -> None:
+        self.max_file_size = max_file_size
+        self.max_total_size = max_total_size
+        self.spool_max_size = spool_max_size
+        self.temp_dir = temp_dir
+
+    def decode_body(self, body: str, is_base64_encoded: bool) -> bytes | bytearray:
+        """Return request body as bytes, enforcing `max_total_size`."""
+        if is_base64_encoded:
+            return decode_base64_body(body, self.max_total_size)
+
+        check_body_size(body, self.max_total_size)
+        return body.encode("utf-8")
+
+    def parse(
+        self, data: bytes | bytearray, boundary: bytes
+    ) -> tuple[dict[str, str], dict[str, UploadedFile]]:
+        """Return `dict` with form fields and `dict` with uploaded files.
+
+        # Required arguments
+
+        `data`: multipart body.
+
+        `boundary`: multipart boundary from the `Content-Type` header.
+        """
+        fields: dict[str, str] = {}
+        files: dict[str, UploadedFile] = {}
+
+        with memoryview(data) as view:
+            try:
+                for headers, content in iter_parts(data, view, boundary):
+                    disposition, content_type = parse_part_headers(headers)
+                    name = disposition.get("name")
+                    if name is None:
+                        continue
+                    if "filename" in disposition:
+                        files[name] = self.create_uploaded_file(
+                            disposition["filename"], content_type, content
+                        )
+                    else:
+                        fields[name] = decode_field(content)
+            except BaseException:
+                for uploaded_file in files.values():
+                    uploaded_file.close()
+                raise
+
+        return fields, files
+
+    def create_uploaded_file(
+        self, filename: str, content_type: str | None, content: memoryview
+    ) -> UploadedFile:
+        """Return `UploadedFile` with the content, enforcing `max_file_size`."""
+        size = len(content)
+        if self.max_file_size is not None and size > self.max_file_size:
+            raise HttpPayloadTooLargeError(
+                f"Uploaded file '{filename}' exceeds maximum size of {self.max_file_size} bytes"
+            )
+
+        file: Any = SpooledTemporaryFile(max_size=self.spool_max_size, dir=self.temp_dir)
+        if size > self.spool_max_size:
+            # write large files directly to disk instead of buffering them in memory first
+            file.rollover()
+        file.write(content)
+        file.seek(0)
+        return UploadedFile(filename, content_type, size, file)
@@ -0,0 +1,294 @@
+import os
+import re
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from hashlib import sha256
+from typing import Protocol
+
+PERSISTED_QUERY_VERSION = 1
+PERSISTED_QUERY_HASH_RE = re.compile(r"[0-9a-f]{64}")
+
+
+class PersistedQueryError(Exception):
+    """Raised when Automatic Persisted Query could not be resolved.
+
+    Formatted as GraphQL error, so clients implementing Apollo's APQ protocol
+    can react to it.
+    """
+
+    message = "PersistedQueryError"
+    code = "PERSISTED_QUERY_ERROR"
+
+    def __init__(self, message: str | None = None) -> None:
+        super().__init__()
+        if message:
+            self.message = message
+
+    def format(self) -> dict:
+        return {"message": self.message, "extensions": {"code": self.code}}
+
+
+class PersistedQueryNotFoundError(PersistedQueryError):
+    """Raised when query for the hash is not stored. Client should retry sending
+    both the query and its hash."""
+
+    message = "PersistedQueryNotFound"
+    code = "PERSISTED_QUERY_NOT_FOUND"
+
+
+class PersistedQueryRegistrationError(PersistedQueryError):
+    """Raised when request registers a query, but only trusted documents can be
+    executed."""
+
+    message = "Persisted query registration is not allowed"
+    code = "PERSISTED_QUERY_REGISTRATION_NOT_ALLOWED"
+
+
+def get_query_hash(query: str) -> str:
+    """Return hex SHA-256 digest of the query, as computed by APQ clients."""
+    return sha256(query.encode("utf-8")).hexdigest()
+
+
+class PersistedQueryStore(ABC):
+    """Base class for Automatic Persisted Queries stores."""
+
+    @abstractmethod
+    async def get(self, query_hash: str) -> str | None:
+        """Return query text for the hash or `None` if it's not stored."""
+
+    @abstractmethod
+    async def set(self, query_hash: str, query: str) -> None:
+        """Store query text under the hash."""
+
+
+class InMemoryPersistedQueryStore(PersistedQueryStore):
+    """Persisted queries store keeping queries in process memory.
+
+    Queries are kept between warm invocations of the same Lambda container.
+
+    # Optional arguments
+
+    `max_size`: maximum number of queries to keep. Least recently used queries
+    are evicted first.
+
+    `max_memory`: maximum total size of kept queries in bytes.
+    """
+
+    def __init__(self, max_size: int = 1024, max_memory: int = 4 * 1024 * 1024) -> None:
+        self.max_size = max_size
+        self.max_memory = max_memory
+        self.memory = 0
+        self._queries: OrderedDict[str, str] = OrderedDict()
+
+    async def get(self, query_hash: str) -> str | None:
+        query = self._queries.get(query_hash)
+        if query is not None:
+            self._queries.move_to_end(query_hash)
+        return query
+
+    async def set(self, query_hash: str, query: str) -> None:
+        size = len(query.encode("utf-8"))
+        if size > self.max_memory:
+            return
+
+        previous_query = self._queries.pop(query_hash, None)
+        if previous_query is not None:
+            self.memory -= len(previous_query.encode("utf-8"))
+        self._queries[query_hash] = query
+        self.memory += size
+        while len(self._queries) > self.max_size or self.memory > self.max_memory:
+            _, evicted_query = self._queries.popitem(last=False)
+            self.memory -= len(evicted_query.encode("utf-8"))
+
+
+class FilePersistedQueryStore(PersistedQueryStore):
+    """Persisted queries store keeping every query in separate file.
+
+    Default directory is placed in `/tmp`, which is the only writable location in
+    AWS Lambda and survives re-initialization of handlers within same container.
+
+    Number and total size of stored files are limited, so clients registering
+    new queries can't fill Lambda's ephemeral storage. Files stored before the
+    store was created are listed on first write, oldest first, and least recently
+    used queries are deleted first.
+
+    # Optional arguments
+
+    `directory`: path to directory to store queries in. Created on first write.
+
+    `max_size`: maximum number of stored queries.
+
+    `max_bytes`: maximum total size of stored queries in bytes.
+    """
+
+    def __init__(
+        self,
+        directory: str = "/tmp/ariadne-lambda-persisted-queries",
+        max_size: int = 1024,
+        max_bytes: int = 16 * 1024 * 1024,
+    ) -> None:
+        self.directory = directory
+        self.max_size = max_size
+        self.max_bytes = max_bytes
+        self.bytes = 0
+        self._sizes: OrderedDict[str, int] | None = None
+
+    def get_path(self, query_hash: str) -> str:
+        return os.path.join(self.directory, f"{query_hash}.graphql")
+
+    def get_sizes(self) -> OrderedDict[str, int]:
+        """Return sizes of stored queries by their hashes, least recently used first.
+
+        Directory is listed once, ordering files by their modification time.
+        """
+        if self._sizes is None:
+            files = []
+            try:
+                with os.scandir(self.directory) as entries:
+                    for entry in entries:
+                        if entry.name.endswith(".graphql"):
+                            stat = entry.stat()
+                            files.append((stat.st_mtime, entry.name[:-8], stat.st_size))
+            except FileNotFoundError:
+                pass
+            files.sort()
+            self._sizes = OrderedDict((query_hash, size) for _, query_hash, size in files)
+            self.bytes = sum(self._sizes.values())
+        return self._sizes
+
+    async def get(self, query_hash: str) -> str | None:
+        try:
+            with open(self.get_path(query_hash), encoding="utf-8") as query_file:
+                query = query_file.read()
+        except FileNotFoundError:
+            return None
+        if self._sizes is not None and query_hash in self._sizes:
+            self._sizes.move_to_end(query_hash)
+        return query
+
+    async def set(self, query_hash: str, query: str) -> None:
+        from tempfile import NamedTemporaryFile
+
+        encoded_query = query.encode("utf-8")
+        if len(encoded_query) > self.max_bytes:
+            return
+
+        sizes = self.get_sizes()
+        os.makedirs(self.directory, exist_ok=True)
+        # write to temporary file first so concurrent readers never see partial query
+        with NamedTemporaryFile(dir=self.directory, delete=False) as query_file:
+            query_file.write(encoded_query)
+        os.replace(query_file.name, self.get_path(query_hash))
+
+        self.bytes += len(encoded_query) - sizes.pop(query_hash, 0)
+        sizes[query_hash] = len(encoded_query)
+        while len(sizes) > self.max_size or self.bytes > self.max_bytes:
+            evicted_hash, evicted_size = sizes.popitem(last=False)
+            self.bytes -= evicted_size
+            try:
+                os.remove(self.get_path(evicted_hash))
+            except FileNotFoundError:
+                pass
+
+
+class KeyValueClient(Protocol):
+    """Interface of external key-value store client (e.g. Redis, Memcached, DynamoDB
+    wrapper) used by `KeyValuePersistedQueryStore`."""
+
+    async def get(self, key: str) -> str | bytes | None: ...
+
+    async def set(self, key: str, value: str, ttl: int | None = None) -> None: ...
+
+
+class KeyValuePersistedQueryStore(PersistedQueryStore):
+    """Persisted queries store backed by external key-value store shared by all
+    Lambda containers.
+
+    # Required arguments
+
+    `client`: a `KeyValueClient` implementation.
+
+    # Optional arguments
+
+    `prefix`: a `str` prepended to query hashes to build store keys.
+
+    `ttl`: time in seconds after which stored query expires, or `None`.
+    """
+
+    def __init__(self, client: KeyValueClient, prefix: str = "apq:", ttl: int | None = None):
+        self.client = client
+        self.prefix = prefix
+        self.ttl = ttl
+
+    async def get(self, query_hash: str) -> str | None:
+        query = await self.client.get(self.prefix + query_hash)
+        if isinstance(query, bytes):
+            return query.decode("utf-8")
+        return query
+
+    async def set(self, query_hash: str, query: str) -> None:
+        await self.client.set(self.prefix + query_hash, query, self.ttl)
+
+
+def get_persisted_query_registration(data: dict) -> tuple[str, str] | None:
+    """Return hash and query registered by GraphQL data containing both the query
+    and its hash, or `None` if data doesn't register a persisted query.
+
+    Registered query should be stored with `PersistedQueryStore.set` only after
+    `resolve_persisted_query` checked its hash, and the query was parsed and
+    validated, so invalid queries are never stored.
+    """
+    extensions = data.get("extensions")
+    persisted_query = extensions.get("persistedQuery") if isinstance(extensions, dict) else None
+    query = data.get("query")
+    if not isinstance(persisted_query, dict) or not query or not isinstance(query, str):
+        return None
+    query_hash = persisted_query.get("sha256Hash")
+    if not isinstance(query_hash, str):
+        return None
+    return query_hash, query
+
+
+async def resolve_persisted_query(store: PersistedQueryStore, data: dict) -> dict:
+    """Resolve Apollo's Automatic Persisted Query in GraphQL data.
+
+    Returns GraphQL data with `query` filled from the store when request only
+    contains `extensions.persistedQuery.sha256Hash`. If request contains both query
+    and its hash, the hash is checked and data is returned unchanged. Query is not
+    stored, see `get_persisted_query_registration`.
+
+    Raises `PersistedQueryError` if persisted query extension is invalid and
+    `PersistedQueryNotFoundError` if query for the hash is not stored.
+
+    # Required arguments
+
+    `store`: a `PersistedQueryStore` to get and set queries.
+
+    `data`: GraphQL data from request.
+    """
+    extensions = data.get("extensions")
+    if not isinstance(extensions, dict):
+        return data
+
+    persisted_query = extensions.get("persistedQuery")
+    if not isinstance(persisted_query, dict):
+        return data
+
+    if persisted_query.get("version") != PERSISTED_QUERY_VERSION:
+        raise PersistedQueryError("Unsupported persisted query version")
+
+    query_hash = persisted_query.get("sha256Hash")
+    if not isinstance(query_hash, str) or not PERSISTED_QUERY_HASH_RE.fullmatch(query_hash):
+        raise PersistedQueryError("Invalid persisted query hash")
+
+    query = data.get("query")
+    if query and isinstance(query, str):
+        if get_query_hash(query) != query_hash:
+            raise PersistedQueryError("Provided sha does not match query")
+        return data
+
+    query = await store.get(query_hash)
+    if query is None:
+        raise PersistedQueryNotFoundError()
+
+    return {**data, "query": query}
@@ -0,0 +1,212 @@
+from asyncio import AbstractEventLoop, Lock, get_running_loop
+from collections.abc import Awaitable, Callable, Mapping, Sequence
+from inspect import isawaitable
+from logging import getLogger
+from time import monotonic
+from typing import Any
+
+LifespanHook = Callable[[], Any]
+
+
+async def call_maybe_async(function: Callable, *args: Any) -> Any:
+    result = function(*args)
+    if isawaitable(result):
+        result = await result
+    return result
+
+
+class Resource:
+    """Async resource kept for the lifetime of the Lambda container, e.g. database
+    connection pool or HTTP client.
+
+    Resource is created on first use, or on application's startup, and reused by
+    following invocations. After it wasn't used for `health_check_interval`
+    seconds, e.g. because the container was frozen in between invocations, its
+    health is checked before it's returned, and unhealthy resource is closed and
+    created again. Resource is also created again when it's used from a different
+    event loop than the one it was created in. Resource from the previous loop is
+    closed if its close method is synchronous, otherwise a warning is logged, as
+    it can't be awaited outside of its loop.
+
+    # Required arguments
+
+    `factory`: a callable returning the resource, or an awaitable resolving to it.
+
+    # Optional arguments
+
+    `close`: a callable closing the resource, called with the resource.
+    Defaults to resource's `aclose` or `close` method, if it has one.
+
+    `health_check`: a callable called with the resource, returning `False` or
+    raising an exception if resource can't be used anymore.
+
+    `health_check_interval`: time in seconds after which unused resource's health
+    is checked.
+    """
+
+    def __init__(
+        self,
+        factory: Callable[[], Any],
+        *,
+        close: Callable[[Any], Any] | None = None,
+        health_check: Callable[[Any], bool | Awaitable[bool]] | None = None,
+        health_check_interval: float = 30.0,
+    ) -> None:
+        self.factory = factory
+        self.close_resource = close
+        self.health_check = health_check
+        self.health_check_interval = health_check_interval
+
+        self.value: Any = None
+        self.created = False
+        self.last_used = 0.0
+        self.loop: AbstractEventLoop | None = None
+        self._lock: Lock | None = None
+
+    async def get(self) -> Any:
+        """Return the resource, creating it if it doesn't exist or isn't healthy."""
+        loop = get_running_loop()
+        if self.created and self.loop is loop and not self.is_idle():
+            self.last_used = monotonic()
+            return self.value
+
+        if self._lock is None or self.loop is not loop:
+            # locks can't be shared between event loops
+            self._lock = Lock()
+            if self.loop is not loop:
+                self.discard()
+                self.loop = loop
+
+        async with self._lock:
+            if self.created and self.is_idle() and not await self.is_healthy():
+                await self.close()
+            if not self.created:
+                self.value = await call_maybe_async(self.factory)
+                self.created = True
+            self.last_used = monotonic()
+            return self.value
+
+    def is_idle(self) -> bool:
+        return (
+            self.health_check is not None
+            and monotonic() - self.last_used >= self.health_check_interval
+        )
+
+    async def is_healthy(self) -> bool:
+        try:
+            return bool(await call_maybe_async(self.health_check, self.value))  # type: ignore
+        except Exception:  # pylint: disable=broad-except
+            getLogger("ariadne").warning("Health check of resource failed", exc_info=True)
+            return False
+
+    def get_close(self, value: Any) -> tuple[Callable | None, tuple]:
+        """Return callable closing the resource and its arguments."""
+        if self.close_resource is not None:
+            return self.close_resource, (value,)
+        return getattr(value, "aclose", None) or getattr(value, "close", None), ()
+
+    async def close(self) -> None:
+        """Close the resource if it was created. Errors are logged and ignored."""
+        if not self.created:
+            return
+
+        value, self.value, self.created = self.value, None, False
+        close, args = self.get_close(value)
+        if close is None:
+            return
+
+        try:
+            await call_maybe_async(close, *args)
+        except Exception:  # pylint: disable=broad-except
+            getLogger("ariadne").warning("Resource could not be closed", exc_info=True)
+
+    def discard(self) -> None:
+        """Close the resource created in another event loop without awaiting it.
+
+        Awaitable returned by async close method is discarded, as it can't be
+        awaited outside of the resource's loop, and a warning is logged.
+        """
+        if not self.created:
+            return
+
+        value, self.value, self.created = self.value, None, False
+        close, args = self.get_close(value)
+        if close is None:
+            return
+
+        try:
+            result = close(*args)
+        except Exception:  # pylint: disable=broad-except
+            getLogger("ariadne").warning("Resource could not be closed", exc_info=True)
+            return
+        if isawaitable(result):
+            if hasattr(result, "close"):
+                # avoids warning about coroutine that was never awaited
+                result.close()
+            getLogger("ariadne").warning(
+                "Resource created in another event loop could not be closed"
+            )
+
+
+class Resources:
+    """Container-scoped resources and lifecycle hooks of the application.
+
+    Available to resolvers in the `resources` key of the `dict` context:
+
+    ```python
+    pool = await info.context["resources"].get("db")
+    ```
+
+    # Optional arguments
+
+    `resources`: a `dict` with names of resources as keys and `Resource`
+    instances as values.
+
+    `on_startup`: callables run once, after the resources are created, before the
+    first invocation.
+
+    `on_shutdown`: callables run when the application is shut down, before the
+    resources are closed.
+    """
+
+    def __init__(
+        self,
+        resources: Mapping[str, Resource] | None = None,
+        *,
+        on_startup: Sequence[LifespanHook] = (),
+        on_shutdown: Sequence[LifespanHook] = (),
+    ) -> None:
+        self.resources = dict(resources or {})
+        self.on_startup = list(on_startup)
+        self.on_shutdown = list(on_shutdown)
+        self.started = False
+
+    def __contains__(self, name: str) -> bool:
+        return name in self.resources
+
+    async def get(self, name: str) -> Any:
+        """Return the resource with the name.
+
+        Raises `KeyError` if resource with the name is not configured.
+        """
+        return await self.resources[name].get()
+
+    async def startup(self) -> None:
+        """Create the resources and run startup hooks. Runs only once."""
+        if self.started:
+            return
+        for resource in self.resources.values():
+            await resource.get()
+        for hook in self.on_startup:
+            await call_maybe_async(hook)
+        self.started = True
+
+    async def shutdown(self) -> None:
+        """Run shutdown hooks and close the resources in reverse order."""
+        try:
+            for hook in self.on_shutdown:
+                await call_maybe_async(hook)
+        finally:
+            for resource in reversed(self.resources.values()):
+                await resource.close()
+            self.started = False
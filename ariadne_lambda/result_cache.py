@@ -0,0 +1,268 @@
+import json
+from asyncio import Task, ensure_future, shield
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable, Collection
+from hashlib import blake2b
+from time import monotonic
+from typing import Any
+
+from ariadne.types import GraphQLResult
+from graphql import DocumentNode, OperationType, get_operation_ast
+
+from ariadne_lambda.http_cache import CachePolicy, cache_policy_var, get_cache_policy
+from ariadne_lambda.json_codec import JSONCodec, StdlibJSONCodec
+from ariadne_lambda.timing import get_phase_timer
+
+
+class ResultCache:
+    """Bounded TTL and LRU cache of GraphQL query results.
+
+    Lives on the handler, so its entries survive across warm Lambda invocations.
+    Only results of queries without errors are cached. Concurrent executions of
+    the same query are collapsed into single execution.
+
+    Results are cached with their JSON encoded data, which is returned in
+    responses instead of encoding the result again.
+
+    # Optional arguments
+
+    `ttl`: time in seconds after which cached result expires.
+
+    `max_size`: maximum number of cached results.
+
+    `max_memory`: approximate maximum memory in bytes used by cached results,
+    estimated from the size of their JSON encoded data.
+
+    `vary_headers`: names of request headers (lowercase) which values are part
+    of the cache key, e.g. `("authorization", "accept-language")`.
+
+    `vary_context_keys`: keys of the context value `dict` which values are part
+    of the cache key, e.g. `("user_id",)`.
+
+    `shared`: set to `True` to share cached results between all requests, when
+    neither `vary_headers` nor `vary_context_keys` are set. Required, so results
+    of resolvers depending on the user aren't returned to other users by mistake.
+    """
+
+    def __init__(
+        self,
+        *,
+        ttl: float = 60,
+        max_size: int = 1024,
+        max_memory: int = 8 * 1024 * 1024,
+        vary_headers: Collection[str] = (),
+        vary_context_keys: Collection[str] = (),
+        shared: bool = False,
+        clock: Callable[[], float] = monotonic,
+    ) -> None:
+        if not vary_headers and not vary_context_keys and not shared:
+            raise ValueError(
+                "ResultCache requires vary_headers or vary_context_keys, or shared=True "
+                "to share cached results between all requests."
+            )
+
+        self.ttl = ttl
+        self.max_size = max_size
+        self.max_memory = max_memory
+        self.vary_headers = tuple(vary_headers)
+        self.vary_context_keys = tuple(vary_context_keys)
+        self.clock = clock
+
+        self.hits = 0
+        self.misses = 0
+        self.memory = 0
+        self._entries: OrderedDict[bytes, tuple[float, GraphQLResult, bytes, CachePolicy]] = (
+            OrderedDict()
+        )
+        self._keys_by_data: dict[int, bytes] = {}
+        self._pending: dict[bytes, Task[tuple[GraphQLResult, CachePolicy]]] = {}
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, key: bytes) -> bool:
+        return key in self._entries
+
+    def is_cacheable(self, document: DocumentNode, data: dict) -> bool:
+        """Return `True` if operation to execute from the document is a query."""
+        operation = get_operation_ast(document, data.get("operationName"))
+        return operation is not None and operation.operation == OperationType.QUERY
+
+    def get_key(self, data: dict, headers: dict[str, str], context_value: Any) -> bytes:
+        """Return cache key for the GraphQL data, request headers and context."""
+        context_values = None
+        if self.vary_context_keys and isinstance(context_value, dict):
+            context_values = [context_value.get(key) for key in self.vary_context_keys]
+        key_data = [
+            data.get("query"),
+            data.get("operationName"),
+            data.get("variables"),
+            [headers.get(header) for header in self.vary_headers],
+            context_values,
+        ]
+        serialized = json.dumps(key_data, sort_keys=True, default=str)
+        return blake2b(serialized.encode("utf-8"), digest_size=16).digest()
+
+    def get(self, key: bytes) -> GraphQLResult | None:
+        entry = self.get_entry(key)
+        return entry[0] if entry else None
+
+    def get_entry(self, key: bytes) -> tuple[GraphQLResult, CachePolicy] | None:
+        """Return cached result with the cache hints set by its resolvers."""
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        expires_at, result, _, cache_hints = entry
+        if expires_at <= self.clock():
+            self.remove(key)
+            return None
+        self._entries.move_to_end(key)
+        return result, cache_hints
+
+    def get_body(self, data: Any) -> bytes | None:
+        """Return JSON encoded data of the cached result, or `None` if data is not
+        from the cache."""
+        key = self._keys_by_data.get(id(data))
+        entry = self._entries.get(key) if key is not None else None
+        if entry is None or entry[1][1] is not data:
+            return None
+        return entry[2]
+
+    def set(
+        self,
+        key: bytes,
+        result: GraphQLResult,
+        cache_hints: CachePolicy | None = None,
+        body: bytes | None = None,
+    ) -> None:
+        """Cache the result with its JSON encoded data, encoded with standard
+        library's `json` if `body` is not passed."""
+        if body is None:
+            body = StdlibJSONCodec().dumps_bytes(result[1])
+        if len(body) > self.max_memory:
+            return
+
+        self.remove(key)
+        self._entries[key] = (self.clock() + self.ttl, result, body, cache_hints or CachePolicy())
+        self._keys_by_data[id(result[1])] = key
+        self.memory += len(body)
+        while len(self._entries) > self.max_size or self.memory > self.max_memory:
+            self.remove(next(iter(self._entries)))
+
+    def remove(self, key: bytes) -> None:
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self._keys_by_data.pop(id(entry[1][1]), None)
+            self.memory -= len(entry[2])
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self._keys_by_data.clear()
+        self.memory = 0
+
+    def stats(self) -> dict[str, float]:
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_ratio": self.hits / lookups if lookups else 0.0,
+            "size": len(self._entries),
+            "memory": self.memory,
+        }
+
+    async def get_or_execute(
+        self,
+        key: bytes,
+        execute: Callable[[], Awaitable[GraphQLResult]],
+        json_codec: JSONCodec | None = None,
+    ) -> GraphQLResult:
+        """Return cached result for the key, or execute the query and cache its result.
+
+        If the same query is already being executed, its result is awaited instead
+        of executing the query again. Query is executed in a separate task, so
+        cancelling the request that started it, e.g. at its deadline, doesn't
+        cancel other requests awaiting its result.
+
+        Cache hints set by resolvers with `set_cache_hint` are cached with the result
+        and restrict cache policy of the requests it's returned for, as its
+        resolvers are not executed again.
+
+        # Required arguments
+
+        `key`: a cache key returned by `get_key`.
+
+        `execute`: a callable returning awaitable with query's `GraphQLResult`.
+
+        # Optional arguments
+
+        `json_codec`: a `JSONCodec` encoding cached results, the handler's codec.
+        Defaults to standard library's `json`.
+        """
+        entry = self.get_entry(key)
+        if entry is None and key in self._pending:
+            entry = await shield(self._pending[key])
+        if entry is not None:
+            self.hits += 1
+            self.record_metrics(hit=True)
+            result, cache_hints = entry
+            restrict_cache_policy(cache_hints)
+            return result
+
+        self.misses += 1
+        # resolvers' hints are collected separately from the request's cache policy,
+        # also when request is not cacheable, so they can be cached with the result
+        token = cache_policy_var.set(CachePolicy())
+        try:
+            # task runs in the copy of the current context, with the hints' policy
+            task = ensure_future(self.execute_and_set(key, execute, json_codec))
+        finally:
+            cache_policy_var.reset(token)
+        task.add_done_callback(retrieve_task_exception)
+        self._pending[key] = task
+
+        result, cache_hints = await shield(task)
+        restrict_cache_policy(cache_hints)
+        self.record_metrics(hit=False)
+        return result
+
+    async def execute_and_set(
+        self,
+        key: bytes,
+        execute: Callable[[], Awaitable[GraphQLResult]],
+        json_codec: JSONCodec | None,
+    ) -> tuple[GraphQLResult, CachePolicy]:
+        """Execute the query and cache its result if it has no errors."""
+        cache_hints = get_cache_policy() or CachePolicy()
+        try:
+            result = await execute()
+            success, data = result
+            if success and isinstance(data, dict) and not data.get("errors"):
+                body = (json_codec or StdlibJSONCodec()).dumps_bytes(data)
+                self.set(key, result, cache_hints, body)
+            return result, cache_hints
+        finally:
+            del self._pending[key]
+
+    def record_metrics(self, hit: bool) -> None:
+        """Record cache statistics in the current invocation's metrics."""
+        timer = get_phase_timer()
+        if timer is None:
+            return
+
+        stats = self.stats()
+        timer.add_metric("ResultCacheHit", int(hit), "Count")
+        timer.add_metric("ResultCacheHitRatio", stats["hit_ratio"] * 100, "Percent")
+        timer.add_metric("ResultCacheMemory", stats["memory"], "Bytes")
+
+
+def retrieve_task_exception(task: Task) -> None:
+    """Mark exception of the task as retrieved when no request awaits its result."""
+    if not task.cancelled():
+        task.exception()
+
+
+def restrict_cache_policy(cache_hints: CachePolicy) -> None:
+    """Restrict cache policy of the current request with the result's cache hints."""
+    cache_policy = get_cache_policy()
+    if cache_policy is not None:
+        cache_policy.restrict(cache_hints.max_age, cache_hints.scope)
@@ -1,68 +1,123 @@
-from typing import Any, Literal
+from typing import Any
 
-from pydantic import BaseModel
 
+class Request:
+    """HTTP request read from API Gateway (v1 and v2) or Application Load Balancer event.
 
-class Request(BaseModel):
-    event: dict[str, Any]
+    Event is not copied nor validated. Request attributes are read from the event on
+    first access and cached, so handling request only pays for the data it uses.
+    """
 
-    path: str
-    method: Literal["DELETE", "GET", "HEAD", "OPTIONS", "PATCH", "POST", "PUT"]
+    __slots__ = ("event", "_path", "_method", "_body", "_headers", "_params")
 
-    body: str
-    is_base64_encoded: bool
+    def __init__(self, event: dict[str, Any]) -> None:
+        self.event = event
+        self._path: str | None = None
+        self._method: str | None = None
+        self._body: str | None = None
+        self._headers: dict[str, str] | None = None
+        self._params: dict[str, str] | None = None
 
-    headers: dict[str, str]
-    params: dict[str, str]
+    @classmethod
+    def create_from_event(cls, event: dict[str, Any]) -> "Request":
+        return cls(event)
 
     @property
     def route_key(self):
         return f"{self.method} {self.path}"
 
-    @classmethod
-    def create_from_event(cls, event: dict[str, Any]) -> "Request":
-        # this is needed for API Gateway V1 when header keys comes capitalized
-        # but on API Gateway V2 it comes as lowered
-        lowered_key_headers = {key.lower(): value for key, value in event["headers"].items()}
-        request_data = {
-            "event": event,
-            "body": "",
-            "is_base64_encoded": event["isBase64Encoded"],
-            "headers": lowered_key_headers,
-            "params": event["queryStringParameters"],
-        }
+    @property
+    def path(self) -> str:
+        if self._path is None:
+            if http_context := self.event["requestContext"].get("http"):
+                # Api Gateway V2
+                self._path = http_context["path"]
+            else:
+                # API Gateway V1
+                # Application Load Balancer
+                self._path = self.event["path"]
+        return self._path  # type: ignore
+
+    @path.setter
+    def path(self, value: str) -> None:
+        self._path = value
 
-        if http_context := event["requestContext"].get("http"):
-            # Api Gateway V2
-            request_data["path"] = http_context["path"]
-            request_data["method"] = http_context["method"].upper()
+    @property
+    def method(self) -> str:
+        if self._method is None:
+            if http_context := self.event["requestContext"].get("http"):
+                # Api Gateway V2
+                self._method = http_context["method"].upper()
+            else:
+                # API Gateway V1
+                # Application Load Balancer
+                self._method = self.event["httpMethod"].upper()
+        return self._method  # type: ignore
+
+    @method.setter
+    def method(self, value: str) -> None:
+        self._method = value
 
-        else:
-            # API Gateway V1
-            # Application Load Balancer
-            request_data["path"] = event["path"]
-            request_data["method"] = event["httpMethod"].upper()
+    @property
+    def body(self) -> str:
+        if self._body is None:
+            self._body = self.event.get("body") or ""
+        return self._body
 
-        if body := event["body"]:
-            request_data["body"] = body
+    @body.setter
+    def body(self, value: str) -> None:
+        self._body = value
 
-        if not request_data["params"]:
-            request_data["params"] = {}
+    @property
+    def is_base64_encoded(self) -> bool:
+        return bool(self.event.get("isBase64Encoded"))
 
-        return cls(**request_data)
+    @property
+    def headers(self) -> dict[str, str]:
+        if self._headers is None:
+            headers = self.event.get("headers") or {}
+            if self.event.get("version") == "2.0":
+                # API Gateway V2 sends lowercased header names
+                self._headers = headers
+            else:
+                # this is needed for API Gateway V1 when header keys comes capitalized
+                self._headers = {key.lower(): value for key, value in headers.items()}
+        return self._headers
+
+    @headers.setter
+    def headers(self, value: dict[str, str]) -> None:
+        self._headers = value
+
+    @property
+    def params(self) -> dict[str, str]:
+        if self._params is None:
+            self._params = self.event.get("queryStringParameters") or {}
+        return self._params
+
+    @params.setter
+    def params(self, value: dict[str, str]) -> None:
+        self._params = value
 
 
 class Response:
     status_code: int
-    body: str
+    body: str | bytes
     headers: dict
+    is_base64_encoded: bool
 
-    def __init__(self, status_code: int = 200, body: str = "", headers: dict | None = None):
+    def __init__(
+        self,
+        status_code: int = 200,
+        body: str | bytes = "",
+        headers: dict | None = None,
+        is_base64_encoded: bool = False,
+    ):
         self.status_code = status_code
         self.body = body
         if not headers:
             headers = {}
         self.headers = headers
+        self.is_base64_encoded = is_base64_encoded
 
     def __iter__(self):
         yield "statusCode", self.status_code
@@ -70,8 +125,14 @@ class Response:
         yield "headers", self.headers
 
     def render(self) -> dict:
-        return {
+        body = self.body
+        if isinstance(body, bytes):
+            body = body.decode("utf-8")
+        rendered = {
             "statusCode": self.status_code,
-            "body": self.body,
+            "body": body,
             "headers": self.headers,
         }
+        if self.is_base64_encoded:
+            rendered["isBase64Encoded"] = True
+        return rendered
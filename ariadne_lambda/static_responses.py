@@ -0,0 +1,182 @@
+import json
+from base64 import b64encode
+from collections import OrderedDict
+from hashlib import blake2b
+from typing import TYPE_CHECKING, Any
+
+from graphql import (
+    DocumentNode,
+    FieldNode,
+    GraphQLError,
+    GraphQLSchema,
+    get_operation_ast,
+    parse,
+    print_schema,
+)
+
+from ariadne_lambda.http_cache import get_etag, is_etag_matching
+from ariadne_lambda.schema import Response
+
+if TYPE_CHECKING:
+    from ariadne_lambda.compression import ResponseCompression
+
+
+class StaticBody:
+    """Response body encoded once, with its ETag and compressed variants.
+
+    Compressed variants are kept base64 encoded, ready to be returned in responses.
+    """
+
+    __slots__ = ("body", "etag", "compressed")
+
+    def __init__(
+        self, body: str | bytes, response_compression: "ResponseCompression | None" = None
+    ) -> None:
+        if isinstance(body, str):
+            body = body.encode("utf-8")
+        self.body = body
+        self.etag = get_etag(body)
+        self.compressed: dict[str, str] = {}
+        if response_compression is not None and len(body) >= response_compression.min_size:
+            for encoding, compressor in response_compression.compressors.items():
+                compressed_body = compressor.compress(body)
+                if len(compressed_body) < len(body):
+                    self.compressed[encoding] = b64encode(compressed_body).decode("ascii")
+
+    def create_response(
+        self,
+        request_headers: dict[str, str],
+        content_type: str,
+        response_compression: "ResponseCompression | None" = None,
+    ) -> Response:
+        """Return response with the body, negotiating its encoding from request's
+        `Accept-Encoding` header.
+
+        Returns `304 Not Modified` response if request's `If-None-Match` header
+        matches the body's ETag.
+        """
+        headers = {"Content-Type": content_type, "ETag": self.etag}
+        if response_compression is not None:
+            headers["Vary"] = "Accept-Encoding"
+
+        if_none_match = request_headers.get("if-none-match")
+        if if_none_match and is_etag_matching(if_none_match, self.etag):
+            return Response(status_code=304, headers=headers)
+
+        accept_encoding = request_headers.get("accept-encoding")
+        if response_compression is not None and self.compressed and accept_encoding:
+            compressor = response_compression.negotiate(accept_encoding)
+            if compressor is not None and compressor.encoding in self.compressed:
+                headers["Content-Encoding"] = compressor.encoding
+                return Response(
+                    body=self.compressed[compressor.encoding],
+                    headers=headers,
+                    is_base64_encoded=True,
+                )
+
+        return Response(body=self.body, headers=headers)
+
+
+def is_introspection_document(document: DocumentNode, operation_name: str | None) -> bool:
+    """Return `True` if operation to execute only selects introspection fields."""
+    operation = get_operation_ast(document, operation_name)
+    if operation is None:
+        return False
+    return all(
+        isinstance(selection, FieldNode) and selection.name.value.startswith("__")
+        for selection in operation.selection_set.selections
+    )
+
+
+class StaticResponses:
+    """Precomputed responses of GraphQL explorer and introspection queries.
+
+    Explorer's HTML is rendered once per container. Results of introspection
+    queries are cached by schema hash and query, so tools polling the schema don't
+    execute the introspection. Both are stored encoded and compressed, and returned
+    with ETags.
+
+    # Optional arguments
+
+    `explorer`: a `bool` controlling if explorer's response is precomputed.
+    Explorer's HTML must not depend on the request.
+
+    `introspection`: a `bool` controlling if introspection results are cached.
+
+    `max_introspection_results`: maximum number of cached introspection results,
+    for different queries and variables.
+    """
+
+    def __init__(
+        self,
+        *,
+        explorer: bool = True,
+        introspection: bool = True,
+        max_introspection_results: int = 16,
+    ) -> None:
+        self.explorer = explorer
+        self.introspection = introspection
+        self.max_introspection_results = max_introspection_results
+
+        self.explorer_body: StaticBody | None = None
+        self.introspection_bodies: OrderedDict[tuple, StaticBody] = OrderedDict()
+        self._schema_hashes: dict[int, str] = {}
+
+    def get_schema_hash(self, schema: GraphQLSchema) -> str:
+        """Return hash of the schema's SDL, computed once per schema."""
+        schema_hash = self._schema_hashes.get(id(schema))
+        if schema_hash is None:
+            sdl = print_schema(schema).encode("utf-8")
+            schema_hash = blake2b(sdl, digest_size=16).hexdigest()
+            self._schema_hashes = {id(schema): schema_hash}
+        return schema_hash
+
+    def get_introspection_key(self, schema: GraphQLSchema, data: Any) -> tuple | None:
+        """Return key of the introspection result for the GraphQL data, or `None`
+        if data can't be an introspection query."""
+        if not self.introspection or not isinstance(data, dict):
+            return None
+        query = data.get("query")
+        if not isinstance(query, str) or ("__schema" not in query and "__type" not in query):
+            return None
+        variables = data.get("variables")
+        return (
+            self.get_schema_hash(schema),
+            query,
+            data.get("operationName"),
+            json.dumps(variables, sort_keys=True) if variables else None,
+        )
+
+    def get_introspection_body(self, key: tuple) -> StaticBody | None:
+        body = self.introspection_bodies.get(key)
+        if body is not None:
+            self.introspection_bodies.move_to_end(key)
+        return body
+
+    def set_introspection_body(
+        self,
+        key: tuple,
+        result: dict,
+        body: str | bytes,
+        response_compression: "ResponseCompression | None" = None,
+        document: DocumentNode | None = None,
+    ) -> StaticBody | None:
+        """Store encoded result of the query if it's a successful introspection query.
+
+        Query is parsed to check it, unless its already parsed `document` is passed,
+        e.g. from the document cache.
+        """
+        if result.get("errors"):
+            return None
+        if document is None:
+            try:
+                document = parse(key[1], no_location=True)
+            except GraphQLError:
+                return None
+        if not is_introspection_document(document, key[2]):
+            return None
+        static_body = StaticBody(body, response_compression)
+        self.introspection_bodies[key] = static_body
+        while len(self.introspection_bodies) > self.max_introspection_results:
+            self.introspection_bodies.popitem(last=False)
+        return static_body
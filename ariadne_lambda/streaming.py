@@ -0,0 +1,85 @@
+import json
+from base64 import b64decode
+from collections.abc import Iterator
+from typing import Any, Protocol
+
+from ariadne_lambda.json_codec import JSONCodec
+
+# Separates JSON with status code and headers from the body in streamed responses
+PRELUDE_DELIMITER = b"\x00" * 8
+
+STREAM_CHUNK_SIZE = 64 * 1024
+
+# Depth of nested lists and objects encoded separately, deeper values are encoded
+# whole by JSON codec. Depth of 4 splits lists of objects in root fields of the result.
+STREAM_ENCODING_DEPTH = 4
+
+
+class StreamWriter(Protocol):
+    """Interface of response stream of AWS Lambda response streaming.
+
+    Methods may return awaitables, which are awaited by the application.
+    """
+
+    def write(self, data: bytes) -> Any: ...
+
+    def close(self) -> Any: ...
+
+
+def encode_prelude(status_code: int, headers: dict[str, str]) -> bytes:
+    """Return HTTP response prelude of the Lambda Function URL streamed response."""
+    prelude = {"statusCode": status_code, "headers": headers, "cookies": []}
+    return json.dumps(prelude).encode("utf-8") + PRELUDE_DELIMITER
+
+
+def iter_json_parts(json_codec: JSONCodec, value: Any, depth: int) -> Iterator[bytes]:
+    """Yield parts of JSON representation of the value, encoding lists and objects
+    nested up to the `depth` item by item."""
+    if depth <= 0 or not value or not isinstance(value, dict | list):
+        yield json_codec.dumps_bytes(value)
+    elif isinstance(value, dict):
+        separator = b"{"
+        for key, item in value.items():
+            yield separator + json_codec.dumps_bytes(key) + b":"
+            yield from iter_json_parts(json_codec, item, depth - 1)
+            separator = b","
+        yield b"}"
+    else:
+        separator = b"["
+        for item in value:
+            yield separator
+            yield from iter_json_parts(json_codec, item, depth - 1)
+            separator = b","
+        yield b"]"
+
+
+def encode_json_chunks(
+    json_codec: JSONCodec,
+    value: Any,
+    chunk_size: int = STREAM_CHUNK_SIZE,
+    depth: int = STREAM_ENCODING_DEPTH,
+) -> Iterator[bytes]:
+    """Yield JSON representation of the value in chunks of at least `chunk_size`
+    bytes, except the last one.
+
+    Whole representation is never held in memory, so large results can be streamed
+    without copying them into single buffer.
+    """
+    buffer = bytearray()
+    for part in iter_json_parts(json_codec, value, depth):
+        buffer += part
+        if len(buffer) >= chunk_size:
+            yield bytes(buffer)
+            buffer.clear()
+    if buffer:
+        yield bytes(buffer)
+
+
+def iter_rendered_response(response: dict) -> Iterator[bytes]:
+    """Yield prelude and body of the response rendered by the handler."""
+    yield encode_prelude(response["statusCode"], response.get("headers") or {})
+    body = response.get("body") or ""
+    if response.get("isBase64Encoded"):
+        yield b64decode(body)
+    elif body:
+        yield body.encode("utf-8") if isinstance(body, str) else body
@@ -0,0 +1,152 @@
+import json
+import time
+from collections.abc import Callable
+from contextvars import ContextVar
+from time import perf_counter_ns
+from typing import Any
+
+phase_timer_var: ContextVar["PhaseTimer | None"] = ContextVar("phase_timer", default=None)
+
+# Set to False once first invocation in the container starts
+_cold_start = True
+
+
+def is_cold_start() -> bool:
+    """Return `True` for the first invocation in the Lambda container."""
+    global _cold_start
+    cold_start = _cold_start
+    _cold_start = False
+    return cold_start
+
+
+def get_phase_timer() -> "PhaseTimer | None":
+    """Return timer of the current invocation, or `None` if timing is disabled."""
+    return phase_timer_var.get()
+
+
+class PhaseTimer:
+    """Collects durations of the invocation's phases using monotonic clock.
+
+    Durations of phases recorded multiple times (e.g. by batched operations)
+    are summed. Other components can report additional metrics of the invocation
+    with `add_metric`.
+    """
+
+    __slots__ = ("started", "phases", "metrics", "operation_name", "cold_start")
+
+    def __init__(self, cold_start: bool = False) -> None:
+        self.started = perf_counter_ns()
+        self.phases: dict[str, int] = {}
+        self.metrics: dict[str, tuple[float, str]] = {}
+        self.operation_name: str | None = None
+        self.cold_start = cold_start
+
+    def record(self, phase: str, started: int) -> None:
+        """Record phase that started at `started` time from `perf_counter_ns` and
+        ends now."""
+        duration = perf_counter_ns() - started
+        self.phases[phase] = self.phases.get(phase, 0) + duration
+
+    def add_metric(self, name: str, value: float, unit: str = "None") -> None:
+        """Add metric with CloudWatch unit, replacing previous value of the metric."""
+        self.metrics[name] = (value, unit)
+
+    def set_operation_name(self, data: Any) -> None:
+        """Set name of the invocation's operation from GraphQL data, unless it's
+        already set."""
+        if self.operation_name is None and isinstance(data, dict):
+            self.operation_name = data.get("operationName")
+
+    def finish(self) -> None:
+        """Record total duration of the invocation."""
+        self.phases["total"] = perf_counter_ns() - self.started
+
+    def get_durations_ms(self) -> dict[str, float]:
+        """Return a `dict` with phases durations in milliseconds."""
+        return {phase: duration / 1_000_000 for phase, duration in self.phases.items()}
+
+    def get_server_timing_header(self) -> str:
+        """Return value for the `Server-Timing` HTTP header."""
+        return ", ".join(
+            f"{phase};dur={duration:.3f}" for phase, duration in self.get_durations_ms().items()
+        )
+
+
+class Timing:
+    """Configuration of per-phase timing instrumentation of invocations.
+
+    # Optional arguments
+
+    `server_timing`: a `bool` controlling if durations are returned to client in
+    the `Server-Timing` header of HTTP responses.
+
+    `emf`: a `bool` controlling if durations are logged as CloudWatch Embedded Metric
+    Format log lines, creating CloudWatch metrics without API calls.
+
+    `namespace`: a `str` with CloudWatch metrics namespace.
+
+    `dimensions`: names of dimensions metrics are tagged with. Supported dimensions
+    are `OperationName` and `ColdStart`.
+
+    `emit`: a callable writing EMF log line to the function's log. Defaults to `print`.
+    """
+
+    def __init__(
+        self,
+        *,
+        server_timing: bool = True,
+        emf: bool = True,
+        namespace: str = "AriadneLambda",
+        dimensions: tuple[str, ...] = ("OperationName", "ColdStart"),
+        emit: Callable[[str], None] = print,
+    ) -> None:
+        self.server_timing = server_timing
+        self.emf = emf
+        self.namespace = namespace
+        self.dimensions = dimensions
+        self.emit = emit
+
+    def start(self):
+        """Start timer for the invocation and set it as current timer.
+
+        Returns token to pass to `stop`.
+        """
+        return phase_timer_var.set(PhaseTimer(is_cold_start()))
+
+    def stop(self, token) -> PhaseTimer:
+        """Finish current timer and reset the current timer to previous value.
+
+        Emits EMF log line if enabled and returns the finished timer.
+        """
+        timer = phase_timer_var.get()
+        phase_timer_var.reset(token)
+        timer.finish()  # type: ignore
+        if self.emf:
+            self.emit(self.format_emf(timer))  # type: ignore
+        return timer  # type: ignore
+
+    def format_emf(self, timer: PhaseTimer) -> str:
+        """Return CloudWatch Embedded Metric Format log line with phases durations."""
+        durations = timer.get_durations_ms()
+        properties = {
+            "OperationName": timer.operation_name or "anonymous",
+            "ColdStart": "true" if timer.cold_start else "false",
+        }
+        metrics = [{"Name": f"{phase}Time", "Unit": "Milliseconds"} for phase in durations]
+        metrics += [{"Name": name, "Unit": unit} for name, (_, unit) in timer.metrics.items()]
+        log = {
+            "_aws": {
+                "Timestamp": int(time.time() * 1000),
+                "CloudWatchMetrics": [
+                    {
+                        "Namespace": self.namespace,
+                        "Dimensions": [list(self.dimensions)],
+                        "Metrics": metrics,
+                    }
+                ],
+            },
+            **properties,
+            **{f"{phase}Time": duration for phase, duration in durations.items()},
+            **{name: value for name, (value, _) in timer.metrics.items()},
+        }
+        return json.dumps(log)
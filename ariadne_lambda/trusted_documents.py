@@ -0,0 +1,398 @@
+"""Trusted documents allowlist and the CLI building its manifest.
+
+Manifest is built from client sources with:
+
+    python -m ariadne_lambda.trusted_documents src/ -o trusted-documents.pickle \
+        --operation-ids operation-ids.json
+
+Manifest with `.json` extension is written as `{id: document}` JSON object, and
+manifest with `.pickle` extension additionally contains parsed documents, so they
+are not parsed again when the manifest is loaded. Documents ids are hashes of
+normalized documents, which clients can't compute from their sources, so clients
+look them up by operation name in the map saved with `--operation-ids`.
+"""
+
+import json
+import os
+from collections.abc import Iterable, Iterator, Mapping, Sequence
+from hashlib import sha256
+from typing import Any
+
+from ariadne.graphql import validate_query
+from ariadne.types import QueryValidator, ValidationRules
+from graphql import (
+    DocumentNode,
+    FragmentDefinitionNode,
+    FragmentSpreadNode,
+    GraphQLError,
+    GraphQLSchema,
+    OperationDefinitionNode,
+    parse,
+    print_ast,
+    visit,
+)
+from graphql.language import Visitor
+
+from ariadne_lambda.cache import DOCUMENT_SIZE_FACTOR, CachedDocument
+
+MANIFEST_VERSION = 1
+
+# Extensions of files scanned for GraphQL documents
+GRAPHQL_FILE_EXTENSIONS = (".graphql", ".gql")
+SOURCE_FILE_EXTENSIONS = (".js", ".jsx", ".ts", ".tsx", ".mjs", ".cjs", ".vue", ".svelte")
+
+# Template literals tagged with `gql` or `graphql`, or passed to `gql()` or `graphql()`
+TAGGED_TEMPLATE_PATTERN = r"\b(?:gql|graphql)\s*(?:\(\s*)?`([^`]*)`"
+
+
+class TrustedDocumentError(Exception):
+    """Raised when request doesn't execute a trusted document.
+
+    Formatted as GraphQL error in the result.
+    """
+
+    message = "Only trusted documents can be executed"
+    code = "TRUSTED_DOCUMENT_REQUIRED"
+
+    def __init__(self, message: str | None = None) -> None:
+        super().__init__()
+        if message:
+            self.message = message
+
+    def format(self) -> dict:
+        return {"message": self.message, "extensions": {"code": self.code}}
+
+
+class TrustedDocumentNotFoundError(TrustedDocumentError):
+    """Raised when document with the requested id is not in the manifest."""
+
+    message = "Trusted document not found"
+    code = "TRUSTED_DOCUMENT_NOT_FOUND"
+
+
+def get_document_id(document: str) -> str:
+    """Return id of the document, a `sha256:` prefixed hex SHA-256 digest of its text."""
+    return "sha256:" + sha256(document.encode("utf-8")).hexdigest()
+
+
+class TrustedDocuments:
+    """Allowlist of GraphQL documents known at build time.
+
+    Documents are parsed and validated once when the handler is configured. Requests
+    must reference documents by their id in the `documentId` key, or the hash of
+    Apollo's `persistedQuery` extension, and can't execute other queries. Trusted
+    documents are never parsed or validated during invocations.
+
+    # Required arguments
+
+    `documents`: a `dict` with documents ids as keys and documents texts, or tuples
+    of text and parsed `DocumentNode`, as values.
+    """
+
+    def __init__(self, documents: Mapping[str, str | tuple[str, DocumentNode]]) -> None:
+        self.documents: dict[str, str] = {}
+        self.parsed_documents: dict[str, DocumentNode] = {}
+        for document_id, document in documents.items():
+            if isinstance(document, tuple):
+                document, self.parsed_documents[document_id] = document
+            self.documents[document_id] = document
+
+        # keyed by the same document text objects resolved into requests' data,
+        # which hashes are cached by the interpreter
+        self.cached_documents: dict[str, CachedDocument] = {}
+
+    def __len__(self) -> int:
+        return len(self.documents)
+
+    @classmethod
+    def from_file(cls, path: str) -> "TrustedDocuments":
+        """Load trusted documents from JSON or pickle manifest."""
+        return cls(load_manifest(path))
+
+    def prepare(
+        self,
+        schema: GraphQLSchema,
+        validation_rules: ValidationRules | None = None,
+        introspection: bool = True,
+        query_validator: QueryValidator | None = None,
+    ) -> None:
+        """Parse and validate all documents.
+
+        Validation is skipped when `validation_rules` are a callable, as they may
+        depend on the request.
+
+        Raises `ValueError` if any document is not valid.
+        """
+        self.cached_documents = {}
+        for document_id, document in self.documents.items():
+            parsed_document = self.parsed_documents.get(document_id)
+            if parsed_document is None:
+                try:
+                    parsed_document = parse(document)
+                except GraphQLError as error:
+                    raise ValueError(
+                        f"Trusted document {document_id} could not be parsed: {error.message}"
+                    ) from error
+
+            validation_errors = None
+            if not callable(validation_rules):
+                validation_errors = validate_query(
+                    schema,
+                    parsed_document,
+                    validation_rules,
+                    enable_introspection=introspection,
+                    query_validator=query_validator,
+                )
+                if validation_errors:
+                    raise ValueError(
+                        f"Trusted document {document_id} is not valid: "
+                        f"{validation_errors[0].message}"
+                    )
+
+            self.cached_documents[document] = CachedDocument(
+                parsed_document, validation_errors, len(document) * DOCUMENT_SIZE_FACTOR
+            )
+
+    def resolve(self, data: Any) -> Any:
+        """Return GraphQL data with `query` set to the requested trusted document.
+
+        Raises `TrustedDocumentError` if data doesn't reference a document and
+        `TrustedDocumentNotFoundError` if referenced document is not trusted.
+        """
+        if not isinstance(data, dict):
+            return data
+
+        document_id = self.get_requested_document_id(data)
+        if document_id is None:
+            raise TrustedDocumentError()
+
+        document = self.documents.get(document_id)
+        if document is None:
+            document = self.documents.get(f"sha256:{document_id}")
+        if document is None:
+            raise TrustedDocumentNotFoundError()
+
+        return {**data, "query": document}
+
+    def get_requested_document_id(self, data: dict) -> str | None:
+        document_id = data.get("documentId")
+        if isinstance(document_id, str):
+            return document_id
+
+        extensions = data.get("extensions")
+        if isinstance(extensions, dict) and isinstance(extensions.get("persistedQuery"), dict):
+            query_hash = extensions["persistedQuery"].get("sha256Hash")
+            if isinstance(query_hash, str):
+                return query_hash
+        return None
+
+    def get_cached_document(self, query: Any) -> CachedDocument | None:
+        """Return parsed and validated trusted document for the query text."""
+        if not isinstance(query, str):
+            return None
+        return self.cached_documents.get(query)
+
+
+def load_manifest(path: str) -> dict[str, str | tuple[str, DocumentNode]]:
+    """Load documents from the manifest.
+
+    Supports JSON objects with documents ids as keys and documents as values,
+    Apollo's persisted query manifests, and pickle manifests written by
+    `save_manifest`. Pickle manifests must only be loaded from trusted locations,
+    like the deployment package.
+    """
+    if path.endswith((".pickle", ".pkl")):
+        import pickle
+
+        with open(path, "rb") as manifest_file:
+            manifest = pickle.load(manifest_file)
+        if manifest.get("version") != MANIFEST_VERSION:
+            raise ValueError(f"Unsupported trusted documents manifest version in {path}")
+        return manifest["documents"]
+
+    with open(path, encoding="utf-8") as manifest_file:
+        manifest = json.load(manifest_file)
+    if manifest.get("format") == "apollo-persisted-query-manifest":
+        return {operation["id"]: operation["body"] for operation in manifest["operations"]}
+    return manifest
+
+
+def save_manifest(path: str, documents: Mapping[str, str]) -> None:
+    """Save documents to the manifest.
+
+    Manifest with `.pickle` or `.pkl` extension also stores parsed documents,
+    otherwise it's saved as JSON.
+    """
+    if path.endswith((".pickle", ".pkl")):
+        import pickle
+
+        manifest = {
+            "version": MANIFEST_VERSION,
+            "documents": {
+                document_id: (document, parse(document))
+                for document_id, document in documents.items()
+            },
+        }
+        with open(path, "wb") as manifest_file:
+            pickle.dump(manifest, manifest_file, protocol=pickle.HIGHEST_PROTOCOL)
+    else:
+        with open(path, "w", encoding="utf-8") as manifest_file:
+            json.dump(documents, manifest_file, indent=2, sort_keys=True)
+
+
+def iter_source_files(paths: Iterable[str]) -> Iterator[str]:
+    """Yield paths of GraphQL and JavaScript/TypeScript files in the paths."""
+    extensions = GRAPHQL_FILE_EXTENSIONS + SOURCE_FILE_EXTENSIONS
+    for path in paths:
+        if os.path.isfile(path):
+            yield path
+            continue
+        for directory, dirnames, filenames in os.walk(path):
+            dirnames[:] = sorted(name for name in dirnames if name != "node_modules")
+            for filename in sorted(filenames):
+                if filename.endswith(extensions):
+                    yield os.path.join(directory, filename)
+
+
+def extract_graphql_sources(path: str) -> list[str]:
+    """Return GraphQL sources from the file.
+
+    GraphQL files are returned whole. From other files, template literals tagged
+    with `gql` or `graphql` are returned, unless they contain interpolations.
+    """
+    with open(path, encoding="utf-8") as source_file:
+        source = source_file.read()
+    if path.endswith(GRAPHQL_FILE_EXTENSIONS):
+        return [source]
+
+    import re
+
+    return [
+        template
+        for template in re.findall(TAGGED_TEMPLATE_PATTERN, source)
+        if "${" not in template
+    ]
+
+
+class FragmentSpreadsVisitor(Visitor):
+    def __init__(self) -> None:
+        super().__init__()
+        self.names: set[str] = set()
+
+    def enter_fragment_spread(self, node: FragmentSpreadNode, *_) -> None:
+        self.names.add(node.name.value)
+
+
+def get_used_fragments(
+    node: OperationDefinitionNode | FragmentDefinitionNode,
+    fragments: Mapping[str, FragmentDefinitionNode],
+) -> list[FragmentDefinitionNode]:
+    """Return fragments used by the operation, including nested ones, sorted by name."""
+    used: dict[str, FragmentDefinitionNode] = {}
+    pending = [node]
+    while pending:
+        visitor = FragmentSpreadsVisitor()
+        visit(pending.pop(), visitor)
+        for name in visitor.names:
+            if name not in used and name in fragments:
+                used[name] = fragments[name]
+                pending.append(fragments[name])
+    return [used[name] for name in sorted(used)]
+
+
+def extract_documents(sources: Iterable[str]) -> dict[str, str]:
+    """Return trusted documents with operations from the GraphQL sources.
+
+    Every operation becomes separate document, containing the fragments it uses.
+    Fragments can be defined in any of the sources.
+    """
+    operations: list[OperationDefinitionNode] = []
+    fragments: dict[str, FragmentDefinitionNode] = {}
+    for source in sources:
+        for definition in parse(source, no_location=True).definitions:
+            if isinstance(definition, OperationDefinitionNode):
+                operations.append(definition)
+            elif isinstance(definition, FragmentDefinitionNode):
+                fragments[definition.name.value] = definition
+
+    documents = {}
+    for operation in operations:
+        document = "\n\n".join(
+            print_ast(definition)
+            for definition in [operation, *get_used_fragments(operation, fragments)]
+        )
+        documents[get_document_id(document)] = document
+    return documents
+
+
+def get_operation_ids(documents: Mapping[str, str]) -> dict[str, str]:
+    """Return ids of documents by names of their operations.
+
+    Anonymous operations are skipped. Raises `ValueError` if documents with
+    different ids contain operations with the same name.
+    """
+    operation_ids: dict[str, str] = {}
+    for document_id, document in documents.items():
+        for definition in parse(document, no_location=True).definitions:
+            if not isinstance(definition, OperationDefinitionNode) or not definition.name:
+                continue
+            name = definition.name.value
+            if operation_ids.setdefault(name, document_id) != document_id:
+                raise ValueError(f"Operation {name} is defined in more than one document")
+    return operation_ids
+
+
+def main(argv: Sequence[str] | None = None) -> None:
+    import argparse
+    import sys
+
+    parser = argparse.ArgumentParser(
+        prog="python -m ariadne_lambda.trusted_documents",
+        description="Extract GraphQL operations from client sources into trusted "
+        "documents manifest.",
+    )
+    parser.add_argument(
+        "paths",
+        nargs="+",
+        help="GraphQL or JavaScript/TypeScript files, directories to scan, or existing "
+        "manifests (.json, .pickle) to merge",
+    )
+    parser.add_argument(
+        "-o",
+        "--output",
+        required=True,
+        help="path of the manifest, saved as pickle with parsed documents when it has "
+        ".pickle extension and as JSON otherwise",
+    )
+    parser.add_argument(
+        "--operation-ids",
+        help="path of JSON file mapping operations names to ids of their documents, "
+        "for clients to send in requests",
+    )
+    args = parser.parse_args(argv)
+
+    documents: dict[str, str] = {}
+    sources = []
+    for path in args.paths:
+        if path.endswith((".json", ".pickle", ".pkl")):
+            for document_id, document in load_manifest(path).items():
+                documents[document_id] = document[0] if isinstance(document, tuple) else document
+        else:
+            for source_path in iter_source_files([path]):
+                sources.extend(extract_graphql_sources(source_path))
+
+    documents.update(extract_documents(sources))
+    if args.operation_ids:
+        try:
+            operation_ids = get_operation_ids(documents)
+        except ValueError as error:
+            parser.error(str(error))
+        with open(args.operation_ids, "w", encoding="utf-8") as operation_ids_file:
+            json.dump(operation_ids, operation_ids_file, indent=2, sort_keys=True)
+
+    save_manifest(args.output, documents)
+    sys.stderr.write(f"Saved {len(documents)} trusted documents to {args.output}\n")
+
+
+if __name__ == "__main__":
+    main()
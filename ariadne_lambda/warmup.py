@@ -0,0 +1,125 @@
+from collections.abc import Iterable
+from time import perf_counter_ns
+from typing import TYPE_CHECKING, Any
+
+from graphql import GraphQLError, OperationType, get_operation_ast, parse
+
+if TYPE_CHECKING:
+    from ariadne_lambda.base import GraphQLLambdaHandler
+
+
+class WarmupOperationReport:
+    """Duration and number of errors of the operation executed by warm-up."""
+
+    __slots__ = ("name", "duration_ms", "errors")
+
+    def __init__(self, name: str, duration_ms: float, errors: int) -> None:
+        self.name = name
+        self.duration_ms = duration_ms
+        self.errors = errors
+
+
+class WarmupReport:
+    """Duration of the warm-up and its operations."""
+
+    __slots__ = ("duration_ms", "operations")
+
+    def __init__(self, duration_ms: float, operations: list[WarmupOperationReport]) -> None:
+        self.duration_ms = duration_ms
+        self.operations = operations
+
+    def as_dict(self) -> dict:
+        """Return report as `dict` suitable for structured logging."""
+        return {
+            "duration_ms": self.duration_ms,
+            "operations": [
+                {
+                    "name": operation.name,
+                    "duration_ms": operation.duration_ms,
+                    "errors": operation.errors,
+                }
+                for operation in self.operations
+            ],
+        }
+
+
+def get_warmup_data(handler: "GraphQLLambdaHandler", operation: str | dict) -> tuple[str, dict]:
+    """Return name and GraphQL data of the warm-up operation.
+
+    Raises `ValueError` if operation is not a query, as warm-up must not have
+    side effects.
+    """
+    data = {"query": operation} if isinstance(operation, str) else operation
+    query = data.get("query")
+    if query is None and handler.trusted_documents is not None:
+        query = handler.trusted_documents.resolve(data)["query"]
+    if not isinstance(query, str):
+        raise ValueError("Warm-up operation must have a query or trusted document id")
+
+    try:
+        document = parse(query, no_location=True)
+    except GraphQLError as error:
+        raise ValueError(f"Warm-up operation could not be parsed: {error.message}") from error
+
+    operation_ast = get_operation_ast(document, data.get("operationName"))
+    if operation_ast is None:
+        raise ValueError("Warm-up operation could not be found in the document")
+    if operation_ast.operation != OperationType.QUERY:
+        raise ValueError(
+            f"Warm-up operations must be queries, got {operation_ast.operation.value}"
+        )
+    return (operation_ast.name.value if operation_ast.name else "anonymous"), data
+
+
+async def warmup(
+    handler: "GraphQLLambdaHandler",
+    operations: Iterable[str | dict],
+    context_value: Any = None,
+) -> WarmupReport:
+    """Execute operations with the handler, filling its caches before the first
+    invocation.
+
+    Operations are executed with synthetic request from the handler's
+    `create_warmup_request` and stub context. Result cache is not used, so results
+    of stub context are never returned to clients.
+
+    # Required arguments
+
+    `handler`: a configured `GraphQLLambdaHandler`.
+
+    `operations`: queries as `str`, or `dict`s with `query`, `variables` and
+    `operationName` keys. Operations from trusted documents can be referenced
+    with `documentId` key.
+
+    # Optional arguments
+
+    `context_value`: context value for the operations. Defaults to `dict` with
+    the synthetic `request` and `warmup` key set to `True`, so resolvers can skip
+    their side effects.
+    """
+    started = perf_counter_ns()
+    prepared = [get_warmup_data(handler, operation) for operation in operations]
+
+    reports = []
+    for name, data in prepared:
+        operation_started = perf_counter_ns()
+        request = handler.create_warmup_request(data)
+        context = context_value
+        if context is None:
+            context = {"request": request, "warmup": True}
+        if isinstance(context, dict):
+            context = handler.add_invocation_state_to_context(context)
+
+        _, result = await handler.execute_graphql_query(
+            request, data, context_value=context, use_result_cache=False
+        )
+        handler.json_codec.dumps_bytes(result)
+        reports.append(
+            WarmupOperationReport(
+                name,
+                (perf_counter_ns() - operation_started) / 1_000_000,
+                len(result.get("errors") or ()),
+            )
+        )
+
+    return WarmupReport((perf_counter_ns() - started) / 1_000_000, reports)
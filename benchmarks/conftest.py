@@ -0,0 +1,17 @@
+import pytest
+
+from ariadne_lambda.event_loop import EventLoopRunner
+from ariadne_lambda.graphql import GraphQLLambda
+from benchmarks.schema import schema
+
+
+@pytest.fixture(scope="session")
+def runner():
+    runner = EventLoopRunner()
+    yield runner
+    runner.close()
+
+
+@pytest.fixture(scope="session")
+def graphql_app():
+    return GraphQLLambda(schema)
@@ -0,0 +1,53 @@
+import random
+import string
+
+random.seed(0)
+
+
+def random_text(length: int) -> str:
+    return "".join(random.choices(string.ascii_letters + " ", k=length))
+
+
+def product(index: int) -> dict:
+    return {
+        "id": f"UHJvZHVjdDo{index}",
+        "name": random_text(24),
+        "slug": f"product-{index}",
+        "description": random_text(400),
+        "rating": round(random.uniform(0, 5), 2),
+        "isAvailable": random.random() > 0.2,
+        "thumbnail": {
+            "url": f"https://cdn.example.com/products/{index}/thumbnail.png",
+            "alt": None,
+        },
+        "pricing": {
+            "currency": "USD",
+            "gross": round(random.uniform(1, 1000), 2),
+            "net": round(random.uniform(1, 1000), 2),
+            "discount": None,
+        },
+        "attributes": [
+            {"name": random_text(8), "values": [random_text(6) for _ in range(3)]}
+            for _ in range(5)
+        ],
+        "variants": [
+            {"id": f"UHJvZHVjdFZhcmlhbnQ6{index}{variant}", "sku": f"{index}-{variant}"}
+            for variant in range(4)
+        ],
+    }
+
+
+def products_result(count: int) -> dict:
+    """Return GraphQL result shaped like a paginated product catalog query."""
+    return {
+        "data": {
+            "products": {
+                "totalCount": count,
+                "pageInfo": {"hasNextPage": True, "endCursor": "YXJyYXljb25uZWN0aW9uOjk5"},
+                "edges": [{"node": product(index)} for index in range(count)],
+            }
+        }
+    }
+
+
+RESULT_SIZES = {"small": 1, "medium": 50, "large": 300}
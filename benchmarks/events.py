@@ -0,0 +1,149 @@
+"""Generators of AWS Lambda events as sent by API Gateway and Application Load Balancer."""
+
+import json
+from urllib.parse import urlencode
+
+COMMON_HEADERS = {
+    "Accept": "application/json",
+    "Accept-Encoding": "gzip, deflate, br",
+    "Content-Type": "application/json",
+    "Host": "api.example.com",
+    "User-Agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36",
+}
+
+
+def create_headers(count: int) -> dict[str, str]:
+    """Return realistic headers, padded with tracing and forwarding headers to
+    the requested count."""
+    headers = dict(list(COMMON_HEADERS.items())[:count])
+    for index in range(count - len(headers)):
+        headers[f"X-Amzn-Trace-Id-{index}"] = f"Root=1-67891233-abcdef012345678912345678;{index}"
+    return headers
+
+
+def create_body(query: str, variables: dict | None = None, padding: int = 0) -> str:
+    """Return JSON body with GraphQL operation. `padding` adds a variable of given size,
+    simulating large inputs."""
+    variables = dict(variables or {})
+    if padding:
+        variables["padding"] = "x" * padding
+    return json.dumps({"query": query, "variables": variables})
+
+
+def api_gateway_v1_event(
+    body: str = "",
+    headers: dict[str, str] | None = None,
+    method: str = "POST",
+    params: dict[str, str] | None = None,
+) -> dict:
+    """Return API Gateway REST API (payload format 1.0) event."""
+    headers = headers or {}
+    return {
+        "resource": "/graphql",
+        "path": "/graphql",
+        "httpMethod": method,
+        "headers": headers,
+        "multiValueHeaders": {key: [value] for key, value in headers.items()},
+        "queryStringParameters": params,
+        "multiValueQueryStringParameters": (
+            {key: [value] for key, value in params.items()} if params else None
+        ),
+        "pathParameters": None,
+        "stageVariables": None,
+        "requestContext": {
+            "resourceId": "abc123",
+            "resourcePath": "/graphql",
+            "httpMethod": method,
+            "extendedRequestId": "request-id",
+            "requestTime": "09/Apr/2015:12:34:56 +0000",
+            "path": "/prod/graphql",
+            "accountId": "123456789012",
+            "protocol": "HTTP/1.1",
+            "stage": "prod",
+            "domainPrefix": "api",
+            "requestTimeEpoch": 1428582896000,
+            "requestId": "c6af9ac6-7b61-11e6-9a41-93e8deadbeef",
+            "identity": {
+                "sourceIp": "127.0.0.1",
+                "userAgent": headers.get("User-Agent"),
+            },
+            "domainName": "api.example.com",
+            "apiId": "1234567890",
+        },
+        "body": body or None,
+        "isBase64Encoded": False,
+    }
+
+
+def api_gateway_v2_event(
+    body: str = "",
+    headers: dict[str, str] | None = None,
+    method: str = "POST",
+    params: dict[str, str] | None = None,
+) -> dict:
+    """Return API Gateway HTTP API (payload format 2.0) event."""
+    headers = {key.lower(): value for key, value in (headers or {}).items()}
+    event = {
+        "version": "2.0",
+        "routeKey": "$default",
+        "rawPath": "/graphql",
+        "rawQueryString": urlencode(params or {}),
+        "headers": headers,
+        "requestContext": {
+            "accountId": "123456789012",
+            "apiId": "api-id",
+            "domainName": "api.example.com",
+            "domainPrefix": "api",
+            "http": {
+                "method": method,
+                "path": "/graphql",
+                "protocol": "HTTP/1.1",
+                "sourceIp": "127.0.0.1",
+                "userAgent": headers.get("user-agent"),
+            },
+            "requestId": "id",
+            "routeKey": "$default",
+            "stage": "$default",
+            "time": "12/Mar/2020:19:03:58 +0000",
+            "timeEpoch": 1583348638390,
+        },
+        "isBase64Encoded": False,
+    }
+    if params:
+        event["queryStringParameters"] = params
+    if body:
+        event["body"] = body
+    return event
+
+
+def alb_event(
+    body: str = "",
+    headers: dict[str, str] | None = None,
+    method: str = "POST",
+    params: dict[str, str] | None = None,
+) -> dict:
+    """Return Application Load Balancer event."""
+    headers = {key.lower(): value for key, value in (headers or {}).items()}
+    return {
+        "requestContext": {
+            "elb": {
+                "targetGroupArn": (
+                    "arn:aws:elasticloadbalancing:us-east-1:123456789012:"
+                    "targetgroup/lambda-279XGJDqGZ5rsrHC2Fjr/49e9d65c45c6791a"
+                )
+            }
+        },
+        "httpMethod": method,
+        "path": "/graphql",
+        "queryStringParameters": params or {},
+        "headers": headers,
+        "body": body,
+        "isBase64Encoded": False,
+    }
+
+
+EVENT_FACTORIES = {
+    "v1": api_gateway_v1_event,
+    "v2": api_gateway_v2_event,
+    "alb": alb_event,
+}
@@ -0,0 +1,115 @@
+from ariadne import QueryType, gql, make_executable_schema
+
+from benchmarks.data import product
+
+type_defs = gql(
+    """
+    type Query {
+        hello: String!
+        products(first: Int!, padding: String): ProductConnection!
+    }
+
+    type ProductConnection {
+        totalCount: Int!
+        pageInfo: PageInfo!
+        edges: [ProductEdge!]!
+    }
+
+    type PageInfo {
+        hasNextPage: Boolean!
+        endCursor: String
+    }
+
+    type ProductEdge {
+        node: Product!
+    }
+
+    type Product {
+        id: ID!
+        name: String!
+        slug: String!
+        description: String!
+        rating: Float!
+        isAvailable: Boolean!
+        thumbnail: Image
+        pricing: Pricing!
+        attributes: [Attribute!]!
+        variants: [Variant!]!
+    }
+
+    type Image {
+        url: String!
+        alt: String
+    }
+
+    type Pricing {
+        currency: String!
+        gross: Float!
+        net: Float!
+        discount: Float
+    }
+
+    type Attribute {
+        name: String!
+        values: [String!]!
+    }
+
+    type Variant {
+        id: ID!
+        sku: String!
+    }
+    """
+)
+
+query = QueryType()
+PRODUCTS = [product(index) for index in range(1000)]
+
+
+@query.field("hello")
+def resolve_hello(*_):
+    return "Hello world!"
+
+
+@query.field("products")
+def resolve_products(*_, first: int, padding: str | None = None):
+    return {
+        "totalCount": len(PRODUCTS),
+        "pageInfo": {"hasNextPage": first < len(PRODUCTS), "endCursor": str(first)},
+        "edges": [{"node": node} for node in PRODUCTS[:first]],
+    }
+
+
+schema = make_executable_schema(type_defs, query)
+
+QUERIES = {
+    "simple": "query Hello { hello }",
+    "flat": """
+        query Products($first: Int!, $padding: String) {
+            products(first: $first, padding: $padding) {
+                edges { node { id name slug } }
+            }
+        }
+    """,
+    "nested": """
+        query Products($first: Int!, $padding: String) {
+            products(first: $first, padding: $padding) {
+                totalCount
+                pageInfo { hasNextPage endCursor }
+                edges { node { ...ProductDetails } }
+            }
+        }
+
+        fragment ProductDetails on Product {
+            id
+            name
+            slug
+            description
+            rating
+            isAvailable
+            thumbnail { url alt }
+            pricing { currency gross net discount }
+            attributes { name values }
+            variants { id sku }
+        }
+    """,
+}
@@ -0,0 +1,50 @@
+import asyncio
+
+import pytest
+from graphql import GraphQLSchema
+
+from ariadne_lambda.base import GraphQLLambdaHandler
+from ariadne_lambda.graphql import GraphQLLambda
+
+EVENT = {"httpMethod": "POST", "body": "{}", "headers": {}}
+
+
+class NoopHandler(GraphQLLambdaHandler):
+    async def handle(self, event, context):
+        await asyncio.sleep(0)
+        return {"statusCode": 200}
+
+
+@pytest.fixture
+def graphql_app():
+    return GraphQLLambda(GraphQLSchema(), http_handler=NoopHandler())
+
+
+def test_as_handler(benchmark, graphql_app):
+    handler = graphql_app.as_handler()
+    benchmark.group = "invocation-overhead"
+    benchmark(handler, EVENT, None)
+    graphql_app.event_loop_runner.close()
+
+
+def test_as_handler_uvloop(benchmark, graphql_app):
+    pytest.importorskip("uvloop")
+    handler = graphql_app.as_handler(use_uvloop=True)
+    benchmark.group = "invocation-overhead"
+    benchmark(handler, EVENT, None)
+    graphql_app.event_loop_runner.close()
+
+
+def test_asyncio_run(benchmark, graphql_app):
+    def handler(event, context):
+        return asyncio.run(graphql_app(event, context))
+
+    benchmark.group = "invocation-overhead"
+    benchmark(handler, EVENT, None)
+
+
+def test_async_to_sync(benchmark, graphql_app):
+    asgiref_sync = pytest.importorskip("asgiref.sync")
+    handler = asgiref_sync.async_to_sync(graphql_app)
+    benchmark.group = "invocation-overhead"
+    benchmark(handler, EVENT, None)
@@ -0,0 +1,98 @@
+"""End to end and per phase benchmarks of handling API Gateway and ALB events.
+
+Save results for comparison between releases with:
+
+    hatch run bench:run --benchmark-autosave
+    hatch run bench:compare
+"""
+
+import pytest
+
+from ariadne_lambda.schema import Request
+from benchmarks.data import RESULT_SIZES
+from benchmarks.events import EVENT_FACTORIES, create_body, create_headers
+from benchmarks.schema import QUERIES
+
+HEADERS_COUNTS = {"few-headers": 5, "many-headers": 40}
+BODY_PADDINGS = {"small-body": 0, "large-body": 100_000}
+
+
+def create_event(
+    event_type, query="simple", size="small", headers="few-headers", body="small-body"
+):
+    return EVENT_FACTORIES[event_type](
+        body=create_body(
+            QUERIES[query], {"first": RESULT_SIZES[size]}, padding=BODY_PADDINGS[body]
+        ),
+        headers=create_headers(HEADERS_COUNTS[headers]),
+    )
+
+
+@pytest.mark.parametrize("size", RESULT_SIZES)
+@pytest.mark.parametrize("query", QUERIES)
+@pytest.mark.parametrize("event_type", EVENT_FACTORIES)
+def test_end_to_end(benchmark, runner, graphql_app, event_type, query, size):
+    if query == "simple" and size != "small":
+        pytest.skip("result size doesn't affect simple query")
+
+    event = create_event(event_type, query, size)
+    benchmark.group = f"end-to-end-{query}-{size}"
+    result = benchmark(lambda: runner.run(graphql_app(event, None)))
+    assert result["statusCode"] == 200
+
+
+@pytest.mark.parametrize("headers", HEADERS_COUNTS)
+@pytest.mark.parametrize("event_type", EVENT_FACTORIES)
+def test_phase_create_request(benchmark, event_type, headers):
+    event = create_event(event_type, headers=headers)
+
+    def create_request():
+        request = Request.create_from_event(event)
+        return request.method, request.headers.get("content-type"), request.body
+
+    benchmark.group = f"phase-create-request-{headers}"
+    benchmark(create_request)
+
+
+@pytest.mark.parametrize("body", BODY_PADDINGS)
+@pytest.mark.parametrize("event_type", EVENT_FACTORIES)
+def test_phase_extract_data(benchmark, runner, graphql_app, event_type, body):
+    request = Request.create_from_event(create_event(event_type, body=body))
+    handler = graphql_app.http_handler
+    benchmark.group = f"phase-extract-data-{body}"
+    benchmark(lambda: runner.run(handler.extract_data_from_request(request)))
+
+
+@pytest.mark.parametrize("size", RESULT_SIZES)
+@pytest.mark.parametrize("query", QUERIES)
+def test_phase_execute(benchmark, runner, graphql_app, query, size):
+    if query == "simple" and size != "small":
+        pytest.skip("result size doesn't affect simple query")
+
+    request = Request.create_from_event(create_event("v2", query, size))
+    handler = graphql_app.http_handler
+    data = runner.run(handler.extract_data_from_request(request))
+    benchmark.group = f"phase-execute-{size}"
+    success, _ = benchmark(lambda: runner.run(handler.execute_graphql_query(request, data)))
+    assert success
+
+
+@pytest.mark.parametrize("size", RESULT_SIZES)
+def test_phase_create_json_response(benchmark, runner, graphql_app, size):
+    request = Request.create_from_event(create_event("v2", "nested", size))
+    handler = graphql_app.http_handler
+    data = runner.run(handler.extract_data_from_request(request))
+    _, result = runner.run(handler.execute_graphql_query(request, data))
+    benchmark.group = f"phase-create-json-response-{size}"
+    benchmark(lambda: runner.run(handler.create_json_response(request, result, True)))
+
+
+@pytest.mark.parametrize("size", RESULT_SIZES)
+def test_phase_render(benchmark, runner, graphql_app, size):
+    request = Request.create_from_event(create_event("v2", "nested", size))
+    handler = graphql_app.http_handler
+    data = runner.run(handler.extract_data_from_request(request))
+    _, result = runner.run(handler.execute_graphql_query(request, data))
+    response = runner.run(handler.create_json_response(request, result, True))
+    benchmark.group = f"phase-render-{size}"
+    benchmark(response.render)
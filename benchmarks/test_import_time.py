@@ -0,0 +1,47 @@
+"""Import time of the package, measured with `python -X importtime`.
+
+Wall clock measurement depends on the machine, so it's not part of the tests.
+Run with:
+
+    pytest benchmarks/test_import_time.py
+"""
+
+import os
+import subprocess
+import sys
+
+# Budget for time spent importing `ariadne_lambda` on top of its required
+# dependencies (Ariadne and GraphQL core), in milliseconds
+IMPORT_TIME_BUDGET_MS = float(os.environ.get("ARIADNE_LAMBDA_IMPORT_TIME_BUDGET_MS", "40"))
+
+# Preloading dependencies makes `-X importtime` attribute to `ariadne_lambda` only
+# modules imported because of it
+IMPORT_STATEMENT = "import ariadne, graphql; import ariadne_lambda.graphql"
+
+
+def get_package_import_time_ms() -> float:
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", IMPORT_STATEMENT],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    total_us = 0
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line[len("import time:") :].split("|")
+        # top level imports have no indentation in `-X importtime` output
+        if name.startswith(" ariadne_lambda"):
+            total_us += int(cumulative)
+    return total_us / 1000
+
+
+def test_package_import_time_is_within_budget():
+    # Best of few runs to reduce noise from the environment
+    import_time_ms = min(get_package_import_time_ms() for _ in range(5))
+
+    assert import_time_ms < IMPORT_TIME_BUDGET_MS, (
+        f"Importing ariadne_lambda took {import_time_ms:.1f}ms, "
+        f"budget is {IMPORT_TIME_BUDGET_MS:.1f}ms"
+    )
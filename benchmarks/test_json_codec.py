@@ -0,0 +1,36 @@
+import pytest
+
+from ariadne_lambda.json_codec import get_json_codec
+from benchmarks.data import RESULT_SIZES, products_result
+
+CODECS = ["json", "orjson", "ujson", "msgspec"]
+
+
+@pytest.fixture(params=CODECS)
+def codec(request):
+    if request.param != "json":
+        pytest.importorskip(request.param)
+    return get_json_codec(request.param)
+
+
+@pytest.mark.parametrize("size", RESULT_SIZES)
+def test_encode_result(benchmark, codec, size):
+    result = products_result(RESULT_SIZES[size])
+    benchmark.group = f"encode-{size}"
+    benchmark(codec.dumps, result)
+
+
+@pytest.mark.parametrize("size", RESULT_SIZES)
+def test_encode_result_bytes(benchmark, codec, size):
+    result = products_result(RESULT_SIZES[size])
+    benchmark.group = f"encode-bytes-{size}"
+    benchmark(codec.dumps_bytes, result)
+
+
+@pytest.mark.parametrize("size", RESULT_SIZES)
+def test_decode_request(benchmark, codec, size):
+    body = get_json_codec("json").dumps(
+        {"query": "{ products }", "variables": products_result(RESULT_SIZES[size])}
+    )
+    benchmark.group = f"decode-{size}"
+    benchmark(codec.loads, body)
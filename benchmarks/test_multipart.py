@@ -0,0 +1,86 @@
+import tracemalloc
+from base64 import b64decode, b64encode
+from io import BytesIO
+
+import pytest
+
+from ariadne_lambda.multipart import MultipartParser
+
+BOUNDARY = b"----benchmark"
+FILE_SIZE = 5 * 1024 * 1024
+
+
+def create_upload_body(file_size: int) -> str:
+    body = (
+        b"--" + BOUNDARY + b"\r\n"
+        b'Content-Disposition: form-data; name="operations"\r\n\r\n'
+        b'{"query": "mutation($file: Upload!) { upload(file: $file) }"}\r\n'
+        b"--" + BOUNDARY + b"\r\n"
+        b'Content-Disposition: form-data; name="map"\r\n\r\n'
+        b'{"0": ["variables.file"]}\r\n'
+        b"--" + BOUNDARY + b"\r\n"
+        b'Content-Disposition: form-data; name="0"; filename="upload.bin"\r\n'
+        b"Content-Type: application/octet-stream\r\n\r\n"
+        + bytes(range(256)) * (file_size // 256)
+        + b"\r\n--"
+        + BOUNDARY
+        + b"--\r\n"
+    )
+    return b64encode(body).decode("ascii")
+
+
+def parse_naive(body: str):
+    """Parse by decoding whole body at once and copying parts, for comparison."""
+    data = b64decode(body)
+    fields, files = {}, {}
+    for part in data.split(b"--" + BOUNDARY)[1:-1]:
+        headers, _, content = part[2:-2].partition(b"\r\n\r\n")
+        name = headers.split(b'name="')[1].split(b'"')[0].decode()
+        if b"filename=" in headers:
+            files[name] = BytesIO(content)
+        else:
+            fields[name] = content.decode()
+    return fields, files
+
+
+def parse_with_parser(parser: MultipartParser):
+    def parse(body: str):
+        return parser.parse(parser.decode_body(body, True), BOUNDARY)
+
+    return parse
+
+
+PARSERS = {
+    "naive": parse_naive,
+    "memoryview-spooled": parse_with_parser(MultipartParser(max_total_size=None)),
+    "memoryview-in-memory": parse_with_parser(
+        MultipartParser(max_total_size=None, spool_max_size=2 * FILE_SIZE)
+    ),
+}
+
+
+def measure_peak_memory(parse, body: str) -> int:
+    """Return peak memory allocated while parsing the body, excluding the body."""
+    tracemalloc.start()
+    try:
+        start, _ = tracemalloc.get_traced_memory()
+        _, files = parse(body)
+        _, peak = tracemalloc.get_traced_memory()
+        for file in files.values():
+            file.close()
+    finally:
+        tracemalloc.stop()
+    return peak - start
+
+
+@pytest.mark.parametrize("parser", PARSERS)
+def test_parse_5mb_upload(benchmark, parser):
+    body = create_upload_body(FILE_SIZE)
+    parse = PARSERS[parser]
+    benchmark.group = "multipart-5mb"
+    benchmark.extra_info["peak_memory_bytes"] = measure_peak_memory(parse, body)
+
+    fields, files = benchmark(parse, body)
+
+    assert set(fields) == {"operations", "map"}
+    assert files["0"].read(4) == b"\x00\x01\x02\x03"
@@ -0,0 +1,81 @@
+import tracemalloc
+from typing import Any, Literal
+
+import pytest
+
+from ariadne_lambda.schema import Request
+from tests.conftest import load_data_file
+
+pydantic = pytest.importorskip("pydantic")
+
+
+class PydanticRequest(pydantic.BaseModel):
+    """Request model used before `Request` was replaced with lazy slotted class."""
+
+    event: dict[str, Any]
+
+    path: str
+    method: Literal["DELETE", "GET", "HEAD", "OPTIONS", "PATCH", "POST", "PUT"]
+
+    body: str
+    is_base64_encoded: bool
+
+    headers: dict[str, str]
+    params: dict[str, str]
+
+    @classmethod
+    def create_from_event(cls, event: dict[str, Any]) -> "PydanticRequest":
+        lowered_key_headers = {key.lower(): value for key, value in event["headers"].items()}
+        request_data = {
+            "event": event,
+            "body": "",
+            "is_base64_encoded": event["isBase64Encoded"],
+            "headers": lowered_key_headers,
+            "params": event["queryStringParameters"],
+        }
+        if http_context := event["requestContext"].get("http"):
+            request_data["path"] = http_context["path"]
+            request_data["method"] = http_context["method"].upper()
+        else:
+            request_data["path"] = event["path"]
+            request_data["method"] = event["httpMethod"].upper()
+        if body := event["body"]:
+            request_data["body"] = body
+        if not request_data["params"]:
+            request_data["params"] = {}
+        return cls(**request_data)
+
+
+REQUEST_CLASSES = {"slotted": Request, "pydantic": PydanticRequest}
+EVENTS = {"v1": "api_gateway_v1_event.json", "v2": "api_gateway_v2_event.json"}
+
+
+def create_and_read(request_class, event):
+    request = request_class.create_from_event(event)
+    request.method, request.headers.get("content-type"), request.body
+    return request
+
+
+def measure_allocated_bytes(request_class, event, rounds=1000):
+    """Return average memory allocated per request, which is kept alive after its
+    attributes were read."""
+    tracemalloc.start()
+    try:
+        start, _ = tracemalloc.get_traced_memory()
+        requests = [create_and_read(request_class, event) for _ in range(rounds)]
+        end, _ = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    del requests
+    return (end - start) / rounds
+
+
+@pytest.mark.parametrize("request_class", REQUEST_CLASSES)
+@pytest.mark.parametrize("event_version", EVENTS)
+def test_create_request_from_event(benchmark, request_class, event_version):
+    event = load_data_file(EVENTS[event_version])
+    benchmark.group = f"request-{event_version}"
+    benchmark.extra_info["allocated_bytes"] = measure_allocated_bytes(
+        REQUEST_CLASSES[request_class], event
+    )
+    benchmark(create_and_read, REQUEST_CLASSES[request_class], event)
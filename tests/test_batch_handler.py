@@ -0,0 +1,266 @@
+import asyncio
+import json
+from base64 import b64encode
+from unittest.mock import MagicMock
+
+import pytest
+from ariadne import MutationType, QueryType, gql, make_executable_schema
+
+from ariadne_lambda.batch_handler import (
+    GraphQLEventBatchHandler,
+    GraphQLEventError,
+    get_event_records,
+)
+from ariadne_lambda.graphql import GraphQLLambda
+from ariadne_lambda.json_codec import StdlibJSONCodec
+
+ADD_ITEM = "mutation AddItem($name: String!) { addItem(name: $name) }"
+
+
+@pytest.fixture
+def items():
+    return []
+
+
+@pytest.fixture
+def items_schema(items):
+    type_defs = gql(
+        """
+        type Query {
+            items: [String!]!
+        }
+
+        type Mutation {
+            addItem(name: String!): Boolean!
+        }
+        """
+    )
+    query = QueryType()
+    query.set_field("items", lambda *_: items)
+    mutation = MutationType()
+
+    @mutation.field("addItem")
+    async def resolve_add_item(*_, name):
+        if name == "invalid":
+            raise ValueError("Invalid name")
+        await asyncio.sleep(0)
+        items.append(name)
+        return True
+
+    return make_executable_schema(type_defs, query, mutation)
+
+
+def create_sqs_record(message_id, body):
+    return {"messageId": message_id, "eventSource": "aws:sqs", "body": json.dumps(body)}
+
+
+def create_fifo_record(message_id, group_id, name):
+    record = create_sqs_record(message_id, {"query": ADD_ITEM, "variables": {"name": name}})
+    record["attributes"] = {"MessageGroupId": group_id}
+    return record
+
+
+def create_kinesis_record(sequence_number, data):
+    return {
+        "eventSource": "aws:kinesis",
+        "kinesis": {
+            "sequenceNumber": sequence_number,
+            "data": b64encode(json.dumps(data).encode()).decode(),
+        },
+    }
+
+
+def create_eventbridge_event(event_id, detail):
+    return {"id": event_id, "detail-type": "AddItem", "source": "shop", "detail": detail}
+
+
+def test_get_event_records_from_supported_events():
+    # Given
+    operation = {"query": ADD_ITEM, "variables": {"name": "a"}}
+
+    # When
+    sqs_records = get_event_records({"Records": [create_sqs_record("1", operation)]})
+    kinesis_records = get_event_records({"Records": [create_kinesis_record("2", operation)]})
+    eventbridge_records = get_event_records(create_eventbridge_event("3", operation))
+    pipes_records = get_event_records([create_sqs_record("4", operation)])
+
+    # Then
+    for records, identifier in (
+        (sqs_records, "1"),
+        (kinesis_records, "2"),
+        (eventbridge_records, "3"),
+        (pipes_records, "4"),
+    ):
+        assert len(records) == 1
+        assert records[0].identifier == identifier
+        assert records[0].get_body(StdlibJSONCodec()) == operation
+
+
+@pytest.mark.asyncio
+async def test_handle_executes_operations_from_sqs_records(items_schema, items):
+    # Given
+    app = GraphQLLambda(items_schema, http_handler=GraphQLEventBatchHandler())
+    event = {
+        "Records": [
+            create_sqs_record(str(i), {"query": ADD_ITEM, "variables": {"name": f"item-{i}"}})
+            for i in range(3)
+        ]
+    }
+
+    # When
+    result = await app(event, MagicMock())
+
+    # Then
+    assert result == {"batchItemFailures": []}
+    assert sorted(items) == ["item-0", "item-1", "item-2"]
+
+
+@pytest.mark.asyncio
+async def test_handle_reports_failed_records(items_schema, items):
+    # Given
+    app = GraphQLLambda(items_schema, http_handler=GraphQLEventBatchHandler())
+    event = {
+        "Records": [
+            create_kinesis_record("1", {"query": ADD_ITEM, "variables": {"name": "valid"}}),
+            create_kinesis_record("2", {"query": ADD_ITEM, "variables": {"name": "invalid"}}),
+            create_kinesis_record("3", {"query": "{ unknown }"}),
+            {"eventSource": "aws:kinesis", "kinesis": {"sequenceNumber": "4", "data": "!"}},
+        ]
+    }
+
+    # When
+    result = await app(event, MagicMock())
+
+    # Then
+    assert result == {
+        "batchItemFailures": [
+            {"itemIdentifier": "2"},
+            {"itemIdentifier": "3"},
+            {"itemIdentifier": "4"},
+        ]
+    }
+    assert items == ["valid"]
+
+
+@pytest.mark.asyncio
+async def test_handle_stops_message_group_of_fifo_queue_at_first_failure(items_schema, items):
+    # Given
+    app = GraphQLLambda(items_schema, http_handler=GraphQLEventBatchHandler())
+    event = {
+        "Records": [
+            create_fifo_record("1", "a", "a-1"),
+            create_fifo_record("2", "b", "b-1"),
+            create_fifo_record("3", "a", "invalid"),
+            create_fifo_record("4", "b", "b-2"),
+            create_fifo_record("5", "a", "a-3"),
+        ]
+    }
+
+    # When
+    result = await app(event, MagicMock())
+
+    # Then
+    assert result == {"batchItemFailures": [{"itemIdentifier": "3"}, {"itemIdentifier": "5"}]}
+    assert sorted(items) == ["a-1", "b-1", "b-2"]
+    assert items.index("b-1") < items.index("b-2")
+
+
+@pytest.mark.asyncio
+async def test_handle_decodes_records_with_configured_json_codec(items_schema, items):
+    # Given
+    json_codec = MagicMock(wraps=StdlibJSONCodec())
+    app = GraphQLLambda(
+        items_schema, http_handler=GraphQLEventBatchHandler(), json_codec=json_codec
+    )
+    record = create_sqs_record("1", {"query": ADD_ITEM, "variables": {"name": "item"}})
+
+    # When
+    await app({"Records": [record]}, MagicMock())
+
+    # Then
+    json_codec.loads.assert_called_once_with(record["body"])
+    assert items == ["item"]
+
+
+@pytest.mark.asyncio
+async def test_handle_ignores_errors_when_fail_on_errors_is_disabled(items_schema):
+    # Given
+    app = GraphQLLambda(items_schema, http_handler=GraphQLEventBatchHandler(fail_on_errors=False))
+    event = {
+        "Records": [create_sqs_record("1", {"query": ADD_ITEM, "variables": {"name": "invalid"}})]
+    }
+
+    # When
+    result = await app(event, MagicMock())
+
+    # Then
+    assert result == {"batchItemFailures": []}
+
+
+@pytest.mark.parametrize(
+    ("event", "source"),
+    [
+        ({"Records": [{"eventSource": "aws:dynamodb", "eventID": "1"}]}, "aws:dynamodb"),
+        ({"Records": [{"body": "{}"}]}, "unknown"),
+    ],
+)
+def test_get_event_records_raises_error_for_unsupported_source(event, source):
+    # When / Then
+    with pytest.raises(GraphQLEventError, match=f"Unsupported event source: {source}"):
+        get_event_records(event)
+
+
+@pytest.mark.asyncio
+async def test_handle_raises_error_for_failed_eventbridge_event(items_schema):
+    # Given
+    app = GraphQLLambda(items_schema, http_handler=GraphQLEventBatchHandler())
+    event = create_eventbridge_event("1", {"query": ADD_ITEM, "variables": {"name": "invalid"}})
+
+    # When / Then
+    with pytest.raises(GraphQLEventError):
+        await app(event, MagicMock())
+
+
+@pytest.mark.asyncio
+async def test_handle_limits_concurrency(items_schema):
+    # Given
+    handler = GraphQLEventBatchHandler(concurrency=2)
+    handler.configure(items_schema)
+    running = 0
+    max_running = 0
+
+    async def execute_graphql_query(request, data):
+        nonlocal running, max_running
+        running += 1
+        max_running = max(max_running, running)
+        await asyncio.sleep(0.01)
+        running -= 1
+        return True, {"data": {}}
+
+    handler.execute_graphql_query = execute_graphql_query
+    event = {"Records": [create_sqs_record(str(i), {"query": ADD_ITEM}) for i in range(5)]}
+
+    # When
+    await handler.handle(event, MagicMock())
+
+    # Then
+    assert max_running == 2
+
+
+@pytest.mark.asyncio
+async def test_handle_shares_parsed_documents_between_records(items_schema):
+    # Given
+    handler = GraphQLEventBatchHandler()
+    handler.configure(items_schema)
+    event = {
+        "Records": [
+            create_sqs_record(str(i), {"query": ADD_ITEM, "variables": {"name": str(i)}})
+            for i in range(3)
+        ]
+    }
+
+    # When
+    await handler.handle(event, MagicMock())
+
+    # Then
+    assert handler.document_cache.stats()["size"] == 1
@@ -0,0 +1,72 @@
+from base64 import b64encode
+
+import pytest
+from ariadne.exceptions import HttpBadRequestError
+
+from ariadne_lambda.body import check_body_size, decode_base64_body, decode_body
+from ariadne_lambda.exceptions import HttpPayloadTooLargeError
+
+
+def test_decode_base64_body_in_chunks(monkeypatch):
+    # Given
+    monkeypatch.setattr("ariadne_lambda.body.BASE64_CHUNK_SIZE", 8)
+    data = bytes(range(256)) * 3 + b"end"
+
+    # When
+    decoded = decode_base64_body(b64encode(data).decode())
+
+    # Then
+    assert decoded == data
+
+
+def test_decode_base64_body_rejects_body_over_max_size():
+    # When / Then
+    with pytest.raises(HttpPayloadTooLargeError):
+        decode_base64_body(b64encode(b"x" * 100).decode(), max_size=50)
+
+
+def test_decode_base64_body_rejects_invalid_base64():
+    # When / Then
+    with pytest.raises(HttpBadRequestError):
+        decode_base64_body("not base64!")
+
+
+def test_decode_body_returns_not_encoded_body_unchanged():
+    # Given
+    body = '{"query": "{ hello }"}'
+
+    # When
+    decoded = decode_body(body, is_base64_encoded=False, max_size=100)
+
+    # Then
+    assert decoded is body
+
+
+def test_decode_body_decodes_base64_encoded_body_to_bytes():
+    # Given
+    body = b64encode('{"query": "{ żółw }"}'.encode()).decode()
+
+    # When
+    decoded = decode_body(body, is_base64_encoded=True, max_size=100)
+
+    # Then
+    assert decoded == '{"query": "{ żółw }"}'.encode()
+
+
+@pytest.mark.parametrize(
+    ("body", "max_size"),
+    [("x" * 100, 100), ("ż" * 50, 100), ("x" * 100, None)],
+)
+def test_check_body_size_accepts_body_within_max_size(body, max_size):
+    # When / Then
+    check_body_size(body, max_size)
+
+
+@pytest.mark.parametrize(
+    ("body", "max_size"),
+    [("x" * 101, 100), ("ż" * 51, 100)],
+)
+def test_check_body_size_rejects_body_over_max_size(body, max_size):
+    # When / Then
+    with pytest.raises(HttpPayloadTooLargeError):
+        check_body_size(body, max_size)
@@ -0,0 +1,69 @@
+from graphql import parse
+
+from ariadne_lambda.cache import CachedDocument, DocumentCache
+
+
+def test_document_cache_get_counts_hits_and_misses():
+    # Given
+    cache = DocumentCache()
+    cached_document = CachedDocument(parse("{ hello }"), [], 10)
+    cache.set("{ hello }", cached_document)
+
+    # When
+    hit = cache.get("{ hello }")
+    miss = cache.get("{ world }")
+
+    # Then
+    assert hit is cached_document
+    assert miss is None
+    assert cache.stats() == {"hits": 1, "misses": 1, "size": 1, "memory": 10}
+
+
+def test_document_cache_evicts_least_recently_used_entry():
+    # Given
+    cache = DocumentCache(max_size=2)
+    cache.set("a", CachedDocument(parse("{ a }")))
+    cache.set("b", CachedDocument(parse("{ b }")))
+    cache.get("a")
+
+    # When
+    cache.set("c", CachedDocument(parse("{ c }")))
+
+    # Then
+    assert "a" in cache
+    assert "b" not in cache
+    assert "c" in cache
+
+
+def test_document_cache_evicts_entries_over_memory_limit():
+    # Given
+    cache = DocumentCache(max_memory=100)
+    cache.set("a", CachedDocument(parse("{ a }"), size=60))
+
+    # When
+    cache.set("b", CachedDocument(parse("{ b }"), size=60))
+
+    # Then
+    assert "a" not in cache
+    assert "b" in cache
+    assert cache.memory == 60
+
+
+def test_document_cache_skips_entries_larger_than_memory_limit():
+    # Given
+    cache = DocumentCache(max_memory=100)
+
+    # When
+    cache.set("a", CachedDocument(parse("{ a }"), size=200))
+
+    # Then
+    assert len(cache) == 0
+    assert cache.memory == 0
+
+
+def test_cached_document_validate_returns_cached_errors():
+    # Given
+    cached_document = CachedDocument(parse("{ a }"), None)
+
+    # Then
+    assert cached_document.validate() == []
@@ -0,0 +1,155 @@
+import gzip
+from base64 import b64decode
+
+import pytest
+
+from ariadne_lambda.compression import ResponseCompression, parse_accept_encoding
+from ariadne_lambda.schema import Response
+
+BODY = '{"data": {"items": [' + ", ".join(['{"name": "item"}'] * 200) + "]}}"
+
+
+def test_parse_accept_encoding():
+    # Then
+    assert parse_accept_encoding("gzip, br;q=0.5, zstd;q=0, *;q=invalid") == {
+        "gzip": 1.0,
+        "br": 0.5,
+        "zstd": 0.0,
+        "*": 0.0,
+    }
+
+
+@pytest.mark.parametrize(
+    ("accept_encoding", "encoding"),
+    [
+        ("gzip", "gzip"),
+        ("gzip, deflate", "gzip"),
+        ("gzip;q=1.0, *;q=0.5", "gzip"),
+        ("deflate", None),
+        ("gzip;q=0", None),
+        ("*", "gzip"),
+    ],
+)
+def test_negotiate_encoding(accept_encoding, encoding):
+    # Given
+    compression = ResponseCompression(encodings=("gzip",))
+
+    # When
+    compressor = compression.negotiate(accept_encoding)
+
+    # Then
+    assert (compressor.encoding if compressor else None) == encoding
+
+
+def test_negotiate_encoding_uses_server_preference_for_equal_quality():
+    # Given
+    pytest.importorskip("brotli")
+    compression = ResponseCompression(encodings=("br", "gzip"))
+
+    # Then
+    assert compression.negotiate("gzip, br").encoding == "br"
+
+
+def test_compress_response_sets_base64_body_and_headers():
+    # Given
+    compression = ResponseCompression(encodings=("gzip",))
+    response = Response(body=BODY, headers={"Content-Type": "application/json"})
+
+    # When
+    response = compression.compress_response({"accept-encoding": "gzip"}, response)
+    rendered = response.render()
+
+    # Then
+    assert rendered["isBase64Encoded"] is True
+    assert rendered["headers"]["Content-Encoding"] == "gzip"
+    assert rendered["headers"]["Vary"] == "Accept-Encoding"
+    assert gzip.decompress(b64decode(rendered["body"])).decode() == BODY
+
+
+@pytest.mark.parametrize("encoding", ["br", "zstd"])
+def test_compress_response_with_optional_encodings(encoding):
+    # Given
+    pytest.importorskip({"br": "brotli", "zstd": "zstandard"}[encoding])
+    compression = ResponseCompression(encodings=(encoding,))
+
+    # When
+    response = compression.compress_response(
+        {"accept-encoding": encoding}, Response(body=BODY.encode())
+    )
+
+    # Then
+    assert response.is_base64_encoded is True
+    assert response.headers["Content-Encoding"] == encoding
+
+
+def get_decompress(encoding):
+    if encoding == "gzip":
+        return gzip.decompress
+    if encoding == "br":
+        return pytest.importorskip("brotli").decompress
+    # streamed frames don't contain content size required by zstandard.decompress
+    zstandard = pytest.importorskip("zstandard")
+    return lambda data: zstandard.ZstdDecompressor().decompressobj().decompress(data)
+
+
+@pytest.mark.parametrize("encoding", ["gzip", "br", "zstd"])
+def test_compressor_stream_flushes_every_chunk(encoding):
+    # Given
+    decompress = get_decompress(encoding)
+    compression = ResponseCompression(encodings=(encoding,))
+    stream = compression.create_stream({"accept-encoding": encoding})
+    chunks = [BODY[:100].encode(), BODY[100:].encode()]
+
+    # When
+    compressed_chunks = [stream.compress(chunk) for chunk in chunks]
+    compressed_chunks.append(stream.finish())
+
+    # Then
+    assert stream.encoding == encoding
+    assert all(compressed_chunks[:2])
+    assert decompress(b"".join(compressed_chunks)).decode() == BODY
+
+
+def test_create_stream_returns_none_without_accepted_encoding():
+    # Given
+    compression = ResponseCompression(encodings=("gzip",))
+
+    # Then
+    assert compression.create_stream({}) is None
+    assert compression.create_stream({"accept-encoding": "deflate"}) is None
+
+
+def test_compress_response_skips_small_body():
+    # Given
+    compression = ResponseCompression(min_size=len(BODY) + 1)
+
+    # When
+    response = compression.compress_response({"accept-encoding": "gzip"}, Response(body=BODY))
+
+    # Then
+    assert response.body == BODY
+    assert response.is_base64_encoded is False
+    assert "Content-Encoding" not in response.headers
+
+
+def test_compress_response_skips_body_over_cpu_budget():
+    # Given
+    compression = ResponseCompression(encodings=("gzip",), cpu_budget=1)
+    compression.speed["gzip"] = 1.0
+
+    # When
+    response = compression.compress_response({"accept-encoding": "gzip"}, Response(body=BODY))
+
+    # Then
+    assert response.body == BODY
+
+
+def test_compress_response_updates_compression_speed():
+    # Given
+    compression = ResponseCompression(encodings=("gzip",), cpu_budget=1000)
+
+    # When
+    compression.compress_response({"accept-encoding": "gzip"}, Response(body=BODY))
+
+    # Then
+    assert compression.speed["gzip"] > 0
@@ -0,0 +1,268 @@
+import json
+from unittest.mock import MagicMock, patch
+
+import pytest
+from ariadne import QueryType, gql, make_executable_schema
+from graphql import parse
+
+from ariadne_lambda.cache import CachedDocument, DocumentCache
+from ariadne_lambda.cost import QueryCostAnalyzer
+from ariadne_lambda.graphql import GraphQLLambda
+
+
+@pytest.fixture
+def resolved_fields():
+    return []
+
+
+@pytest.fixture
+def posts_schema(resolved_fields):
+    type_defs = gql(
+        """
+        type Query {
+            posts(first: Int): [Post!]!
+            post(id: ID!): Post
+        }
+
+        type Post {
+            id: ID!
+            title: String!
+            comments(limit: Int): [Comment!]!
+        }
+
+        type Comment {
+            id: ID!
+            text: String!
+        }
+        """
+    )
+    query = QueryType()
+
+    @query.field("posts")
+    def resolve_posts(*_, first=2):
+        resolved_fields.append("posts")
+        return [{"id": i, "title": f"Post {i}", "comments": []} for i in range(first)]
+
+    return make_executable_schema(type_defs, query)
+
+
+def get_cost(analyzer, schema, query, variables=None, cached_document=None):
+    cached_document = cached_document or CachedDocument(parse(query))
+    data = {"query": query, "variables": variables}
+    return analyzer.get_cost(schema, cached_document, data)
+
+
+def test_cost_multiplies_fields_by_list_size_arguments(posts_schema):
+    # Given
+    analyzer = QueryCostAnalyzer()
+    query = "{ posts(first: 5) { id comments(limit: 3) { text } } }"
+
+    # When
+    cost = get_cost(analyzer, posts_schema, query)
+
+    # Then
+    # posts + 5 * (id + comments + 3 * text)
+    assert cost.cost == 1 + 5 * (1 + 1 + 3 * 1)
+    assert cost.depth == 3
+    assert cost.aliases == 0
+
+
+def test_cost_uses_default_list_size_and_field_costs(posts_schema):
+    # Given
+    analyzer = QueryCostAnalyzer(
+        default_list_size=20, default_field_cost=0, field_costs={"Query.posts": 10}
+    )
+
+    # When
+    cost = get_cost(analyzer, posts_schema, "{ posts { id title } }")
+
+    # Then
+    assert cost.cost == 10
+
+
+def test_cost_counts_fragments_and_aliases(posts_schema):
+    # Given
+    analyzer = QueryCostAnalyzer()
+    query = """
+        query {
+            first: post(id: 1) { ...PostFields }
+            second: post(id: 2) { ... on Post { id } }
+            __typename
+        }
+
+        fragment PostFields on Post { id title }
+    """
+
+    # When
+    cost = get_cost(analyzer, posts_schema, query)
+
+    # Then
+    assert cost.cost == 3 + 2
+    assert cost.depth == 2
+    assert cost.aliases == 2
+
+
+def test_cost_of_nested_fragments_spreads_is_computed_without_expanding_them(posts_schema):
+    # Given
+    analyzer = QueryCostAnalyzer()
+    fragments = [
+        f"fragment Post{i} on Post {{ id ...Post{i + 1} ...Post{i + 1} }}" for i in range(29)
+    ]
+    fragments.append("fragment Post29 on Post { postId: id comments(limit: 3) { text } }")
+    query = "query Posts($first: Int) { posts(first: $first) { ...Post0 } }\n" + "\n".join(
+        fragments
+    )
+
+    # When
+    cost = get_cost(analyzer, posts_schema, query, {"first": 2})
+
+    # Then
+    fragment_cost = 1 + 1 + 3 * 1
+    for _ in range(29):
+        fragment_cost = 1 + 2 * fragment_cost
+    assert cost.cost == 1 + 2 * fragment_cost
+    assert cost.depth == 3
+    assert cost.aliases == 2**29
+
+
+def test_cost_of_lists_sized_by_variables_is_computed_per_request(posts_schema):
+    # Given
+    analyzer = QueryCostAnalyzer()
+    query = "query Posts($first: Int = 4) { posts(first: $first) { id } }"
+    cached_document = CachedDocument(parse(query))
+
+    # When
+    default_cost = get_cost(analyzer, posts_schema, query, None, cached_document)
+    cost = get_cost(analyzer, posts_schema, query, {"first": 100}, cached_document)
+
+    # Then
+    assert default_cost.cost == 1 + 4
+    assert cost.cost == 1 + 100
+    assert list(cached_document.metadata["cost_plans"]) == [None]
+
+
+def test_static_cost_is_computed_once(posts_schema):
+    # Given
+    analyzer = QueryCostAnalyzer()
+    query = "{ posts(first: 5) { id } }"
+    cached_document = CachedDocument(parse(query))
+
+    # When
+    get_cost(analyzer, posts_schema, query, None, cached_document)
+    cost_plan = cached_document.metadata["cost_plans"][None]
+
+    # Then
+    assert cost_plan.static_cost == 6
+
+
+def test_get_error_reports_exceeded_limits():
+    # Given
+    analyzer = QueryCostAnalyzer(max_cost=10, max_depth=3, max_aliases=2)
+
+    # When
+    cost = get_cost(
+        analyzer,
+        make_executable_schema("type Query { a: String }"),
+        "{ a b: a c: a d: a }",
+    )
+
+    # Then
+    error = analyzer.get_error(cost)
+    assert error.message == "Query has 3 aliases, exceeding the maximum of 2."
+    assert error.extensions == {"code": "QUERY_TOO_COMPLEX"}
+
+
+@pytest.mark.asyncio
+async def test_handler_rejects_query_exceeding_max_cost(
+    posts_schema, resolved_fields, api_gateway_v1_event_payload
+):
+    # Given
+    app = GraphQLLambda(posts_schema, cost_analyzer=QueryCostAnalyzer(max_cost=50))
+    api_gateway_v1_event_payload["httpMethod"] = "POST"
+    api_gateway_v1_event_payload["headers"]["Content-Type"] = "application/json"
+    api_gateway_v1_event_payload["body"] = json.dumps(
+        {
+            "query": "query ($first: Int) { posts(first: $first) { id } }",
+            "variables": {"first": 100},
+        }
+    )
+
+    # When
+    response = await app(api_gateway_v1_event_payload, MagicMock())
+
+    # Then
+    assert response["statusCode"] == 400
+    body = json.loads(response["body"])
+    assert body["errors"][0]["message"] == "Query cost 101 exceeds the maximum cost of 50."
+    assert body["extensions"]["cost"]["requestedQueryCost"] == 101
+    assert resolved_fields == []
+
+
+@pytest.mark.asyncio
+async def test_handler_reports_query_cost_in_extensions(
+    posts_schema, resolved_fields, api_gateway_v1_event_payload
+):
+    # Given
+    app = GraphQLLambda(posts_schema, cost_analyzer=QueryCostAnalyzer(max_cost=50))
+    api_gateway_v1_event_payload["httpMethod"] = "POST"
+    api_gateway_v1_event_payload["headers"]["Content-Type"] = "application/json"
+    api_gateway_v1_event_payload["body"] = json.dumps({"query": "{ posts(first: 2) { id } }"})
+
+    # When
+    response = await app(api_gateway_v1_event_payload, MagicMock())
+
+    # Then
+    assert response["statusCode"] == 200
+    body = json.loads(response["body"])
+    assert body["data"] == {"posts": [{"id": "0"}, {"id": "1"}]}
+    assert body["extensions"]["cost"] == {
+        "requestedQueryCost": 3,
+        "maximumAvailable": 50,
+        "depth": 2,
+        "aliases": 0,
+    }
+    assert resolved_fields == ["posts"]
+
+
+@pytest.mark.asyncio
+async def test_handler_rejects_query_exceeding_limits_before_validation(
+    posts_schema, api_gateway_v1_event_payload
+):
+    # Given
+    app = GraphQLLambda(posts_schema, cost_analyzer=QueryCostAnalyzer(max_depth=2))
+    api_gateway_v1_event_payload["httpMethod"] = "POST"
+    api_gateway_v1_event_payload["headers"]["Content-Type"] = "application/json"
+    api_gateway_v1_event_payload["body"] = json.dumps(
+        {"query": "{ posts { comments { unknown } } }"}
+    )
+
+    # When
+    with patch("ariadne_lambda.base.validate_query") as validate_query:
+        response = await app(api_gateway_v1_event_payload, MagicMock())
+
+    # Then
+    assert response["statusCode"] == 400
+    body = json.loads(response["body"])
+    assert body["errors"][0]["message"] == "Query depth 3 exceeds the maximum depth of 2."
+    validate_query.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_cached_document_rejected_by_cost_is_validated_when_executed(posts_schema):
+    # Given
+    app = GraphQLLambda(
+        posts_schema,
+        cost_analyzer=QueryCostAnalyzer(max_cost=50),
+        document_cache=DocumentCache(),
+    )
+    handler = app.http_handler
+    query = "query ($first: Int) { posts(first: $first) { id } }"
+    handler.get_cached_document(None, {"query": query, "variables": {"first": 100}})
+
+    # When
+    cached_document = handler.get_cached_document(
+        None, {"query": query, "variables": {"first": 2}}
+    )
+
+    # Then
+    assert cached_document.validation_errors == []
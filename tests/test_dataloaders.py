@@ -0,0 +1,207 @@
+import asyncio
+import json
+from unittest.mock import MagicMock
+
+import pytest
+from ariadne import ObjectType, QueryType, gql, make_executable_schema
+
+from ariadne_lambda.dataloaders import (
+    DataLoader,
+    DataLoaderDiagnosticsExtension,
+    DataLoaderRegistry,
+)
+from ariadne_lambda.http_handler import GraphQLAWSAPIHTTPGatewayHandler
+
+
+class RecordingBatchLoad:
+    def __init__(self):
+        self.calls = []
+
+    async def __call__(self, keys):
+        self.calls.append(keys)
+        return [f"value-{key}" for key in keys]
+
+
+@pytest.mark.asyncio
+async def test_data_loader_batches_loads_from_same_tick():
+    # Given
+    batch_load = RecordingBatchLoad()
+    loader = DataLoader(batch_load)
+
+    # When
+    values = await asyncio.gather(loader.load(1), loader.load(2), loader.load(3))
+
+    # Then
+    assert values == ["value-1", "value-2", "value-3"]
+    assert batch_load.calls == [[1, 2, 3]]
+
+
+@pytest.mark.asyncio
+async def test_data_loader_caches_loaded_values():
+    # Given
+    batch_load = RecordingBatchLoad()
+    loader = DataLoader(batch_load)
+    await loader.load(1)
+
+    # When
+    values = await loader.load_many([1, 2, 2])
+
+    # Then
+    assert values == ["value-1", "value-2", "value-2"]
+    assert batch_load.calls == [[1], [2]]
+
+
+@pytest.mark.asyncio
+async def test_data_loader_splits_batches_over_max_batch_size():
+    # Given
+    batch_load = RecordingBatchLoad()
+    loader = DataLoader(batch_load, max_batch_size=2)
+
+    # When
+    await loader.load_many([1, 2, 3])
+
+    # Then
+    assert batch_load.calls == [[1, 2], [3]]
+
+
+@pytest.mark.asyncio
+async def test_data_loader_sets_exceptions_returned_for_keys():
+    # Given
+    async def batch_load(keys):
+        return [ValueError(key) if key == 2 else key for key in keys]
+
+    loader = DataLoader(batch_load)
+
+    # When
+    results = await asyncio.gather(loader.load(1), loader.load(2), return_exceptions=True)
+
+    # Then
+    assert results[0] == 1
+    assert isinstance(results[1], ValueError)
+    assert not loader.load(2).done()
+
+
+@pytest.mark.asyncio
+async def test_data_loader_cancels_loads_when_batch_load_is_cancelled():
+    # Given
+    async def batch_load(keys):
+        await asyncio.sleep(5)
+
+    loader = DataLoader(batch_load)
+    load = asyncio.ensure_future(loader.load(1))
+    await asyncio.sleep(0)
+    await asyncio.sleep(0)
+    [batch_task] = [
+        task for task in asyncio.all_tasks() if task.get_coro().__name__ == "load_batch"
+    ]
+
+    # When
+    batch_task.cancel()
+
+    # Then
+    with pytest.raises(asyncio.CancelledError):
+        await load
+    assert 1 not in loader._cache
+
+
+@pytest.mark.asyncio
+async def test_data_loader_subclass_implements_batch_load():
+    # Given
+    class SquareLoader(DataLoader):
+        async def batch_load(self, keys):
+            return [key * key for key in keys]
+
+    registry = DataLoaderRegistry({"squares": SquareLoader})
+
+    # When
+    value = await registry.squares.load(3)
+
+    # Then
+    assert value == 9
+    assert registry["squares"] is registry.squares
+
+
+def test_data_loader_registry_raises_attribute_error_for_unknown_loader():
+    # Given
+    registry = DataLoaderRegistry({})
+
+    # When / Then
+    with pytest.raises(AttributeError):
+        registry.users  # noqa: B018
+
+
+@pytest.fixture
+def users_schema():
+    type_defs = gql(
+        """
+        type Query {
+            posts: [Post!]!
+            post: Post!
+        }
+
+        type Post {
+            author: String!
+            authorOneByOne: [String!]!
+        }
+        """
+    )
+    query = QueryType()
+    query.set_field("posts", lambda *_: [{"author_id": 1}, {"author_id": 2}])
+    query.set_field("post", lambda *_: {"author_id": 1})
+
+    post = ObjectType("Post")
+
+    @post.field("author")
+    def resolve_author(obj, info):
+        return info.context["loaders"].users.load(obj["author_id"])
+
+    @post.field("authorOneByOne")
+    async def resolve_author_one_by_one(obj, info):
+        loader = info.context["loaders"].users
+        return [await loader.load(key) for key in (11, 21, 31)]
+
+    return make_executable_schema(type_defs, query, post)
+
+
+def create_post_event(event, query):
+    event["httpMethod"] = "POST"
+    event["headers"]["Content-Type"] = "application/json"
+    event["body"] = json.dumps({"query": query})
+    return event
+
+
+@pytest.mark.asyncio
+async def test_handle_creates_data_loaders_for_every_invocation(
+    users_schema, api_gateway_v1_event_payload
+):
+    # Given
+    batch_load = RecordingBatchLoad()
+    handler = GraphQLAWSAPIHTTPGatewayHandler()
+    handler.configure(users_schema, dataloaders={"users": batch_load})
+    event = create_post_event(api_gateway_v1_event_payload, "{ posts { author } }")
+
+    # When
+    await handler.handle(event, MagicMock())
+    result = await handler.handle(event, MagicMock())
+
+    # Then
+    assert json.loads(result["body"]) == {
+        "data": {"posts": [{"author": "value-1"}, {"author": "value-2"}]}
+    }
+    assert batch_load.calls == [[1, 2], [1, 2]]
+
+
+@pytest.mark.asyncio
+async def test_handle_reports_data_loaders_diagnostics(users_schema, api_gateway_v1_event_payload):
+    # Given
+    handler = GraphQLAWSAPIHTTPGatewayHandler(extensions=[DataLoaderDiagnosticsExtension])
+    handler.configure(users_schema, dataloaders={"users": RecordingBatchLoad()})
+    event = create_post_event(api_gateway_v1_event_payload, "{ post { author authorOneByOne } }")
+
+    # When
+    result = await handler.handle(event, MagicMock())
+
+    # Then
+    diagnostics = json.loads(result["body"])["extensions"]["dataloaders"]
+    assert diagnostics["batches"]["users"] == {"count": 4, "keys": 4, "max_size": 1}
+    assert diagnostics["unbatched_fields"] == ["Post.authorOneByOne"]
@@ -0,0 +1,161 @@
+import asyncio
+import json
+from unittest.mock import MagicMock, patch
+
+import pytest
+from ariadne import QueryType, gql, make_executable_schema
+
+from ariadne_lambda.deadline import Deadline, DeadlinePropagation, get_deadline
+from ariadne_lambda.graphql import GraphQLLambda
+
+
+def create_lambda_context(remaining_ms):
+    context = MagicMock()
+    context.get_remaining_time_in_millis.return_value = remaining_ms
+    return context
+
+
+@pytest.fixture
+def cancelled_fields():
+    return []
+
+
+@pytest.fixture
+def slow_schema(cancelled_fields):
+    type_defs = gql(
+        """
+        type Query {
+            fast: String!
+            slow: String
+            remaining: Boolean!
+        }
+        """
+    )
+    query = QueryType()
+    query.set_field("fast", lambda *_: "fast")
+
+    @query.field("slow")
+    async def resolve_slow(*_):
+        try:
+            await asyncio.sleep(5)
+        except asyncio.CancelledError:
+            cancelled_fields.append("slow")
+            raise
+        return "slow"
+
+    @query.field("remaining")
+    def resolve_remaining(_, info):
+        deadline = info.context["deadline"]
+        return deadline is get_deadline() and 0 < deadline.timeout(10) <= 0.5
+
+    return make_executable_schema(type_defs, query)
+
+
+def test_deadline_duration_is_reduced_by_safety_margin():
+    # Given
+    deadline = DeadlinePropagation(safety_margin=0.5)
+
+    # When
+    duration = deadline.get_duration(create_lambda_context(3000))
+
+    # Then
+    assert duration == 2.5
+
+
+def test_deadline_duration_is_limited_by_max_duration():
+    # Given
+    deadline = DeadlinePropagation(max_duration=1)
+
+    # When
+    duration = deadline.get_duration(create_lambda_context(3000))
+    duration_without_context = deadline.get_duration(object())
+
+    # Then
+    assert duration == 1
+    assert duration_without_context == 1
+
+
+def test_deadline_is_not_set_without_remaining_time():
+    # Given
+    deadline = DeadlinePropagation()
+
+    # When
+    token = deadline.start(MagicMock())
+
+    # Then
+    assert token is None
+    assert get_deadline() is None
+
+
+def test_deadline_timeout_is_limited_by_remaining_time():
+    # Given
+    deadline = Deadline(expires_at=0)
+
+    # When
+    timeout = deadline.timeout(10)
+
+    # Then
+    assert timeout == 0
+    assert deadline.expired()
+
+
+@pytest.mark.asyncio
+async def test_resolvers_are_cancelled_at_deadline_keeping_partial_data(
+    slow_schema, cancelled_fields, api_gateway_v1_event_payload
+):
+    # Given
+    app = GraphQLLambda(slow_schema, deadline=DeadlinePropagation(safety_margin=0.5))
+    api_gateway_v1_event_payload["httpMethod"] = "POST"
+    api_gateway_v1_event_payload["headers"]["Content-Type"] = "application/json"
+    api_gateway_v1_event_payload["body"] = json.dumps({"query": "{ fast slow }"})
+
+    # When
+    response = await app(api_gateway_v1_event_payload, create_lambda_context(600))
+
+    # Then
+    result = json.loads(response["body"])
+    assert result["data"] == {"fast": "fast", "slow": None}
+    assert result["errors"][0]["path"] == ["slow"]
+    assert result["errors"][0]["extensions"]["code"] == "DEADLINE_EXCEEDED"
+    assert cancelled_fields == ["slow"]
+    assert get_deadline() is None
+
+
+@pytest.mark.asyncio
+async def test_single_timer_cancels_all_fields_at_deadline(
+    slow_schema, cancelled_fields, api_gateway_v1_event_payload
+):
+    # Given
+    app = GraphQLLambda(slow_schema, deadline=DeadlinePropagation(safety_margin=0.5))
+    api_gateway_v1_event_payload["httpMethod"] = "POST"
+    api_gateway_v1_event_payload["headers"]["Content-Type"] = "application/json"
+    api_gateway_v1_event_payload["body"] = json.dumps({"query": "{ a: slow b: slow c: slow }"})
+    loop = asyncio.get_running_loop()
+
+    # When
+    with patch.object(loop, "call_later", wraps=loop.call_later) as call_later:
+        response = await app(api_gateway_v1_event_payload, create_lambda_context(600))
+
+    # Then
+    result = json.loads(response["body"])
+    assert result["data"] == {"a": None, "b": None, "c": None}
+    assert cancelled_fields == ["slow"] * 3
+    deadline_timers = [
+        call for call in call_later.call_args_list if call.args[1].__name__ == "cancel_awaiting"
+    ]
+    assert len(deadline_timers) == 1
+
+
+@pytest.mark.asyncio
+async def test_deadline_is_available_in_context(slow_schema, api_gateway_v1_event_payload):
+    # Given
+    app = GraphQLLambda(slow_schema, deadline=DeadlinePropagation(safety_margin=0.5))
+    api_gateway_v1_event_payload["httpMethod"] = "POST"
+    api_gateway_v1_event_payload["headers"]["Content-Type"] = "application/json"
+    api_gateway_v1_event_payload["body"] = json.dumps({"query": "{ remaining }"})
+
+    # When
+    response = await app(api_gateway_v1_event_payload, create_lambda_context(1000))
+
+    # Then
+    assert json.loads(response["body"]) == {"data": {"remaining": True}}
@@ -0,0 +1,152 @@
+from unittest.mock import MagicMock
+
+import pytest
+from ariadne import MutationType, QueryType, gql, make_executable_schema
+
+from ariadne_lambda.direct_handler import (
+    AppSyncResolverError,
+    GraphQLDirectInvokeHandler,
+    build_appsync_query,
+)
+from ariadne_lambda.graphql import GraphQLLambda
+
+
+@pytest.fixture
+def users_schema():
+    type_defs = gql(
+        """
+        type Query {
+            hello: String!
+            user(id: ID!, fields: [String!]): User
+            fail: String
+        }
+
+        type Mutation {
+            rename(id: ID!, name: String!): User!
+        }
+
+        type User {
+            id: ID!
+            name: String!
+        }
+        """
+    )
+    query = QueryType()
+    query.set_field("hello", lambda *_: "Hello!")
+    query.set_field("user", lambda *_, id, **__: {"id": id, "name": f"User {id}"})
+
+    @query.field("fail")
+    def resolve_fail(*_):
+        raise ValueError("Failed")
+
+    mutation = MutationType()
+    mutation.set_field("rename", lambda *_, id, name: {"id": id, "name": name})
+    return make_executable_schema(type_defs, query, mutation)
+
+
+def create_appsync_event(type_name, field_name, arguments, selection_set=""):
+    return {
+        "arguments": arguments,
+        "identity": None,
+        "source": None,
+        "request": {"headers": {"Authorization": "token"}},
+        "info": {
+            "parentTypeName": type_name,
+            "fieldName": field_name,
+            "selectionSetGraphQL": selection_set,
+            "variables": {},
+        },
+        "prev": None,
+        "stash": {},
+    }
+
+
+def test_build_appsync_query_uses_argument_types_from_schema(users_schema):
+    # Given
+    event = create_appsync_event("Query", "user", {"id": "1"}, "{\n  id\n  name\n}")
+
+    # When
+    data = build_appsync_query(users_schema, event)
+
+    # Then
+    assert data == {
+        "query": "query($id: ID!) { user(id: $id) {\n  id\n  name\n} }",
+        "variables": {"id": "1"},
+    }
+
+
+def test_build_appsync_query_rejects_non_root_fields(users_schema):
+    # Given
+    event = create_appsync_event("User", "name", {})
+
+    # When / Then
+    with pytest.raises(ValueError):
+        build_appsync_query(users_schema, event)
+
+
+@pytest.mark.asyncio
+async def test_handle_returns_result_of_direct_invocation(users_schema):
+    # Given
+    app = GraphQLLambda(users_schema, http_handler=GraphQLDirectInvokeHandler())
+    event = {"query": "query Hello { hello }", "operationName": "Hello"}
+
+    # When
+    result = await app(event, MagicMock())
+
+    # Then
+    assert result == {"data": {"hello": "Hello!"}}
+
+
+@pytest.mark.asyncio
+async def test_handle_returns_errors_of_direct_invocation(users_schema):
+    # Given
+    app = GraphQLLambda(users_schema, http_handler=GraphQLDirectInvokeHandler())
+
+    # When
+    result = await app({"query": "{ unknown }"}, MagicMock())
+
+    # Then
+    assert "data" not in result
+    assert "Cannot query field 'unknown'" in result["errors"][0]["message"]
+
+
+@pytest.mark.asyncio
+async def test_handle_returns_field_value_of_appsync_event(users_schema):
+    # Given
+    app = GraphQLLambda(users_schema, http_handler=GraphQLDirectInvokeHandler())
+    event = create_appsync_event("Mutation", "rename", {"id": "1", "name": "Bob"}, "{ name }")
+
+    # When
+    result = await app(event, MagicMock())
+
+    # Then
+    assert result == {"name": "Bob"}
+
+
+@pytest.mark.asyncio
+async def test_handle_raises_error_of_appsync_event(users_schema):
+    # Given
+    app = GraphQLLambda(users_schema, http_handler=GraphQLDirectInvokeHandler())
+    event = create_appsync_event("Query", "fail", {})
+
+    # When / Then
+    with pytest.raises(AppSyncResolverError, match="Failed"):
+        await app(event, MagicMock())
+
+
+@pytest.mark.asyncio
+async def test_handle_resolves_batched_appsync_events(users_schema):
+    # Given
+    app = GraphQLLambda(users_schema, http_handler=GraphQLDirectInvokeHandler())
+    events = [
+        create_appsync_event("Query", "user", {"id": "1"}, "{ id }"),
+        create_appsync_event("Query", "fail", {}),
+        create_appsync_event("Query", "user", {"id": "2"}, "{ id }"),
+    ]
+
+    # When
+    result = await app(events, MagicMock())
+
+    # Then
+    assert result == [{"id": "1"}, None, {"id": "2"}]
+    assert app.http_handler.document_cache.stats()["size"] == 2
@@ -0,0 +1,70 @@
+import asyncio
+import signal
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from ariadne_lambda.event_loop import EventLoopRunner
+
+
+async def get_running_loop():
+    return asyncio.get_running_loop()
+
+
+def test_event_loop_runner_reuses_loop():
+    # Given
+    runner = EventLoopRunner()
+
+    # When
+    first_loop = runner.run(get_running_loop())
+    second_loop = runner.run(get_running_loop())
+
+    # Then
+    assert first_loop is second_loop
+    runner.close()
+
+
+def test_event_loop_runner_creates_new_loop_after_close():
+    # Given
+    runner = EventLoopRunner()
+    first_loop = runner.run(get_running_loop())
+
+    # When
+    runner.close()
+    second_loop = runner.run(get_running_loop())
+
+    # Then
+    assert first_loop.is_closed()
+    assert first_loop is not second_loop
+    runner.close()
+
+
+def test_event_loop_runner_with_uvloop():
+    # Given
+    uvloop = pytest.importorskip("uvloop")
+    runner = EventLoopRunner(use_uvloop=True)
+
+    # When
+    loop = runner.run(get_running_loop())
+
+    # Then
+    assert isinstance(loop, uvloop.Loop)
+    runner.close()
+
+
+def test_sigterm_handler_runs_shutdown_callbacks_and_previous_handler():
+    # Given
+    calls = []
+    previous_handler = MagicMock(side_effect=lambda *_: calls.append("previous"))
+    runner = EventLoopRunner()
+    runner.run(get_running_loop())
+    with patch("ariadne_lambda.event_loop.signal.signal", return_value=previous_handler):
+        runner.on_shutdown(AsyncMock(side_effect=lambda: calls.append("callback")))
+
+    # When
+    with pytest.raises(SystemExit):
+        runner.handle_sigterm(signal.SIGTERM, None)
+
+    # Then
+    assert calls == ["callback", "previous"]
+    previous_handler.assert_called_once_with(signal.SIGTERM, None)
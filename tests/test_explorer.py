@@ -0,0 +1,15 @@
+from ariadne.explorer import ExplorerPlayground
+
+from ariadne_lambda.explorer import LazyExplorer
+
+
+def test_lazy_explorer_creates_explorer_on_first_use():
+    # Given
+    explorer = LazyExplorer("ExplorerPlayground", title="Test API")
+
+    # When
+    html = explorer.html(None)
+
+    # Then
+    assert isinstance(explorer.get_explorer(), ExplorerPlayground)
+    assert "Test API" in html
@@ -3,6 +3,7 @@ from unittest.mock import AsyncMock, MagicMock, patch
 import pytest
 from graphql import GraphQLSchema
 
+from ariadne_lambda.explorer import LazyExplorer
 from ariadne_lambda.graphql import GraphQLLambda
 from ariadne_lambda.http_handler import GraphQLAWSAPIHTTPGatewayHandler
 
@@ -59,3 +60,36 @@ async def test_graphql_lambda_call(schema, event, context, http_handler_mock):
     # Then
     http_handler_mock.handle.assert_called_once_with(event, context)
     assert response == {"statusCode": 200, "body": '{"data": {"test": "value"}}'}
+
+
+def test_graphql_lambda_as_handler(schema, event, context, http_handler_mock):
+    # Given
+    http_handler_mock.handle = AsyncMock(return_value={"statusCode": 200})
+    graphql_lambda = GraphQLLambda(schema, http_handler=http_handler_mock)
+    handler = graphql_lambda.as_handler()
+
+    # When
+    first_response = handler(event, context)
+    second_response = handler(event, context)
+
+    # Then
+    assert first_response == second_response == {"statusCode": 200}
+    assert http_handler_mock.handle.call_count == 2
+    assert graphql_lambda.event_loop_runner.loop.is_running() is False
+    graphql_lambda.event_loop_runner.close()
+
+
+def test_graphql_lambda_without_explorer(schema):
+    # When
+    graphql_lambda = GraphQLLambda(schema, explorer=False)
+
+    # Then
+    assert graphql_lambda.http_handler.explorer is None
+
+
+def test_graphql_lambda_default_explorer_is_lazy(schema):
+    # When
+    graphql_lambda = GraphQLLambda(schema)
+
+    # Then
+    assert isinstance(graphql_lambda.http_handler.explorer, LazyExplorer)
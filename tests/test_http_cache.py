@@ -0,0 +1,230 @@
+import json
+from unittest.mock import MagicMock
+
+import pytest
+from ariadne import QueryType, gql, make_executable_schema
+from graphql import parse
+
+from ariadne_lambda.http_cache import (
+    CACHE_CONTROL_TYPE_DEFS,
+    CachePolicy,
+    HttpCache,
+    cache_policy_var,
+    get_etag,
+    get_static_cache_policy,
+    is_etag_matching,
+    set_cache_hint,
+)
+from ariadne_lambda.http_handler import GraphQLAWSAPIHTTPGatewayHandler
+from ariadne_lambda.result_cache import ResultCache
+
+
+@pytest.fixture
+def cache_control_schema():
+    type_defs = gql(
+        CACHE_CONTROL_TYPE_DEFS
+        + """
+        type Query {
+            products: [Product!]! @cacheControl(maxAge: 60)
+            me: User
+            hint: String!
+            privateHint: String! @cacheControl(maxAge: 60)
+        }
+
+        type Product @cacheControl(maxAge: 300) {
+            name: String!
+            price: Int! @cacheControl(maxAge: 30)
+        }
+
+        type User @cacheControl(maxAge: 120, scope: PRIVATE) {
+            name: String!
+        }
+        """
+    )
+    query = QueryType()
+    query.set_field("products", lambda *_: [{"name": "Shirt", "price": 10}])
+
+    @query.field("hint")
+    def resolve_hint(*_):
+        set_cache_hint(max_age=5)
+        return "hint"
+
+    @query.field("privateHint")
+    def resolve_private_hint(*_):
+        set_cache_hint(scope="PRIVATE")
+        return "hint"
+
+    return make_executable_schema(type_defs, query)
+
+
+@pytest.mark.parametrize(
+    ("query", "max_age", "scope"),
+    [
+        ("{ products { name } }", 60, "PUBLIC"),
+        ("{ products { name price } }", 30, "PUBLIC"),
+        ("{ me { name } }", 120, "PRIVATE"),
+        ("{ hint }", 0, "PUBLIC"),
+    ],
+)
+def test_get_static_cache_policy(cache_control_schema, query, max_age, scope):
+    # When
+    cache_policy = get_static_cache_policy(cache_control_schema, parse(query))
+
+    # Then
+    assert cache_policy.max_age == max_age
+    assert cache_policy.scope == scope
+
+
+def test_get_static_cache_policy_uses_default_max_age(cache_control_schema):
+    # When
+    cache_policy = get_static_cache_policy(
+        cache_control_schema, parse("{ hint }"), default_max_age=10
+    )
+
+    # Then
+    assert cache_policy.max_age == 10
+
+
+def test_set_cache_hint_restricts_current_cache_policy():
+    # Given
+    cache_policy = CachePolicy(max_age=60)
+    token = cache_policy_var.set(cache_policy)
+
+    # When
+    set_cache_hint(max_age=120)
+    set_cache_hint(max_age=10, scope="PRIVATE")
+    cache_policy_var.reset(token)
+
+    # Then
+    assert cache_policy.get_cache_control_header() == "max-age=10, private"
+
+
+def test_set_cache_hint_without_cache_policy_does_nothing():
+    # When / Then
+    set_cache_hint(max_age=10)
+
+
+@pytest.mark.parametrize(
+    ("if_none_match", "matches"),
+    [
+        ('W/"abc"', True),
+        ('"abc"', True),
+        ('"xyz", W/"abc"', True),
+        ("*", True),
+        ('"xyz"', False),
+    ],
+)
+def test_is_etag_matching(if_none_match, matches):
+    # When / Then
+    assert is_etag_matching(if_none_match, 'W/"abc"') is matches
+
+
+def test_get_etag_is_stable():
+    # When / Then
+    assert get_etag('{"data": {}}') == get_etag(b'{"data": {}}')
+    assert get_etag('{"data": {}}') != get_etag('{"data": null}')
+
+
+@pytest.fixture
+def http_cache_handler(cache_control_schema):
+    handler = GraphQLAWSAPIHTTPGatewayHandler(http_cache=HttpCache())
+    handler.configure(cache_control_schema, execute_get_queries=True)
+    return handler
+
+
+def create_get_event(event, query, **headers):
+    event["httpMethod"] = "GET"
+    event["queryStringParameters"] = {"query": query}
+    event["headers"] = headers
+    return event
+
+
+@pytest.mark.asyncio
+async def test_handle_get_query_sets_caching_headers(
+    http_cache_handler, api_gateway_v1_event_payload
+):
+    # Given
+    event = create_get_event(api_gateway_v1_event_payload, "{ products { name } }")
+
+    # When
+    result = await http_cache_handler.handle(event, MagicMock())
+
+    # Then
+    assert json.loads(result["body"]) == {"data": {"products": [{"name": "Shirt"}]}}
+    assert result["headers"]["Cache-Control"] == "max-age=60, public"
+    assert result["headers"]["ETag"] == get_etag(result["body"])
+
+
+@pytest.mark.asyncio
+async def test_handle_get_query_applies_resolver_cache_hints(
+    cache_control_schema, api_gateway_v1_event_payload
+):
+    # Given
+    handler = GraphQLAWSAPIHTTPGatewayHandler(http_cache=HttpCache(default_max_age=60))
+    handler.configure(cache_control_schema, execute_get_queries=True)
+    event = create_get_event(api_gateway_v1_event_payload, "{ hint }")
+
+    # When
+    result = await handler.handle(event, MagicMock())
+
+    # Then
+    assert result["headers"]["Cache-Control"] == "max-age=5, public"
+
+
+@pytest.mark.asyncio
+async def test_handle_get_query_returns_not_modified_for_matching_etag(
+    http_cache_handler, api_gateway_v1_event_payload
+):
+    # Given
+    event = create_get_event(api_gateway_v1_event_payload, "{ products { name } }")
+    first_result = await http_cache_handler.handle(event, MagicMock())
+    event = create_get_event(
+        api_gateway_v1_event_payload,
+        "{ products { name } }",
+        **{"If-None-Match": first_result["headers"]["ETag"]},
+    )
+
+    # When
+    result = await http_cache_handler.handle(event, MagicMock())
+
+    # Then
+    assert result["statusCode"] == 304
+    assert result["body"] == ""
+    assert result["headers"]["ETag"] == first_result["headers"]["ETag"]
+
+
+@pytest.mark.asyncio
+async def test_handle_get_query_with_errors_is_not_cached(
+    http_cache_handler, api_gateway_v1_event_payload
+):
+    # Given
+    event = create_get_event(api_gateway_v1_event_payload, "{ unknown }")
+
+    # When
+    result = await http_cache_handler.handle(event, MagicMock())
+
+    # Then
+    assert result["statusCode"] == 400
+    assert result["headers"]["Cache-Control"] == "no-store"
+    assert "ETag" not in result["headers"]
+
+
+@pytest.mark.asyncio
+async def test_handle_get_query_applies_cache_hints_of_cached_result(
+    cache_control_schema, api_gateway_v1_event_payload
+):
+    # Given
+    handler = GraphQLAWSAPIHTTPGatewayHandler(http_cache=HttpCache())
+    handler.configure(
+        cache_control_schema, execute_get_queries=True, result_cache=ResultCache(shared=True)
+    )
+    event = create_get_event(api_gateway_v1_event_payload, "{ privateHint }")
+    first_result = await handler.handle(event, MagicMock())
+
+    # When
+    result = await handler.handle(event, MagicMock())
+
+    # Then
+    assert handler.result_cache.stats()["hits"] == 1
+    assert first_result["headers"]["Cache-Control"] == "max-age=60, private"
+    assert result["headers"]["Cache-Control"] == "max-age=60, private"
@@ -1,12 +1,23 @@
+import asyncio
+import gzip
+import json
+from base64 import b64decode, b64encode
 from unittest.mock import AsyncMock, MagicMock
 
 import pytest
+from ariadne import QueryType, gql, make_executable_schema
 
+from ariadne_lambda.cache import DocumentCache
+from ariadne_lambda.compression import ResponseCompression
 from ariadne_lambda.http_handler import (
     GraphQLAWSAPIHTTPGatewayHandler,
     Request,
     Response,
 )
+from ariadne_lambda.json_codec import StdlibJSONCodec
+from ariadne_lambda.persisted_queries import InMemoryPersistedQueryStore, get_query_hash
+from ariadne_lambda.timing import Timing
+from ariadne_lambda.trusted_documents import TrustedDocuments
 
 
 @pytest.fixture
@@ -134,3 +145,426 @@ async def test_render_explorer_no_explorer(handler, api_gateway_v1_event_payload
 
     # Then
     assert response.status_code == 405
+
+
+@pytest.fixture
+def executable_schema():
+    type_defs = gql(
+        """
+        type Query {
+            hello: String!
+        }
+        """
+    )
+    query = QueryType()
+    query.set_field("hello", lambda *_: "world")
+    return make_executable_schema(type_defs, query)
+
+
+@pytest.fixture
+def cached_handler(executable_schema):
+    handler = GraphQLAWSAPIHTTPGatewayHandler()
+    handler.configure(executable_schema, document_cache=DocumentCache())
+    return handler
+
+
+@pytest.mark.asyncio
+async def test_execute_graphql_query_reuses_cached_document(
+    cached_handler, api_gateway_v1_event_payload
+):
+    # Given
+    request = Request.create_from_event(api_gateway_v1_event_payload)
+    request.method = "POST"
+    data = {"query": "{ hello }"}
+
+    # When
+    first_result = await cached_handler.execute_graphql_query(request, data)
+    second_result = await cached_handler.execute_graphql_query(request, data)
+
+    # Then
+    assert first_result == second_result == (True, {"data": {"hello": "world"}})
+    assert cached_handler.document_cache.stats()["hits"] == 1
+    assert cached_handler.document_cache.stats()["misses"] == 1
+
+
+@pytest.mark.asyncio
+async def test_execute_graphql_query_returns_cached_validation_errors(
+    cached_handler, api_gateway_v1_event_payload
+):
+    # Given
+    request = Request.create_from_event(api_gateway_v1_event_payload)
+    request.method = "POST"
+    data = {"query": "{ unknown }"}
+
+    # When
+    await cached_handler.execute_graphql_query(request, data)
+    success, result = await cached_handler.execute_graphql_query(request, data)
+
+    # Then
+    assert success is False
+    assert "unknown" in result["errors"][0]["message"]
+    assert cached_handler.document_cache.stats()["hits"] == 1
+
+
+@pytest.mark.asyncio
+async def test_execute_graphql_query_does_not_cache_syntax_errors(
+    cached_handler, api_gateway_v1_event_payload
+):
+    # Given
+    request = Request.create_from_event(api_gateway_v1_event_payload)
+    request.method = "POST"
+
+    # When
+    success, result = await cached_handler.execute_graphql_query(request, {"query": "{ hello"})
+
+    # Then
+    assert success is False
+    assert "Syntax Error" in result["errors"][0]["message"]
+    assert len(cached_handler.document_cache) == 0
+
+
+@pytest.fixture
+def persisted_query_handler(executable_schema):
+    handler = GraphQLAWSAPIHTTPGatewayHandler()
+    handler.configure(
+        executable_schema,
+        execute_get_queries=True,
+        persisted_query_store=InMemoryPersistedQueryStore(),
+    )
+    return handler
+
+
+@pytest.mark.asyncio
+async def test_graphql_http_server_persisted_query_round_trip(
+    persisted_query_handler, api_gateway_v1_event_payload
+):
+    # Given
+    query = "{ hello }"
+    extensions = {"persistedQuery": {"version": 1, "sha256Hash": get_query_hash(query)}}
+    request = Request.create_from_event(api_gateway_v1_event_payload)
+    request.method = "POST"
+    request.headers = {"content-type": "application/json"}
+
+    # When
+    request.body = json.dumps({"extensions": extensions})
+    not_found_response = await persisted_query_handler.graphql_http_server(request)
+    request.body = json.dumps({"query": query, "extensions": extensions})
+    registered_response = await persisted_query_handler.graphql_http_server(request)
+    request.body = json.dumps({"extensions": extensions})
+    persisted_response = await persisted_query_handler.graphql_http_server(request)
+
+    # Then
+    assert not_found_response.status_code == 200
+    assert json.loads(not_found_response.body)["errors"][0]["message"] == "PersistedQueryNotFound"
+    assert json.loads(registered_response.body) == {"data": {"hello": "world"}}
+    assert json.loads(persisted_response.body) == {"data": {"hello": "world"}}
+
+
+@pytest.mark.asyncio
+async def test_graphql_http_server_rejects_persisted_query_registration_with_trusted_documents(
+    executable_schema, api_gateway_v1_event_payload
+):
+    # Given
+    query = "{ hello }"
+    query_hash = get_query_hash(query)
+    handler = GraphQLAWSAPIHTTPGatewayHandler()
+    handler.configure(
+        executable_schema,
+        persisted_query_store=InMemoryPersistedQueryStore(),
+        trusted_documents=TrustedDocuments({query_hash: query}),
+    )
+    request = Request.create_from_event(api_gateway_v1_event_payload)
+    request.method = "POST"
+    request.headers = {"content-type": "application/json"}
+    extensions = {"persistedQuery": {"version": 1, "sha256Hash": query_hash}}
+
+    # When
+    request.body = json.dumps({"query": query, "extensions": extensions})
+    registered_response = await handler.graphql_http_server(request)
+    request.body = json.dumps({"extensions": extensions})
+    trusted_response = await handler.graphql_http_server(request)
+
+    # Then
+    assert registered_response.status_code == 400
+    assert json.loads(registered_response.body)["errors"][0]["extensions"] == {
+        "code": "PERSISTED_QUERY_REGISTRATION_NOT_ALLOWED"
+    }
+    assert json.loads(trusted_response.body) == {"data": {"hello": "world"}}
+    assert await handler.persisted_query_store.get(query_hash) is None
+
+
+@pytest.mark.asyncio
+async def test_graphql_http_server_doesnt_store_invalid_persisted_query(
+    persisted_query_handler, api_gateway_v1_event_payload
+):
+    # Given
+    query = "{ unknownField }"
+    extensions = {"persistedQuery": {"version": 1, "sha256Hash": get_query_hash(query)}}
+    request = Request.create_from_event(api_gateway_v1_event_payload)
+    request.method = "POST"
+    request.headers = {"content-type": "application/json"}
+    request.body = json.dumps({"query": query, "extensions": extensions})
+
+    # When
+    response = await persisted_query_handler.graphql_http_server(request)
+
+    # Then
+    assert response.status_code == 400
+    assert await persisted_query_handler.persisted_query_store.get(get_query_hash(query)) is None
+
+
+@pytest.mark.asyncio
+async def test_handle_request_get_persisted_query_by_hash(
+    persisted_query_handler, api_gateway_v1_event_payload
+):
+    # Given
+    query = "{ hello }"
+    await persisted_query_handler.persisted_query_store.set(get_query_hash(query), query)
+    extensions = {"persistedQuery": {"version": 1, "sha256Hash": get_query_hash(query)}}
+    request = Request.create_from_event(api_gateway_v1_event_payload)
+    request.params = {"extensions": json.dumps(extensions)}
+
+    # When
+    response = await persisted_query_handler.handle_request(request)
+
+    # Then
+    assert response.status_code == 200
+    assert json.loads(response.body) == {"data": {"hello": "world"}}
+
+
+@pytest.mark.asyncio
+async def test_graphql_http_server_uses_configured_json_codec(
+    executable_schema, api_gateway_v1_event_payload
+):
+    # Given
+    json_codec = MagicMock(wraps=StdlibJSONCodec())
+    handler = GraphQLAWSAPIHTTPGatewayHandler()
+    handler.configure(executable_schema, json_codec=json_codec)
+    request = Request.create_from_event(api_gateway_v1_event_payload)
+    request.method = "POST"
+    request.headers = {"content-type": "application/json"}
+    request.body = '{"query": "{ hello }"}'
+
+    # When
+    response = await handler.graphql_http_server(request)
+
+    # Then
+    json_codec.loads.assert_called_once_with(request.body)
+    json_codec.dumps.assert_called_once_with({"data": {"hello": "world"}})
+    assert json.loads(response.body) == {"data": {"hello": "world"}}
+
+
+@pytest.mark.asyncio
+async def test_handle_compresses_response(executable_schema, api_gateway_v1_event_payload):
+    # Given
+    handler = GraphQLAWSAPIHTTPGatewayHandler(
+        response_compression=ResponseCompression(min_size=0, encodings=("gzip",))
+    )
+    handler.configure(executable_schema)
+    api_gateway_v1_event_payload["httpMethod"] = "POST"
+    api_gateway_v1_event_payload["headers"]["Content-Type"] = "application/json"
+    api_gateway_v1_event_payload["headers"]["Accept-Encoding"] = "gzip, deflate"
+    aliases = {f"hello{i}": "world" for i in range(50)}
+    selections = " ".join(f"{alias}: hello" for alias in aliases)
+    query = f"{{ {selections} }}"
+    api_gateway_v1_event_payload["body"] = json.dumps({"query": query})
+
+    # When
+    result = await handler.handle(api_gateway_v1_event_payload, MagicMock())
+
+    # Then
+    assert result["isBase64Encoded"] is True
+    assert result["headers"]["Content-Encoding"] == "gzip"
+    assert json.loads(gzip.decompress(b64decode(result["body"]))) == {"data": aliases}
+
+
+@pytest.mark.asyncio
+async def test_handle_decodes_base64_encoded_json_body(
+    executable_schema, api_gateway_v1_event_payload
+):
+    # Given
+    handler = GraphQLAWSAPIHTTPGatewayHandler()
+    handler.configure(executable_schema)
+    api_gateway_v1_event_payload["httpMethod"] = "POST"
+    api_gateway_v1_event_payload["headers"]["Content-Type"] = "application/json"
+    api_gateway_v1_event_payload["body"] = b64encode(b'{"query": "{ hello }"}').decode()
+    api_gateway_v1_event_payload["isBase64Encoded"] = True
+
+    # When
+    result = await handler.handle(api_gateway_v1_event_payload, MagicMock())
+
+    # Then
+    assert result["statusCode"] == 200
+    assert json.loads(result["body"]) == {"data": {"hello": "world"}}
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("is_base64_encoded", [False, True])
+async def test_handle_rejects_json_body_over_max_body_size(
+    executable_schema, api_gateway_v1_event_payload, is_base64_encoded
+):
+    # Given
+    handler = GraphQLAWSAPIHTTPGatewayHandler(max_body_size=100)
+    handler.configure(executable_schema)
+    body = json.dumps({"query": "{ hello }", "variables": {"value": "x" * 100}})
+    if is_base64_encoded:
+        body = b64encode(body.encode()).decode()
+    api_gateway_v1_event_payload["httpMethod"] = "POST"
+    api_gateway_v1_event_payload["headers"]["Content-Type"] = "application/json"
+    api_gateway_v1_event_payload["body"] = body
+    api_gateway_v1_event_payload["isBase64Encoded"] = is_base64_encoded
+
+    # When
+    result = await handler.handle(api_gateway_v1_event_payload, MagicMock())
+
+    # Then
+    assert result["statusCode"] == 413
+
+
+def create_batch_request(event, operations):
+    request = Request.create_from_event(event)
+    request.method = "POST"
+    request.headers = {"content-type": "application/json"}
+    request.body = json.dumps(operations)
+    return request
+
+
+@pytest.mark.asyncio
+async def test_graphql_http_server_executes_batched_operations(
+    executable_schema, api_gateway_v1_event_payload
+):
+    # Given
+    handler = GraphQLAWSAPIHTTPGatewayHandler(batch_max_size=10)
+    handler.configure(executable_schema)
+    request = create_batch_request(
+        api_gateway_v1_event_payload,
+        [{"query": "{ hello }"}, {"query": "{ unknown }"}],
+    )
+
+    # When
+    response = await handler.graphql_http_server(request)
+
+    # Then
+    results = json.loads(response.body)
+    assert response.status_code == 200
+    assert results[0] == {"data": {"hello": "world"}}
+    assert "unknown" in results[1]["errors"][0]["message"]
+
+
+@pytest.mark.asyncio
+async def test_graphql_http_server_returns_bad_request_when_all_batched_operations_fail(
+    executable_schema, api_gateway_v1_event_payload
+):
+    # Given
+    handler = GraphQLAWSAPIHTTPGatewayHandler(batch_max_size=10)
+    handler.configure(executable_schema)
+    request = create_batch_request(
+        api_gateway_v1_event_payload, [{"query": "{ unknown }"}, {"query": "{"}]
+    )
+
+    # When
+    response = await handler.graphql_http_server(request)
+
+    # Then
+    results = json.loads(response.body)
+    assert response.status_code == 400
+    assert len(results) == 2
+    assert all("errors" in result for result in results)
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(("shared_context", "contexts_data"), [(True, [2]), (False, [1, 1])])
+async def test_graphql_http_server_batched_operations_context(
+    executable_schema, api_gateway_v1_event_payload, shared_context, contexts_data
+):
+    # Given
+    contexts = []
+
+    def context_value(request, data):
+        contexts.append(data)
+        return {"request": request}
+
+    handler = GraphQLAWSAPIHTTPGatewayHandler(
+        batch_max_size=10, batch_shared_context=shared_context
+    )
+    handler.configure(executable_schema, context_value=context_value)
+    request = create_batch_request(
+        api_gateway_v1_event_payload, [{"query": "{ hello }"}, {"query": "{ hello }"}]
+    )
+
+    # When
+    response = await handler.graphql_http_server(request)
+
+    # Then
+    assert response.status_code == 200
+    assert [len(data) if isinstance(data, list) else 1 for data in contexts] == contexts_data
+
+
+@pytest.mark.asyncio
+async def test_graphql_http_server_rejects_batch_over_max_size(
+    executable_schema, api_gateway_v1_event_payload
+):
+    # Given
+    handler = GraphQLAWSAPIHTTPGatewayHandler(batch_max_size=1)
+    handler.configure(executable_schema)
+    request = create_batch_request(
+        api_gateway_v1_event_payload, [{"query": "{ hello }"}, {"query": "{ hello }"}]
+    )
+
+    # When
+    response = await handler.graphql_http_server(request)
+
+    # Then
+    assert response.status_code == 400
+    assert response.body == "Batched request can't contain more than 1 operations"
+
+
+@pytest.mark.asyncio
+async def test_execute_graphql_batch_limits_concurrency(api_gateway_v1_event_payload):
+    # Given
+    running = []
+    max_running = []
+
+    async def execute_operation(request, data, *, context_value=None):
+        running.append(data)
+        max_running.append(len(running))
+        await asyncio.sleep(0)
+        running.remove(data)
+        return True, {"data": data}
+
+    handler = GraphQLAWSAPIHTTPGatewayHandler(batch_max_size=10, batch_concurrency=2)
+    handler.get_context_for_request = AsyncMock(return_value={})
+    handler.execute_operation = execute_operation
+    request = Request.create_from_event(api_gateway_v1_event_payload)
+
+    # When
+    success, results = await handler.execute_graphql_batch(request, [1, 2, 3, 4, 5])
+
+    # Then
+    assert success is True
+    assert results == [{"data": i} for i in range(1, 6)]
+    assert max(max_running) == 2
+
+
+@pytest.mark.asyncio
+async def test_handle_reports_phases_timing(executable_schema, api_gateway_v1_event_payload):
+    # Given
+    emitted = []
+    handler = GraphQLAWSAPIHTTPGatewayHandler()
+    handler.configure(executable_schema, timing=Timing(emit=emitted.append))
+    api_gateway_v1_event_payload["httpMethod"] = "POST"
+    api_gateway_v1_event_payload["headers"]["Content-Type"] = "application/json"
+    api_gateway_v1_event_payload["body"] = json.dumps(
+        {"query": "query Hello { hello }", "operationName": "Hello"}
+    )
+
+    # When
+    result = await handler.handle(api_gateway_v1_event_payload, MagicMock())
+
+    # Then
+    assert json.loads(result["body"]) == {"data": {"hello": "world"}}
+    phases = [item.split(";")[0] for item in result["headers"]["Server-Timing"].split(", ")]
+    assert phases == ["request", "parse", "validate", "execute", "encode", "total"]
+    log = json.loads(emitted[0])
+    assert log["OperationName"] == "Hello"
+    assert log["executeTime"] > 0
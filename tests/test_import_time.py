@@ -0,0 +1,31 @@
+import subprocess
+import sys
+
+# Modules that are not needed to serve GraphQL requests and should be imported lazily
+LAZY_MODULES = [
+    "ariadne.asgi",
+    "ariadne.explorer",
+    "aws_lambda_powertools",
+    "pydantic",
+    "ariadne_lambda.compression",
+    "ariadne_lambda.deadline",
+    "ariadne_lambda.streaming",
+    "ariadne_lambda.dataloaders",
+    "ariadne_lambda.http_cache",
+    "ariadne_lambda.persisted_queries",
+]
+
+IMPORT_STATEMENT = "import ariadne_lambda.graphql"
+
+
+def test_package_import_does_not_load_lazy_modules():
+    result = subprocess.run(
+        [sys.executable, "-c", f"{IMPORT_STATEMENT}; import sys; print('\\n'.join(sys.modules))"],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    imported_modules = result.stdout.splitlines()
+
+    for lazy_module in LAZY_MODULES:
+        assert lazy_module not in imported_modules
@@ -0,0 +1,50 @@
+import pytest
+
+from ariadne_lambda.json_codec import StdlibJSONCodec, get_json_codec
+
+RESULT = {"data": {"products": [{"id": "1", "name": "Zażółć", "price": 9.5, "tags": None}]}}
+
+
+@pytest.fixture(params=["json", "orjson", "ujson", "msgspec"])
+def codec(request):
+    if request.param != "json":
+        pytest.importorskip(request.param)
+    return get_json_codec(request.param)
+
+
+def test_codec_round_trip(codec):
+    # When
+    encoded = codec.dumps(RESULT)
+    encoded_bytes = codec.dumps_bytes(RESULT)
+
+    # Then
+    assert isinstance(encoded, str)
+    assert isinstance(encoded_bytes, bytes)
+    assert codec.loads(encoded) == RESULT
+    assert codec.loads(encoded_bytes) == RESULT
+
+
+@pytest.mark.parametrize("data", ["{invalid", b"{invalid"])
+def test_codec_loads_raises_value_error_for_invalid_json(codec, data):
+    # Then
+    with pytest.raises(ValueError):
+        codec.loads(data)
+
+
+def test_get_json_codec_raises_error_for_unknown_codec():
+    # Then
+    with pytest.raises(ValueError):
+        get_json_codec("unknown")
+
+
+def test_get_json_codec_auto_returns_installed_codec():
+    # When
+    codec = get_json_codec()
+
+    # Then
+    assert codec.loads(codec.dumps(RESULT)) == RESULT
+
+
+def test_stdlib_codec_dumps_bytes():
+    # Then
+    assert StdlibJSONCodec().dumps_bytes({"a": "ą"}) == b'{"a": "\\u0105"}'
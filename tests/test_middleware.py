@@ -0,0 +1,190 @@
+import json
+from contextlib import asynccontextmanager, contextmanager
+from unittest.mock import MagicMock
+
+import pytest
+from ariadne import QueryType, gql, make_executable_schema
+from ariadne.types import Extension
+from graphql import MiddlewareManager
+
+from ariadne_lambda.graphql import GraphQLLambda
+from ariadne_lambda.http_handler import GraphQLAWSAPIHTTPGatewayHandler
+from ariadne_lambda.middleware import TracingMiddleware
+
+
+@pytest.fixture
+def users_schema():
+    type_defs = gql(
+        """
+        type Query {
+            hello: String!
+            user: User!
+            fail: String
+        }
+
+        type User {
+            name: String!
+        }
+        """
+    )
+    query = QueryType()
+    query.set_field("hello", lambda *_: "hello")
+
+    @query.field("user")
+    async def resolve_user(*_):
+        return {"name": "bob"}
+
+    @query.field("fail")
+    def resolve_fail(*_):
+        raise ValueError("Failed")
+
+    return make_executable_schema(type_defs, query)
+
+
+@pytest.fixture
+def event(api_gateway_v1_event_payload):
+    api_gateway_v1_event_payload["httpMethod"] = "POST"
+    api_gateway_v1_event_payload["headers"]["Content-Type"] = "application/json"
+    api_gateway_v1_event_payload["body"] = json.dumps({"query": "{ hello user { name } }"})
+    return api_gateway_v1_event_payload
+
+
+def upper_middleware(next_, obj, info, **kwargs):
+    result = next_(obj, info, **kwargs)
+    return result.upper() if isinstance(result, str) else result
+
+
+class CountingMiddlewareManager(MiddlewareManager):
+    instances = 0
+
+    def __init__(self, *middlewares):
+        super().__init__(*middlewares)
+        CountingMiddlewareManager.instances += 1
+
+
+class NoopExtension(Extension):
+    pass
+
+
+@pytest.mark.asyncio
+async def test_static_middleware_is_applied(users_schema, event):
+    # Given
+    handler = GraphQLAWSAPIHTTPGatewayHandler(middleware=[upper_middleware])
+    app = GraphQLLambda(users_schema, http_handler=handler)
+
+    # When
+    response = await app(event, MagicMock())
+
+    # Then
+    assert json.loads(response["body"]) == {"data": {"hello": "HELLO", "user": {"name": "BOB"}}}
+
+
+@pytest.mark.asyncio
+async def test_middleware_factory_is_called_for_every_request(users_schema, event):
+    # Given
+    calls = []
+
+    async def get_middleware(request, context):
+        calls.append((request.method, context["request"] is request))
+        return [upper_middleware]
+
+    handler = GraphQLAWSAPIHTTPGatewayHandler(middleware=get_middleware)
+    app = GraphQLLambda(users_schema, http_handler=handler)
+
+    # When
+    await app(event, MagicMock())
+    response = await app(event, MagicMock())
+
+    # Then
+    assert json.loads(response["body"])["data"]["hello"] == "HELLO"
+    assert calls == [("POST", True), ("POST", True)]
+
+
+@pytest.mark.asyncio
+async def test_static_middleware_manager_is_shared_by_requests(users_schema, event):
+    # Given
+    CountingMiddlewareManager.instances = 0
+    handler = GraphQLAWSAPIHTTPGatewayHandler(
+        middleware=[upper_middleware], middleware_manager_class=CountingMiddlewareManager
+    )
+    app = GraphQLLambda(users_schema, http_handler=handler)
+
+    # When
+    await app(event, MagicMock())
+    await app(event, MagicMock())
+
+    # Then
+    assert CountingMiddlewareManager.instances == 1
+    assert isinstance(handler.middleware_manager, CountingMiddlewareManager)
+
+
+@pytest.mark.asyncio
+async def test_middleware_manager_is_created_per_request_with_extensions(users_schema, event):
+    # Given
+    CountingMiddlewareManager.instances = 0
+    handler = GraphQLAWSAPIHTTPGatewayHandler(
+        extensions=[NoopExtension],
+        middleware=[upper_middleware],
+        middleware_manager_class=CountingMiddlewareManager,
+    )
+    app = GraphQLLambda(users_schema, http_handler=handler)
+
+    # When
+    await app(event, MagicMock())
+    response = await app(event, MagicMock())
+
+    # Then
+    assert json.loads(response["body"])["data"]["hello"] == "HELLO"
+    assert CountingMiddlewareManager.instances == 2
+    assert handler.middleware_manager is None
+
+
+class FakeSubsegment:
+    def __init__(self, name):
+        self.name = name
+        self.annotations = {}
+        self.exceptions = []
+
+    def put_annotation(self, key, value):
+        self.annotations[key] = value
+
+    def add_exception(self, exception, stack):
+        self.exceptions.append(exception)
+
+
+class FakeProvider:
+    def __init__(self):
+        self.subsegments = []
+
+    @contextmanager
+    def in_subsegment(self, name=None):
+        self.subsegments.append(FakeSubsegment(name))
+        yield self.subsegments[-1]
+
+    @asynccontextmanager
+    async def in_subsegment_async(self, name=None):
+        self.subsegments.append(FakeSubsegment(name))
+        yield self.subsegments[-1]
+
+
+@pytest.mark.asyncio
+async def test_tracing_middleware_records_resolvers_in_subsegments(users_schema, event):
+    # Given
+    tracer = MagicMock(provider=FakeProvider())
+    handler = GraphQLAWSAPIHTTPGatewayHandler(middleware=[TracingMiddleware(tracer)])
+    app = GraphQLLambda(users_schema, http_handler=handler)
+    event["body"] = json.dumps({"query": "{ hello user { name } fail }"})
+
+    # When
+    response = await app(event, MagicMock())
+
+    # Then
+    assert json.loads(response["body"])["data"] == {
+        "hello": "hello",
+        "user": {"name": "bob"},
+        "fail": None,
+    }
+    subsegments = {subsegment.name: subsegment for subsegment in tracer.provider.subsegments}
+    assert sorted(subsegments) == ["## Query.fail", "## Query.hello", "## Query.user"]
+    assert subsegments["## Query.user"].annotations == {"graphql_path": "user"}
+    assert [str(error) for error in subsegments["## Query.fail"].exceptions] == ["Failed"]
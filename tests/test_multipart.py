@@ -0,0 +1,201 @@
+import json
+from base64 import b64encode
+from unittest.mock import MagicMock
+
+import pytest
+from ariadne import MutationType, gql, make_executable_schema, upload_scalar
+from ariadne.exceptions import HttpBadRequestError
+
+from ariadne_lambda.exceptions import HttpPayloadTooLargeError
+from ariadne_lambda.http_handler import GraphQLAWSAPIHTTPGatewayHandler
+from ariadne_lambda.multipart import MultipartParser, get_boundary
+
+BOUNDARY = b"----boundary"
+
+
+def create_multipart_body(fields: dict[str, str], files: dict[str, bytes]) -> bytes:
+    parts = []
+    for name, value in fields.items():
+        headers = f'Content-Disposition: form-data; name="{name}"\r\n\r\n'
+        parts.append(headers.encode() + value.encode())
+    for name, content in files.items():
+        headers = (
+            f'Content-Disposition: form-data; name="{name}"; filename="{name}.txt"\r\n'
+            "Content-Type: text/plain\r\n\r\n"
+        )
+        parts.append(headers.encode() + content)
+    body = b"".join(b"--" + BOUNDARY + b"\r\n" + part + b"\r\n" for part in parts)
+    return body + b"--" + BOUNDARY + b"--\r\n"
+
+
+def test_get_boundary_from_content_type():
+    # When
+    boundary = get_boundary('multipart/form-data; boundary="----boundary"')
+
+    # Then
+    assert boundary == BOUNDARY
+
+
+def test_get_boundary_raises_error_if_boundary_is_missing():
+    # When / Then
+    with pytest.raises(HttpBadRequestError):
+        get_boundary("multipart/form-data")
+
+
+def test_multipart_parser_parses_fields_and_files():
+    # Given
+    parser = MultipartParser()
+    body = create_multipart_body({"operations": "{}", "map": "{}"}, {"0": b"hello\r\nworld"})
+
+    # When
+    fields, files = parser.parse(body, BOUNDARY)
+
+    # Then
+    assert fields == {"operations": "{}", "map": "{}"}
+    assert files["0"].filename == "0.txt"
+    assert files["0"].content_type == "text/plain"
+    assert files["0"].size == 12
+    assert files["0"].read() == b"hello\r\nworld"
+
+
+def test_multipart_parser_spools_large_files_to_disk(tmp_path):
+    # Given
+    parser = MultipartParser(spool_max_size=10, temp_dir=str(tmp_path))
+    body = create_multipart_body({}, {"small": b"x" * 10, "large": b"x" * 11})
+
+    # When
+    _, files = parser.parse(body, BOUNDARY)
+
+    # Then
+    assert files["small"].file._rolled is False
+    assert files["large"].file._rolled is True
+    assert files["large"].read() == b"x" * 11
+
+
+def test_multipart_parser_rejects_file_over_max_size():
+    # Given
+    parser = MultipartParser(max_file_size=10)
+    body = create_multipart_body({}, {"0": b"x" * 11})
+
+    # When / Then
+    with pytest.raises(HttpPayloadTooLargeError):
+        parser.parse(body, BOUNDARY)
+
+
+def test_multipart_parser_rejects_body_over_max_total_size():
+    # Given
+    parser = MultipartParser(max_total_size=100)
+    body = create_multipart_body({}, {"0": b"x" * 100})
+
+    # When / Then
+    with pytest.raises(HttpPayloadTooLargeError):
+        parser.decode_body(b64encode(body).decode(), is_base64_encoded=True)
+
+
+def test_multipart_parser_rejects_field_not_encoded_with_utf8():
+    # Given
+    parser = MultipartParser()
+    body = create_multipart_body({"operations": "invalid"}, {}).replace(b"invalid", b"\xff\xfe")
+
+    # When / Then
+    with pytest.raises(HttpBadRequestError):
+        parser.parse(body, BOUNDARY)
+
+
+def test_multipart_parser_rejects_truncated_body():
+    # Given
+    parser = MultipartParser()
+    body = create_multipart_body({"operations": "{}"}, {})[:-20]
+
+    # When / Then
+    with pytest.raises(HttpBadRequestError):
+        parser.parse(body, BOUNDARY)
+
+
+@pytest.fixture
+def upload_schema():
+    type_defs = gql(
+        """
+        scalar Upload
+
+        type Query {
+            hello: String!
+        }
+
+        type Mutation {
+            upload(file: Upload!): String!
+        }
+        """
+    )
+    mutation = MutationType()
+    mutation.set_field("upload", lambda *_, file: f"{file.filename}: {file.read().decode()}")
+    return make_executable_schema(type_defs, mutation, upload_scalar)
+
+
+def create_upload_event(event, body: bytes):
+    event["httpMethod"] = "POST"
+    event["headers"]["Content-Type"] = f"multipart/form-data; boundary={BOUNDARY.decode()}"
+    event["body"] = b64encode(body).decode()
+    event["isBase64Encoded"] = True
+    return event
+
+
+@pytest.mark.asyncio
+async def test_handle_multipart_upload(upload_schema, api_gateway_v1_event_payload):
+    # Given
+    handler = GraphQLAWSAPIHTTPGatewayHandler()
+    handler.configure(upload_schema)
+    operations = {
+        "query": "mutation Upload($file: Upload!) { upload(file: $file) }",
+        "variables": {"file": None},
+    }
+    body = create_multipart_body(
+        {"operations": json.dumps(operations), "map": json.dumps({"0": ["variables.file"]})},
+        {"0": b"hello"},
+    )
+    event = create_upload_event(api_gateway_v1_event_payload, body)
+
+    # When
+    result = await handler.handle(event, MagicMock())
+
+    # Then
+    assert result["statusCode"] == 200
+    assert json.loads(result["body"]) == {"data": {"upload": "0.txt: hello"}}
+
+
+@pytest.mark.asyncio
+async def test_handle_multipart_upload_over_limit(upload_schema, api_gateway_v1_event_payload):
+    # Given
+    handler = GraphQLAWSAPIHTTPGatewayHandler(multipart_parser=MultipartParser(max_file_size=4))
+    handler.configure(upload_schema)
+    body = create_multipart_body(
+        {"operations": "{}", "map": json.dumps({"0": ["variables.file"]})},
+        {"0": b"hello"},
+    )
+    event = create_upload_event(api_gateway_v1_event_payload, body)
+
+    # When
+    result = await handler.handle(event, MagicMock())
+
+    # Then
+    assert result["statusCode"] == 413
+
+
+@pytest.mark.asyncio
+async def test_handle_multipart_field_not_encoded_with_utf8(
+    upload_schema, api_gateway_v1_event_payload
+):
+    # Given
+    handler = GraphQLAWSAPIHTTPGatewayHandler()
+    handler.configure(upload_schema)
+    body = create_multipart_body(
+        {"operations": "invalid", "map": json.dumps({"0": ["variables.file"]})},
+        {"0": b"hello"},
+    ).replace(b"invalid", b"\xff\xfe")
+    event = create_upload_event(api_gateway_v1_event_payload, body)
+
+    # When
+    result = await handler.handle(event, MagicMock())
+
+    # Then
+    assert result["statusCode"] == 400
@@ -0,0 +1,198 @@
+import pytest
+
+from ariadne_lambda.persisted_queries import (
+    FilePersistedQueryStore,
+    InMemoryPersistedQueryStore,
+    KeyValuePersistedQueryStore,
+    PersistedQueryError,
+    PersistedQueryNotFoundError,
+    get_persisted_query_registration,
+    get_query_hash,
+    resolve_persisted_query,
+)
+
+QUERY = "{ hello }"
+QUERY_HASH = get_query_hash(QUERY)
+
+
+class FakeKeyValueClient:
+    def __init__(self):
+        self.data = {}
+
+    async def get(self, key):
+        return self.data.get(key)
+
+    async def set(self, key, value, ttl=None):
+        self.data[key] = value.encode("utf-8")
+
+
+def persisted_query_data(query_hash=QUERY_HASH, version=1, **data):
+    return {
+        "extensions": {"persistedQuery": {"version": version, "sha256Hash": query_hash}},
+        **data,
+    }
+
+
+@pytest.fixture(params=["memory", "file", "key_value"])
+def store(request, tmp_path):
+    if request.param == "memory":
+        return InMemoryPersistedQueryStore()
+    if request.param == "file":
+        return FilePersistedQueryStore(str(tmp_path / "queries"))
+    return KeyValuePersistedQueryStore(FakeKeyValueClient())
+
+
+@pytest.mark.asyncio
+async def test_store_returns_stored_query(store):
+    # When
+    await store.set(QUERY_HASH, QUERY)
+
+    # Then
+    assert await store.get(QUERY_HASH) == QUERY
+    assert await store.get("0" * 64) is None
+
+
+@pytest.mark.asyncio
+async def test_in_memory_store_evicts_least_recently_used_query():
+    # Given
+    store = InMemoryPersistedQueryStore(max_size=1)
+    await store.set("a", "{ a }")
+
+    # When
+    await store.set("b", "{ b }")
+
+    # Then
+    assert await store.get("a") is None
+    assert await store.get("b") == "{ b }"
+
+
+@pytest.mark.asyncio
+async def test_in_memory_store_evicts_queries_over_max_memory():
+    # Given
+    store = InMemoryPersistedQueryStore(max_memory=10)
+    await store.set("a", "{ a }")
+
+    # When
+    await store.set("b", "{ b }")
+    await store.set("c", "{ c }")
+    await store.set("large", "{ large_query }")
+
+    # Then
+    assert await store.get("a") is None
+    assert await store.get("b") == "{ b }"
+    assert await store.get("c") == "{ c }"
+    assert await store.get("large") is None
+    assert store.memory == 10
+
+
+@pytest.mark.asyncio
+async def test_file_store_survives_reinitialization(tmp_path):
+    # Given
+    await FilePersistedQueryStore(str(tmp_path)).set(QUERY_HASH, QUERY)
+
+    # Then
+    assert await FilePersistedQueryStore(str(tmp_path)).get(QUERY_HASH) == QUERY
+
+
+@pytest.mark.asyncio
+async def test_file_store_deletes_least_recently_used_files_over_max_size(tmp_path):
+    # Given
+    await FilePersistedQueryStore(str(tmp_path)).set("a", "{ a }")
+    store = FilePersistedQueryStore(str(tmp_path), max_size=2)
+    await store.set("b", "{ b }")
+    await store.get("a")
+
+    # When
+    await store.set("c", "{ c }")
+
+    # Then
+    assert sorted(path.name for path in tmp_path.iterdir()) == ["a.graphql", "c.graphql"]
+
+
+@pytest.mark.asyncio
+async def test_file_store_deletes_files_over_max_bytes(tmp_path):
+    # Given
+    store = FilePersistedQueryStore(str(tmp_path), max_bytes=10)
+    await store.set("a", "{ a }")
+    await store.set("b", "{ b }")
+
+    # When
+    await store.set("c", "{ c }")
+    await store.set("large", "{ large_query }")
+
+    # Then
+    assert sorted(path.name for path in tmp_path.iterdir()) == ["b.graphql", "c.graphql"]
+    assert store.bytes == 10
+
+
+@pytest.mark.asyncio
+async def test_key_value_store_prefixes_keys():
+    # Given
+    client = FakeKeyValueClient()
+    store = KeyValuePersistedQueryStore(client, prefix="test:")
+
+    # When
+    await store.set(QUERY_HASH, QUERY)
+
+    # Then
+    assert client.data == {f"test:{QUERY_HASH}": QUERY.encode("utf-8")}
+
+
+@pytest.mark.asyncio
+async def test_resolve_persisted_query_without_extension_returns_data():
+    # Given
+    data = {"query": QUERY}
+
+    # Then
+    assert await resolve_persisted_query(InMemoryPersistedQueryStore(), data) is data
+
+
+@pytest.mark.asyncio
+async def test_resolve_persisted_query_raises_not_found_error_for_unknown_hash():
+    # Then
+    with pytest.raises(PersistedQueryNotFoundError):
+        await resolve_persisted_query(InMemoryPersistedQueryStore(), persisted_query_data())
+
+
+@pytest.mark.asyncio
+async def test_resolve_persisted_query_returns_stored_query():
+    # Given
+    store = InMemoryPersistedQueryStore()
+    await store.set(QUERY_HASH, QUERY)
+
+    # When
+    data = await resolve_persisted_query(store, persisted_query_data())
+
+    # Then
+    assert data["query"] == QUERY
+
+
+@pytest.mark.asyncio
+async def test_resolve_persisted_query_doesnt_store_registered_query():
+    # Given
+    store = InMemoryPersistedQueryStore()
+    data = persisted_query_data(query=QUERY)
+
+    # When
+    resolved_data = await resolve_persisted_query(store, data)
+
+    # Then
+    assert resolved_data is data
+    assert get_persisted_query_registration(data) == (QUERY_HASH, QUERY)
+    assert await store.get(QUERY_HASH) is None
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "data",
+    [
+        persisted_query_data(version=2),
+        persisted_query_data(query_hash="../../etc/passwd"),
+        persisted_query_data(query_hash=QUERY_HASH + "\n"),
+        persisted_query_data(query="{ other }"),
+    ],
+)
+async def test_resolve_persisted_query_raises_error_for_invalid_extension(data):
+    # Then
+    with pytest.raises(PersistedQueryError):
+        await resolve_persisted_query(InMemoryPersistedQueryStore(), data)
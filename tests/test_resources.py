@@ -0,0 +1,242 @@
+import asyncio
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from ariadne import QueryType, make_executable_schema
+
+from ariadne_lambda.event_loop import EventLoopRunner
+from ariadne_lambda.graphql import GraphQLLambda
+from ariadne_lambda.resources import Resource, Resources
+
+
+class Client:
+    def __init__(self) -> None:
+        self.closed = False
+
+    async def aclose(self) -> None:
+        self.closed = True
+
+
+@pytest.mark.asyncio
+async def test_resource_is_created_once():
+    # Given
+    factory = MagicMock(side_effect=Client)
+    resource = Resource(factory)
+
+    # When
+    first_client = await resource.get()
+    second_client = await resource.get()
+
+    # Then
+    assert first_client is second_client
+    factory.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_resource_is_created_once_by_concurrent_uses():
+    # Given
+    async def create_client():
+        await asyncio.sleep(0)
+        return Client()
+
+    factory = AsyncMock(side_effect=create_client)
+    resource = Resource(factory)
+
+    # When
+    clients = await asyncio.gather(resource.get(), resource.get(), resource.get())
+
+    # Then
+    assert clients[0] is clients[1] is clients[2]
+    factory.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_idle_resource_is_health_checked():
+    # Given
+    health_check = AsyncMock(return_value=True)
+    resource = Resource(Client, health_check=health_check, health_check_interval=0)
+    client = await resource.get()
+
+    # When
+    same_client = await resource.get()
+
+    # Then
+    assert same_client is client
+    health_check.assert_awaited_once_with(client)
+
+
+@pytest.mark.asyncio
+async def test_unhealthy_resource_is_closed_and_created_again():
+    # Given
+    resource = Resource(Client, health_check=lambda _: False, health_check_interval=0)
+    client = await resource.get()
+
+    # When
+    new_client = await resource.get()
+
+    # Then
+    assert new_client is not client
+    assert client.closed
+
+
+@pytest.mark.asyncio
+async def test_resource_health_check_error_marks_resource_unhealthy():
+    # Given
+    health_check = MagicMock(side_effect=ConnectionError)
+    resource = Resource(Client, health_check=health_check, health_check_interval=0)
+    client = await resource.get()
+
+    # When
+    new_client = await resource.get()
+
+    # Then
+    assert new_client is not client
+
+
+@pytest.mark.asyncio
+async def test_used_resource_is_not_health_checked():
+    # Given
+    health_check = MagicMock(return_value=True)
+    resource = Resource(Client, health_check=health_check, health_check_interval=60)
+    await resource.get()
+
+    # When
+    await resource.get()
+
+    # Then
+    health_check.assert_not_called()
+
+
+def test_resource_is_created_again_in_new_event_loop():
+    # Given
+    resource = Resource(Client)
+    runner = EventLoopRunner()
+    client = runner.run(resource.get())
+    runner.close()
+
+    # When
+    new_client = runner.run(resource.get())
+
+    # Then
+    assert new_client is not client
+    runner.close()
+
+
+class SyncClient:
+    def __init__(self) -> None:
+        self.closed = False
+
+    def close(self) -> None:
+        self.closed = True
+
+
+def test_resource_from_previous_event_loop_is_closed_synchronously():
+    # Given
+    resource = Resource(SyncClient)
+    runner = EventLoopRunner()
+    client = runner.run(resource.get())
+    runner.close()
+
+    # When
+    runner.run(resource.get())
+
+    # Then
+    assert client.closed
+    runner.close()
+
+
+def test_resource_from_previous_event_loop_with_async_close_is_logged(caplog):
+    # Given
+    resource = Resource(Client)
+    runner = EventLoopRunner()
+    client = runner.run(resource.get())
+    runner.close()
+
+    # When
+    runner.run(resource.get())
+
+    # Then
+    assert not client.closed
+    assert "Resource created in another event loop could not be closed" in caplog.text
+    runner.close()
+
+
+@pytest.mark.asyncio
+async def test_resources_startup_and_shutdown():
+    # Given
+    calls = []
+    resources = Resources(
+        {"client": Resource(Client)},
+        on_startup=[lambda: calls.append("startup")],
+        on_shutdown=[AsyncMock(side_effect=lambda: calls.append("shutdown"))],
+    )
+
+    # When
+    await resources.startup()
+    await resources.startup()
+    client = await resources.get("client")
+    await resources.shutdown()
+
+    # Then
+    assert calls == ["startup", "shutdown"]
+    assert client.closed
+    assert not resources.started
+
+
+@pytest.mark.asyncio
+async def test_resource_close_error_is_logged():
+    # Given
+    close = MagicMock(side_effect=RuntimeError)
+    resource = Resource(Client, close=close)
+    client = await resource.get()
+
+    # When
+    await resource.close()
+
+    # Then
+    close.assert_called_once_with(client)
+    assert not resource.created
+
+
+@pytest.fixture
+def schema():
+    query = QueryType()
+
+    @query.field("client")
+    async def resolve_client(_, info):
+        client = await info.context["resources"].get("client")
+        return type(client).__name__
+
+    return make_executable_schema("type Query { client: String! }", query)
+
+
+def test_graphql_lambda_starts_resources_on_init_and_closes_them_on_shutdown(schema):
+    # Given
+    startup = MagicMock()
+    app = GraphQLLambda(
+        schema,
+        resources={"client": Resource(Client)},
+        on_startup=[startup],
+    )
+
+    # When
+    with patch("ariadne_lambda.event_loop.signal.signal") as signal_mock:
+        handler = app.as_handler()
+    client = app.resources.resources["client"].value
+    response = handler(
+        {
+            "httpMethod": "POST",
+            "path": "/",
+            "requestContext": {},
+            "headers": {"Content-Type": "application/json"},
+            "body": '{"query": "{ client }"}',
+        },
+        MagicMock(),
+    )
+    app.event_loop_runner.shutdown()
+
+    # Then
+    startup.assert_called_once()
+    signal_mock.assert_called_once()
+    assert response["body"] == '{"data": {"client": "Client"}}'
+    assert client.closed
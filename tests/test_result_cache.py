@@ -0,0 +1,318 @@
+import asyncio
+import json
+from unittest.mock import MagicMock
+
+import pytest
+from ariadne import MutationType, QueryType, gql, make_executable_schema
+from graphql import parse
+
+from ariadne_lambda.http_cache import CachePolicy, cache_policy_var, set_cache_hint
+from ariadne_lambda.http_handler import GraphQLAWSAPIHTTPGatewayHandler
+from ariadne_lambda.json_codec import StdlibJSONCodec
+from ariadne_lambda.result_cache import ResultCache
+from ariadne_lambda.timing import Timing
+
+RESULT = (True, {"data": {"hello": "world"}})
+
+
+class FakeClock:
+    def __init__(self):
+        self.time = 0.0
+
+    def __call__(self):
+        return self.time
+
+
+def test_result_cache_expires_entries_after_ttl():
+    # Given
+    clock = FakeClock()
+    cache = ResultCache(ttl=10, shared=True, clock=clock)
+    cache.set(b"key", RESULT)
+
+    # When
+    clock.time = 9
+    before_expiry = cache.get(b"key")
+    clock.time = 10
+    after_expiry = cache.get(b"key")
+
+    # Then
+    assert before_expiry == RESULT
+    assert after_expiry is None
+    assert cache.memory == 0
+
+
+def test_result_cache_evicts_least_recently_used_entry():
+    # Given
+    cache = ResultCache(max_size=2, shared=True)
+    cache.set(b"a", RESULT)
+    cache.set(b"b", RESULT)
+    cache.get(b"a")
+
+    # When
+    cache.set(b"c", RESULT)
+
+    # Then
+    assert b"a" in cache
+    assert b"b" not in cache
+    assert b"c" in cache
+
+
+def test_result_cache_evicts_entries_over_memory_limit():
+    # Given
+    size = len(json.dumps(RESULT[1]))
+    cache = ResultCache(max_memory=size * 2, shared=True)
+    cache.set(b"a", RESULT)
+    cache.set(b"b", RESULT)
+
+    # When
+    cache.set(b"c", RESULT)
+
+    # Then
+    assert len(cache) == 2
+    assert b"a" not in cache
+    assert cache.memory == size * 2
+
+
+def test_result_cache_key_varies_by_configured_headers_and_context_keys():
+    # Given
+    cache = ResultCache(vary_headers=("authorization",), vary_context_keys=("user_id",))
+    data = {"query": "{ hello }", "variables": {"a": 1}}
+
+    # When
+    key = cache.get_key(data, {"authorization": "a", "accept": "*"}, {"user_id": 1})
+    same_key = cache.get_key(data, {"authorization": "a"}, {"user_id": 1, "other": 2})
+    other_header_key = cache.get_key(data, {"authorization": "b"}, {"user_id": 1})
+    other_context_key = cache.get_key(data, {"authorization": "a"}, {"user_id": 2})
+    other_variables_key = cache.get_key({**data, "variables": {"a": 2}}, {}, None)
+
+    # Then
+    assert key == same_key
+    assert len({key, other_header_key, other_context_key, other_variables_key}) == 4
+
+
+def test_result_cache_requires_vary_or_shared_option():
+    # When / Then
+    with pytest.raises(ValueError, match="shared=True"):
+        ResultCache()
+
+
+@pytest.mark.parametrize(
+    ("query", "operation_name", "cacheable"),
+    [
+        ("{ hello }", None, True),
+        ("mutation { hello }", None, False),
+        ("query A { hello } mutation B { hello }", "A", True),
+        ("query A { hello } mutation B { hello }", "B", False),
+        ("query A { hello } query B { hello }", None, False),
+    ],
+)
+def test_result_cache_only_caches_queries(query, operation_name, cacheable):
+    # Given
+    cache = ResultCache(shared=True)
+
+    # When / Then
+    assert cache.is_cacheable(parse(query), {"operationName": operation_name}) is cacheable
+
+
+@pytest.mark.asyncio
+async def test_result_cache_collapses_concurrent_executions():
+    # Given
+    cache = ResultCache(shared=True)
+    executions = 0
+
+    async def execute():
+        nonlocal executions
+        executions += 1
+        await asyncio.sleep(0.01)
+        return RESULT
+
+    # When
+    results = await asyncio.gather(*(cache.get_or_execute(b"key", execute) for _ in range(3)))
+
+    # Then
+    assert results == [RESULT] * 3
+    assert executions == 1
+    assert cache.stats()["hits"] == 2
+    assert cache.stats()["misses"] == 1
+
+
+@pytest.mark.asyncio
+async def test_result_cache_returns_result_to_collapsed_requests_when_first_is_cancelled():
+    # Given
+    cache = ResultCache(shared=True)
+    executions = 0
+
+    async def execute():
+        nonlocal executions
+        executions += 1
+        await asyncio.sleep(0.01)
+        return RESULT
+
+    first_request = asyncio.ensure_future(cache.get_or_execute(b"key", execute))
+    await asyncio.sleep(0)
+    other_requests = [
+        asyncio.ensure_future(cache.get_or_execute(b"key", execute)) for _ in range(2)
+    ]
+    await asyncio.sleep(0)
+
+    # When
+    first_request.cancel()
+    results = await asyncio.gather(*other_requests)
+
+    # Then
+    assert first_request.cancelled()
+    assert results == [RESULT] * 2
+    assert executions == 1
+    assert b"key" in cache
+
+
+@pytest.mark.asyncio
+async def test_result_cache_applies_cache_hints_to_collapsed_executions():
+    # Given
+    cache = ResultCache(shared=True)
+
+    async def execute():
+        await asyncio.sleep(0.01)
+        set_cache_hint(max_age=30, scope="PRIVATE")
+        return RESULT
+
+    async def get_cache_policy():
+        cache_policy = CachePolicy(max_age=60)
+        cache_policy_var.set(cache_policy)
+        await cache.get_or_execute(b"key", execute)
+        return cache_policy
+
+    # When
+    cache_policies = await asyncio.gather(*(get_cache_policy() for _ in range(3)))
+
+    # Then
+    assert [policy.get_cache_control_header() for policy in cache_policies] == [
+        "max-age=30, private"
+    ] * 3
+
+
+@pytest.mark.asyncio
+async def test_result_cache_does_not_cache_results_with_errors():
+    # Given
+    cache = ResultCache(shared=True)
+    result = (True, {"data": None, "errors": [{"message": "Error"}]})
+
+    async def execute():
+        return result
+
+    # When
+    await cache.get_or_execute(b"key", execute)
+
+    # Then
+    assert b"key" not in cache
+
+
+@pytest.fixture
+def counting_schema():
+    type_defs = gql(
+        """
+        type Query {
+            counter: Int!
+        }
+
+        type Mutation {
+            increment: Int!
+        }
+        """
+    )
+    calls = {"counter": 0}
+
+    def resolve_counter(*_):
+        calls["counter"] += 1
+        return calls["counter"]
+
+    query = QueryType()
+    query.set_field("counter", resolve_counter)
+    mutation = MutationType()
+    mutation.set_field("increment", resolve_counter)
+    return make_executable_schema(type_defs, query, mutation)
+
+
+def create_post_event(event, query):
+    event["httpMethod"] = "POST"
+    event["headers"]["Content-Type"] = "application/json"
+    event["body"] = json.dumps({"query": query})
+    return event
+
+
+@pytest.mark.asyncio
+async def test_handle_returns_cached_query_result(counting_schema, api_gateway_v1_event_payload):
+    # Given
+    handler = GraphQLAWSAPIHTTPGatewayHandler()
+    handler.configure(counting_schema, result_cache=ResultCache(shared=True))
+    event = create_post_event(api_gateway_v1_event_payload, "{ counter }")
+
+    # When
+    first_result = await handler.handle(event, MagicMock())
+    second_result = await handler.handle(event, MagicMock())
+
+    # Then
+    assert json.loads(first_result["body"]) == {"data": {"counter": 1}}
+    assert json.loads(second_result["body"]) == {"data": {"counter": 1}}
+
+
+@pytest.mark.asyncio
+async def test_handle_encodes_cached_result_once_with_configured_json_codec(
+    counting_schema, api_gateway_v1_event_payload
+):
+    # Given
+    json_codec = StdlibJSONCodec()
+    json_codec.dumps = MagicMock(wraps=json_codec.dumps)
+    result_cache = ResultCache(shared=True)
+    handler = GraphQLAWSAPIHTTPGatewayHandler()
+    handler.configure(counting_schema, result_cache=result_cache, json_codec=json_codec)
+    event = create_post_event(api_gateway_v1_event_payload, "{ counter }")
+
+    # When
+    first_result = await handler.handle(event, MagicMock())
+    second_result = await handler.handle(event, MagicMock())
+
+    # Then
+    json_codec.dumps.assert_called_once_with({"data": {"counter": 1}})
+    assert first_result["body"] == second_result["body"] == '{"data": {"counter": 1}}'
+    assert result_cache.memory == len(first_result["body"])
+
+
+@pytest.mark.asyncio
+async def test_handle_does_not_cache_mutation_result(
+    counting_schema, api_gateway_v1_event_payload
+):
+    # Given
+    handler = GraphQLAWSAPIHTTPGatewayHandler()
+    handler.configure(counting_schema, result_cache=ResultCache(shared=True))
+    event = create_post_event(api_gateway_v1_event_payload, "mutation { increment }")
+
+    # When
+    await handler.handle(event, MagicMock())
+    result = await handler.handle(event, MagicMock())
+
+    # Then
+    assert json.loads(result["body"]) == {"data": {"increment": 2}}
+
+
+@pytest.mark.asyncio
+async def test_handle_reports_result_cache_metrics(counting_schema, api_gateway_v1_event_payload):
+    # Given
+    emitted = []
+    handler = GraphQLAWSAPIHTTPGatewayHandler()
+    handler.configure(
+        counting_schema,
+        result_cache=ResultCache(shared=True),
+        timing=Timing(emit=emitted.append),
+    )
+    event = create_post_event(api_gateway_v1_event_payload, "{ counter }")
+
+    # When
+    await handler.handle(event, MagicMock())
+    await handler.handle(event, MagicMock())
+
+    # Then
+    log = json.loads(emitted[-1])
+    assert log["ResultCacheHit"] == 1
+    assert log["ResultCacheHitRatio"] == 50.0
+    assert log["ResultCacheMemory"] > 0
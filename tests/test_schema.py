@@ -68,3 +68,63 @@ def test_response_render():
         "body": "Error",
         "headers": {"Content-Type": "text/plain"},
     }
+
+
+def test_response_render_decodes_bytes_body():
+    # When
+    response = Response(body=b'{"data": null}')
+
+    # Then
+    assert response.render()["body"] == '{"data": null}'
+
+
+def test_response_render_base64_encoded_body():
+    # When
+    response = Response(body="e30=", is_base64_encoded=True)
+
+    # Then
+    assert response.render()["isBase64Encoded"] is True
+
+
+def test_request_reads_event_lazily():
+    # When
+    request = Request.create_from_event({})
+
+    # Then
+    assert request.event == {}
+
+
+def test_request_api_v2_headers_are_not_copied(api_gateway_v2_event_payload):
+    # When
+    request = Request.create_from_event(api_gateway_v2_event_payload)
+
+    # Then
+    assert request.headers is api_gateway_v2_event_payload["headers"]
+
+
+def test_request_without_headers_and_params(api_gateway_v1_event_payload):
+    # Given
+    api_gateway_v1_event_payload["headers"] = None
+    api_gateway_v1_event_payload["queryStringParameters"] = None
+
+    # When
+    request = Request.create_from_event(api_gateway_v1_event_payload)
+
+    # Then
+    assert request.headers == {}
+    assert request.params == {}
+
+
+def test_request_attributes_can_be_overridden(api_gateway_v1_event_payload):
+    # Given
+    request = Request.create_from_event(api_gateway_v1_event_payload)
+
+    # When
+    request.method = "POST"
+    request.path = "/graphql"
+    request.body = "{}"
+
+    # Then
+    assert request.route_key == "POST /graphql"
+    assert request.body == "{}"
+    assert api_gateway_v1_event_payload["httpMethod"] == "GET"
@@ -0,0 +1,231 @@
+import gzip
+import json
+from base64 import b64decode
+from unittest.mock import MagicMock, patch
+
+import pytest
+from ariadne import QueryType, make_executable_schema
+from ariadne.types import Extension
+from graphql import get_introspection_query, parse
+
+from ariadne_lambda.cache import DocumentCache
+from ariadne_lambda.compression import ResponseCompression
+from ariadne_lambda.http_handler import GraphQLAWSAPIHTTPGatewayHandler
+from ariadne_lambda.static_responses import (
+    StaticBody,
+    StaticResponses,
+    is_introspection_document,
+)
+
+BODY = '{"data": {"items": [' + ", ".join(['{"name": "item"}'] * 200) + "]}}"
+
+
+@pytest.fixture
+def schema():
+    query = QueryType()
+    query.set_field("hello", lambda *_: "Hello!")
+    return make_executable_schema("type Query { hello: String! }", query)
+
+
+def create_event(event, data, **headers):
+    event["httpMethod"] = "POST"
+    event["headers"] = {"Content-Type": "application/json", **headers}
+    event["body"] = json.dumps(data)
+    event["isBase64Encoded"] = False
+    return event
+
+
+def test_static_body_returns_precompressed_variant():
+    # Given
+    body = StaticBody(BODY, ResponseCompression(encodings=("gzip",)))
+
+    # When
+    response = body.create_response(
+        {"accept-encoding": "gzip"}, "application/json", ResponseCompression(encodings=("gzip",))
+    )
+
+    # Then
+    assert response.is_base64_encoded
+    assert response.headers["Content-Encoding"] == "gzip"
+    assert response.headers["ETag"] == body.etag
+    assert gzip.decompress(b64decode(response.body)).decode("utf-8") == BODY
+
+
+def test_static_body_returns_not_modified_for_matching_etag():
+    # Given
+    body = StaticBody(BODY)
+
+    # When
+    response = body.create_response({"if-none-match": body.etag}, "application/json")
+
+    # Then
+    assert response.status_code == 304
+    assert not response.body
+
+
+@pytest.mark.parametrize(
+    ("query", "expected"),
+    [
+        ("{ __schema { queryType { name } } }", True),
+        ('{ __type(name: "Query") { name } __typename }', True),
+        ("{ __schema { queryType { name } } hello }", False),
+        ("{ hello }", False),
+    ],
+)
+def test_is_introspection_document(query, expected):
+    # Then
+    assert is_introspection_document(parse(query), None) is expected
+
+
+@pytest.mark.asyncio
+async def test_introspection_result_is_executed_once(schema, api_gateway_v1_event_payload):
+    # Given
+    handler = GraphQLAWSAPIHTTPGatewayHandler(static_responses=StaticResponses())
+    handler.configure(schema)
+    handler.execute_operation = MagicMock(wraps=handler.execute_operation)
+    data = {"query": get_introspection_query()}
+    first_result = await handler.handle(
+        create_event(api_gateway_v1_event_payload, data), MagicMock()
+    )
+
+    # When
+    result = await handler.handle(create_event(api_gateway_v1_event_payload, data), MagicMock())
+
+    # Then
+    assert handler.execute_operation.call_count == 1
+    assert result["body"] == first_result["body"]
+    assert result["headers"]["ETag"] == first_result["headers"]["ETag"]
+    assert json.loads(result["body"])["data"]["__schema"]["queryType"]["name"] == "Query"
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "options",
+    [
+        {"middleware": [lambda resolver, obj, info, **kwargs: resolver(obj, info, **kwargs)]},
+        {"extensions": [Extension]},
+    ],
+)
+async def test_introspection_result_is_executed_for_every_request_with_middleware_or_extensions(
+    schema, api_gateway_v1_event_payload, options
+):
+    # Given
+    handler = GraphQLAWSAPIHTTPGatewayHandler(static_responses=StaticResponses(), **options)
+    handler.configure(schema)
+    handler.execute_operation = MagicMock(wraps=handler.execute_operation)
+    data = {"query": get_introspection_query()}
+    await handler.handle(create_event(api_gateway_v1_event_payload, data), MagicMock())
+
+    # When
+    result = await handler.handle(create_event(api_gateway_v1_event_payload, data), MagicMock())
+
+    # Then
+    assert handler.execute_operation.call_count == 2
+    assert "ETag" not in result["headers"]
+
+
+@pytest.mark.asyncio
+async def test_introspection_query_is_checked_with_document_from_document_cache(
+    schema, api_gateway_v1_event_payload
+):
+    # Given
+    handler = GraphQLAWSAPIHTTPGatewayHandler(static_responses=StaticResponses())
+    handler.configure(schema, document_cache=DocumentCache())
+    data = {"query": get_introspection_query()}
+
+    # When
+    with patch("ariadne_lambda.static_responses.parse") as parse_mock:
+        result = await handler.handle(
+            create_event(api_gateway_v1_event_payload, data), MagicMock()
+        )
+
+    # Then
+    parse_mock.assert_not_called()
+    assert "ETag" in result["headers"]
+
+
+@pytest.mark.asyncio
+async def test_introspection_result_returns_not_modified_for_matching_etag(
+    schema, api_gateway_v1_event_payload
+):
+    # Given
+    handler = GraphQLAWSAPIHTTPGatewayHandler(static_responses=StaticResponses())
+    handler.configure(schema)
+    data = {"query": get_introspection_query()}
+    first_result = await handler.handle(
+        create_event(api_gateway_v1_event_payload, data), MagicMock()
+    )
+    event = create_event(
+        api_gateway_v1_event_payload, data, **{"If-None-Match": first_result["headers"]["ETag"]}
+    )
+
+    # When
+    result = await handler.handle(event, MagicMock())
+
+    # Then
+    assert result["statusCode"] == 304
+    assert result["body"] == ""
+
+
+@pytest.mark.asyncio
+async def test_introspection_result_is_precompressed(schema, api_gateway_v1_event_payload):
+    # Given
+    handler = GraphQLAWSAPIHTTPGatewayHandler(
+        static_responses=StaticResponses(),
+        response_compression=ResponseCompression(encodings=("gzip",)),
+    )
+    handler.configure(schema)
+    data = {"query": get_introspection_query()}
+
+    # When
+    result = await handler.handle(
+        create_event(api_gateway_v1_event_payload, data, **{"Accept-Encoding": "gzip"}),
+        MagicMock(),
+    )
+
+    # Then
+    assert result["isBase64Encoded"] is True
+    assert result["headers"]["Content-Encoding"] == "gzip"
+    body = json.loads(gzip.decompress(b64decode(result["body"])))
+    assert body["data"]["__schema"]["queryType"]["name"] == "Query"
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "query",
+    ["{ __schema { queryType { name } } hello }", "{ __schema { unknown } }"],
+)
+async def test_other_queries_results_are_not_cached(schema, api_gateway_v1_event_payload, query):
+    # Given
+    static_responses = StaticResponses()
+    handler = GraphQLAWSAPIHTTPGatewayHandler(static_responses=static_responses)
+    handler.configure(schema)
+
+    # When
+    result = await handler.handle(
+        create_event(api_gateway_v1_event_payload, {"query": query}), MagicMock()
+    )
+
+    # Then
+    assert "ETag" not in result["headers"]
+    assert not static_responses.introspection_bodies
+
+
+@pytest.mark.asyncio
+async def test_explorer_is_rendered_once(schema, api_gateway_v1_event_payload):
+    # Given
+    explorer = MagicMock()
+    explorer.html.return_value = "<html>Explorer</html>"
+    handler = GraphQLAWSAPIHTTPGatewayHandler(static_responses=StaticResponses())
+    handler.configure(schema, explorer=explorer)
+    api_gateway_v1_event_payload["httpMethod"] = "GET"
+    api_gateway_v1_event_payload["queryStringParameters"] = None
+    first_result = await handler.handle(api_gateway_v1_event_payload, MagicMock())
+
+    # When
+    result = await handler.handle(api_gateway_v1_event_payload, MagicMock())
+
+    # Then
+    assert explorer.html.call_count == 1
+    assert result["body"] == "<html>Explorer</html>"
+    assert result["headers"]["ETag"] == first_result["headers"]["ETag"]
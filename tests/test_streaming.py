@@ -0,0 +1,251 @@
+import gzip
+import json
+from unittest.mock import MagicMock
+
+import pytest
+from ariadne import QueryType, gql, make_executable_schema
+from graphql import get_introspection_query
+
+from ariadne_lambda.compression import ResponseCompression
+from ariadne_lambda.graphql import GraphQLLambda
+from ariadne_lambda.http_cache import HttpCache
+from ariadne_lambda.http_handler import GraphQLAWSAPIHTTPGatewayHandler
+from ariadne_lambda.json_codec import StdlibJSONCodec
+from ariadne_lambda.static_responses import StaticResponses
+from ariadne_lambda.streaming import (
+    PRELUDE_DELIMITER,
+    encode_json_chunks,
+    iter_rendered_response,
+)
+from ariadne_lambda.timing import Timing
+
+
+class FakeStreamWriter:
+    def __init__(self):
+        self.chunks = []
+        self.closed = False
+
+    async def write(self, data):
+        assert not self.closed
+        self.chunks.append(data)
+
+    def close(self):
+        self.closed = True
+
+    def get_response(self):
+        prelude, _, body = b"".join(self.chunks).partition(PRELUDE_DELIMITER)
+        return json.loads(prelude), body
+
+
+def test_encode_json_chunks_yields_chunks_of_valid_json():
+    # Given
+    result = {"data": {"items": [{"id": i, "name": f"item-{i}"} for i in range(100)]}}
+
+    # When
+    chunks = list(encode_json_chunks(StdlibJSONCodec(), result, chunk_size=256))
+
+    # Then
+    assert len(chunks) > 1
+    assert all(len(chunk) >= 256 for chunk in chunks[:-1])
+    assert json.loads(b"".join(chunks)) == result
+
+
+@pytest.mark.parametrize("value", [{}, [], None, "text", {"a": [[], {}, [1, {"b": None}]]}])
+def test_encode_json_chunks_encodes_any_value(value):
+    # When
+    chunks = list(encode_json_chunks(StdlibJSONCodec(), value, chunk_size=1))
+
+    # Then
+    assert json.loads(b"".join(chunks)) == value
+
+
+def test_iter_rendered_response_decodes_base64_body():
+    # Given
+    response = {"statusCode": 200, "headers": {}, "body": "aGVsbG8=", "isBase64Encoded": True}
+
+    # When
+    chunks = list(iter_rendered_response(response))
+
+    # Then
+    assert chunks[1] == b"hello"
+
+
+@pytest.fixture
+def items_schema():
+    type_defs = gql(
+        """
+        type Query {
+            items(count: Int!): [String!]!
+        }
+        """
+    )
+    query = QueryType()
+    query.set_field("items", lambda *_, count: [f"item-{i}" for i in range(count)])
+    return make_executable_schema(type_defs, query)
+
+
+@pytest.fixture
+def streaming_app(items_schema):
+    return GraphQLLambda(
+        items_schema,
+        http_handler=GraphQLAWSAPIHTTPGatewayHandler(batch_max_size=5, stream_chunk_size=64),
+    )
+
+
+def create_post_event(event, body):
+    event["httpMethod"] = "POST"
+    event["headers"]["Content-Type"] = "application/json"
+    event["body"] = json.dumps(body)
+    return event
+
+
+@pytest.mark.asyncio
+async def test_stream_writes_prelude_and_result_in_chunks(
+    streaming_app, api_gateway_v1_event_payload
+):
+    # Given
+    stream = FakeStreamWriter()
+    event = create_post_event(api_gateway_v1_event_payload, {"query": "{ items(count: 50) }"})
+
+    # When
+    await streaming_app.stream(event, MagicMock(), stream)
+
+    # Then
+    prelude, body = stream.get_response()
+    assert prelude == {
+        "statusCode": 200,
+        "headers": {"Content-Type": "application/json"},
+        "cookies": [],
+    }
+    assert json.loads(body) == {"data": {"items": [f"item-{i}" for i in range(50)]}}
+    assert len(stream.chunks) > 2
+    assert stream.closed
+
+
+@pytest.mark.asyncio
+async def test_stream_writes_batched_results(streaming_app, api_gateway_v1_event_payload):
+    # Given
+    stream = FakeStreamWriter()
+    event = create_post_event(
+        api_gateway_v1_event_payload,
+        [{"query": "{ items(count: 1) }"}, {"query": "{ unknown }"}],
+    )
+
+    # When
+    await streaming_app.stream(event, MagicMock(), stream)
+
+    # Then
+    prelude, body = stream.get_response()
+    results = json.loads(body)
+    assert prelude["statusCode"] == 200
+    assert results[0] == {"data": {"items": ["item-0"]}}
+    assert "errors" in results[1]
+
+
+@pytest.mark.asyncio
+async def test_stream_writes_error_response(streaming_app, api_gateway_v1_event_payload):
+    # Given
+    stream = FakeStreamWriter()
+    event = create_post_event(api_gateway_v1_event_payload, {})
+    event["body"] = "not json"
+
+    # When
+    await streaming_app.stream(event, MagicMock(), stream)
+
+    # Then
+    prelude, body = stream.get_response()
+    assert prelude["statusCode"] == 400
+    assert body == b"Request body is not a valid JSON"
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("batch", [False, True])
+async def test_stream_compresses_result_in_chunks(
+    items_schema, api_gateway_v1_event_payload, batch
+):
+    # Given
+    app = GraphQLLambda(
+        items_schema,
+        http_handler=GraphQLAWSAPIHTTPGatewayHandler(
+            batch_max_size=5,
+            stream_chunk_size=64,
+            response_compression=ResponseCompression(encodings=("gzip",)),
+        ),
+    )
+    stream = FakeStreamWriter()
+    data = {"query": "{ items(count: 50) }"}
+    event = create_post_event(api_gateway_v1_event_payload, [data] if batch else data)
+    event["headers"]["Accept-Encoding"] = "gzip"
+
+    # When
+    await app.stream(event, MagicMock(), stream)
+
+    # Then
+    prelude, body = stream.get_response()
+    assert prelude["headers"]["Content-Encoding"] == "gzip"
+    assert prelude["headers"]["Vary"] == "Accept-Encoding"
+    result = {"data": {"items": [f"item-{i}" for i in range(50)]}}
+    assert json.loads(gzip.decompress(body)) == ([result] if batch else result)
+    assert len(stream.chunks) > 3
+
+
+@pytest.mark.asyncio
+async def test_stream_returns_server_timing_of_single_operation(
+    items_schema, api_gateway_v1_event_payload
+):
+    # Given
+    emitted = []
+    app = GraphQLLambda(items_schema, timing=Timing(emit=emitted.append))
+    stream = FakeStreamWriter()
+    event = create_post_event(api_gateway_v1_event_payload, {"query": "{ items(count: 1) }"})
+
+    # When
+    await app.stream(event, MagicMock(), stream)
+
+    # Then
+    prelude, _ = stream.get_response()
+    assert "execute;dur=" in prelude["headers"]["Server-Timing"]
+    assert len(emitted) == 1
+
+
+@pytest.mark.asyncio
+async def test_stream_writes_get_query_with_http_cache_whole(
+    items_schema, api_gateway_v1_event_payload
+):
+    # Given
+    handler = GraphQLAWSAPIHTTPGatewayHandler(http_cache=HttpCache(), stream_chunk_size=64)
+    app = GraphQLLambda(items_schema, http_handler=handler, execute_get_queries=True)
+    stream = FakeStreamWriter()
+    api_gateway_v1_event_payload["httpMethod"] = "GET"
+    api_gateway_v1_event_payload["queryStringParameters"] = {"query": "{ items(count: 50) }"}
+
+    # When
+    await app.stream(api_gateway_v1_event_payload, MagicMock(), stream)
+
+    # Then
+    prelude, body = stream.get_response()
+    assert "ETag" in prelude["headers"]
+    assert json.loads(body) == {"data": {"items": [f"item-{i}" for i in range(50)]}}
+    assert len(stream.chunks) == 2
+
+
+@pytest.mark.asyncio
+async def test_stream_writes_static_introspection_result(
+    items_schema, api_gateway_v1_event_payload
+):
+    # Given
+    handler = GraphQLAWSAPIHTTPGatewayHandler(static_responses=StaticResponses())
+    app = GraphQLLambda(items_schema, http_handler=handler)
+    event = create_post_event(api_gateway_v1_event_payload, {"query": get_introspection_query()})
+    await app.stream(event, MagicMock(), FakeStreamWriter())
+    handler.execute_operation = MagicMock(wraps=handler.execute_operation)
+    stream = FakeStreamWriter()
+
+    # When
+    await app.stream(event, MagicMock(), stream)
+
+    # Then
+    prelude, body = stream.get_response()
+    assert "ETag" in prelude["headers"]
+    assert json.loads(body)["data"]["__schema"]["queryType"]["name"] == "Query"
+    handler.execute_operation.assert_not_called()
@@ -0,0 +1,98 @@
+import json
+from time import perf_counter_ns
+
+from ariadne_lambda import timing
+from ariadne_lambda.timing import PhaseTimer, Timing, get_phase_timer
+
+
+def test_phase_timer_sums_durations_of_repeated_phases():
+    # Given
+    timer = PhaseTimer()
+    timer.phases["execute"] = 1_000_000
+
+    # When
+    timer.record("execute", perf_counter_ns())
+
+    # Then
+    assert timer.phases["execute"] >= 1_000_000
+
+
+def test_phase_timer_server_timing_header():
+    # Given
+    timer = PhaseTimer()
+    timer.phases = {"parse": 1_500_000, "execute": 250_000}
+
+    # When
+    header = timer.get_server_timing_header()
+
+    # Then
+    assert header == "parse;dur=1.500, execute;dur=0.250"
+
+
+def test_timing_sets_current_timer_until_stopped():
+    # Given
+    emitted = []
+    timing_config = Timing(emit=emitted.append)
+
+    # When
+    token = timing_config.start()
+    current_timer = get_phase_timer()
+    finished_timer = timing_config.stop(token)
+
+    # Then
+    assert current_timer is finished_timer
+    assert get_phase_timer() is None
+    assert "total" in finished_timer.phases
+    assert len(emitted) == 1
+
+
+def test_timing_does_not_emit_emf_when_disabled():
+    # Given
+    emitted = []
+    timing_config = Timing(emf=False, emit=emitted.append)
+
+    # When
+    timing_config.stop(timing_config.start())
+
+    # Then
+    assert emitted == []
+
+
+def test_timing_format_emf():
+    # Given
+    timing_config = Timing(namespace="Test", dimensions=("OperationName",))
+    timer = PhaseTimer(cold_start=True)
+    timer.operation_name = "GetProducts"
+    timer.phases = {"execute": 2_000_000, "total": 3_000_000}
+
+    # When
+    log = json.loads(timing_config.format_emf(timer))
+
+    # Then
+    assert log["_aws"]["CloudWatchMetrics"] == [
+        {
+            "Namespace": "Test",
+            "Dimensions": [["OperationName"]],
+            "Metrics": [
+                {"Name": "executeTime", "Unit": "Milliseconds"},
+                {"Name": "totalTime", "Unit": "Milliseconds"},
+            ],
+        }
+    ]
+    assert log["OperationName"] == "GetProducts"
+    assert log["ColdStart"] == "true"
+    assert log["executeTime"] == 2.0
+    assert log["totalTime"] == 3.0
+
+
+def test_is_cold_start_is_true_only_once(monkeypatch):
+    # Given
+    monkeypatch.setattr(timing, "_cold_start", True)
+
+    # When
+    first = timing.is_cold_start()
+    second = timing.is_cold_start()
+
+    # Then
+    assert first is True
+    assert second is False
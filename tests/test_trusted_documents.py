@@ -0,0 +1,224 @@
+import json
+from unittest.mock import MagicMock, patch
+
+import pytest
+from ariadne import QueryType, gql, make_executable_schema
+
+from ariadne_lambda.graphql import GraphQLLambda
+from ariadne_lambda.trusted_documents import (
+    TrustedDocuments,
+    extract_documents,
+    get_document_id,
+    get_operation_ids,
+    load_manifest,
+    main,
+    save_manifest,
+)
+
+HELLO_QUERY = "query Hello {\n  hello\n}"
+HELLO_ID = get_document_id(HELLO_QUERY)
+
+
+@pytest.fixture
+def hello_schema():
+    type_defs = gql(
+        """
+        type Query {
+            hello: String!
+            user: User!
+        }
+
+        type User {
+            name: String!
+        }
+        """
+    )
+    query = QueryType()
+    query.set_field("hello", lambda *_: "Hello!")
+    query.set_field("user", lambda *_: {"name": "Bob"})
+    return make_executable_schema(type_defs, query)
+
+
+def create_event(event, body):
+    event["httpMethod"] = "POST"
+    event["headers"]["Content-Type"] = "application/json"
+    event["body"] = json.dumps(body)
+    return event
+
+
+@pytest.mark.asyncio
+async def test_trusted_document_is_executed_by_id(hello_schema, api_gateway_v1_event_payload):
+    # Given
+    app = GraphQLLambda(hello_schema, trusted_documents=TrustedDocuments({HELLO_ID: HELLO_QUERY}))
+    event = create_event(api_gateway_v1_event_payload, {"documentId": HELLO_ID})
+
+    # When
+    with patch("ariadne_lambda.base.parse_query") as parse_query_mock:
+        response = await app(event, MagicMock())
+
+    # Then
+    assert json.loads(response["body"]) == {"data": {"hello": "Hello!"}}
+    parse_query_mock.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_trusted_document_is_executed_by_persisted_query_hash(
+    hello_schema, api_gateway_v1_event_payload
+):
+    # Given
+    app = GraphQLLambda(hello_schema, trusted_documents=TrustedDocuments({HELLO_ID: HELLO_QUERY}))
+    query_hash = HELLO_ID.removeprefix("sha256:")
+    event = create_event(
+        api_gateway_v1_event_payload,
+        {"extensions": {"persistedQuery": {"version": 1, "sha256Hash": query_hash}}},
+    )
+
+    # When
+    response = await app(event, MagicMock())
+
+    # Then
+    assert json.loads(response["body"]) == {"data": {"hello": "Hello!"}}
+
+
+@pytest.mark.asyncio
+async def test_untrusted_query_is_rejected(hello_schema, api_gateway_v1_event_payload):
+    # Given
+    app = GraphQLLambda(hello_schema, trusted_documents=TrustedDocuments({HELLO_ID: HELLO_QUERY}))
+    event = create_event(api_gateway_v1_event_payload, {"query": "{ user { name } }"})
+
+    # When
+    response = await app(event, MagicMock())
+
+    # Then
+    assert response["statusCode"] == 400
+    assert json.loads(response["body"])["errors"][0]["extensions"] == {
+        "code": "TRUSTED_DOCUMENT_REQUIRED"
+    }
+
+
+@pytest.mark.asyncio
+async def test_unknown_document_id_is_rejected(hello_schema, api_gateway_v1_event_payload):
+    # Given
+    app = GraphQLLambda(hello_schema, trusted_documents=TrustedDocuments({HELLO_ID: HELLO_QUERY}))
+    event = create_event(
+        api_gateway_v1_event_payload, {"documentId": "sha256:unknown", "query": "{ hello }"}
+    )
+
+    # When
+    response = await app(event, MagicMock())
+
+    # Then
+    assert json.loads(response["body"])["errors"][0]["extensions"] == {
+        "code": "TRUSTED_DOCUMENT_NOT_FOUND"
+    }
+
+
+def test_invalid_trusted_document_fails_configuration(hello_schema):
+    # Given
+    trusted_documents = TrustedDocuments({"invalid": "{ unknown }"})
+
+    # When / Then
+    with pytest.raises(ValueError, match="Trusted document invalid is not valid"):
+        GraphQLLambda(hello_schema, trusted_documents=trusted_documents)
+
+
+def test_extract_documents_includes_used_fragments():
+    # Given
+    sources = [
+        "query User { user { ...UserFields } }",
+        "fragment UserFields on User { name ...More }\nfragment More on User { name }",
+        "fragment Unused on User { name }",
+    ]
+
+    # When
+    documents = extract_documents(sources)
+
+    # Then
+    [(document_id, document)] = documents.items()
+    assert document_id == get_document_id(document)
+    assert "query User" in document
+    assert "fragment UserFields on User" in document
+    assert "fragment More on User" in document
+    assert "Unused" not in document
+
+
+@pytest.mark.parametrize("extension", ["json", "pickle"])
+def test_saved_manifest_is_loaded(tmp_path, hello_schema, extension):
+    # Given
+    path = str(tmp_path / f"manifest.{extension}")
+    save_manifest(path, {HELLO_ID: HELLO_QUERY})
+
+    # When
+    trusted_documents = TrustedDocuments.from_file(path)
+    trusted_documents.prepare(hello_schema)
+
+    # Then
+    assert trusted_documents.documents == {HELLO_ID: HELLO_QUERY}
+    assert trusted_documents.get_cached_document(HELLO_QUERY).validation_errors == []
+
+
+def test_apollo_manifest_is_loaded(tmp_path):
+    # Given
+    path = tmp_path / "manifest.json"
+    path.write_text(
+        json.dumps(
+            {
+                "format": "apollo-persisted-query-manifest",
+                "version": 1,
+                "operations": [{"id": "abc", "name": "Hello", "type": "query", "body": "{ a }"}],
+            }
+        )
+    )
+
+    # When
+    documents = load_manifest(str(path))
+
+    # Then
+    assert documents == {"abc": "{ a }"}
+
+
+def test_cli_extracts_operations_from_client_sources(tmp_path):
+    # Given
+    (tmp_path / "src").mkdir()
+    (tmp_path / "src" / "hello.graphql").write_text("query Hello { hello }")
+    (tmp_path / "src" / "user.ts").write_text(
+        "const USER = gql`\n  query User { user { name } }\n`;\n"
+        "const DYNAMIC = gql`query Dynamic { ${field} }`;\n"
+    )
+    output = str(tmp_path / "manifest.pickle")
+
+    # When
+    main([str(tmp_path / "src"), "-o", output])
+
+    # Then
+    documents = load_manifest(output)
+    names = sorted(document.split()[1] for document, _ in documents.values())
+    assert names == ["Hello", "User"]
+
+
+def test_cli_saves_documents_ids_by_operation_names(tmp_path):
+    # Given
+    (tmp_path / "hello.graphql").write_text(
+        "query Hello { hello ...Fields }\nfragment Fields on Query { hello }"
+    )
+    output = str(tmp_path / "manifest.json")
+    operation_ids_output = tmp_path / "operation-ids.json"
+    argv = [str(tmp_path / "hello.graphql"), "-o", output]
+
+    # When
+    main([*argv, "--operation-ids", str(operation_ids_output)])
+
+    # Then
+    documents = load_manifest(output)
+    operation_ids = json.loads(operation_ids_output.read_text())
+    assert list(operation_ids) == ["Hello"]
+    assert documents[operation_ids["Hello"]].startswith("query Hello")
+
+
+def test_get_operation_ids_raises_error_for_duplicated_operation_name():
+    # Given
+    documents = {"a": "query Hello { hello }", "b": "query Hello { other }"}
+
+    # When / Then
+    with pytest.raises(ValueError, match="Operation Hello is defined in more than one document"):
+        get_operation_ids(documents)
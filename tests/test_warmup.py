@@ -0,0 +1,157 @@
+from unittest.mock import patch
+
+import pytest
+from ariadne import MutationType, QueryType, make_executable_schema
+
+from ariadne_lambda.cache import DocumentCache
+from ariadne_lambda.direct_handler import GraphQLDirectInvokeHandler
+from ariadne_lambda.graphql import GraphQLLambda
+from ariadne_lambda.resources import Resource
+from ariadne_lambda.result_cache import ResultCache
+from ariadne_lambda.schema import Request
+from ariadne_lambda.warmup import warmup
+
+TYPE_DEFS = """
+    type Query {
+        hello(name: String): String!
+    }
+
+    type Mutation {
+        save: Boolean!
+    }
+"""
+
+
+@pytest.fixture
+def contexts():
+    return []
+
+
+@pytest.fixture
+def schema(contexts):
+    query = QueryType()
+    mutation = MutationType()
+
+    @query.field("hello")
+    def resolve_hello(_, info, name="world"):
+        contexts.append(info.context)
+        return f"Hello {name}!"
+
+    mutation.set_field("save", lambda *_: True)
+    return make_executable_schema(TYPE_DEFS, query, mutation)
+
+
+def test_warmup_fills_document_cache(schema, contexts):
+    # Given
+    document_cache = DocumentCache()
+    app = GraphQLLambda(schema, document_cache=document_cache)
+
+    # When
+    report = app.warmup(
+        [
+            "{ hello }",
+            {"query": "query Greet($name: String) { hello(name: $name) }", "variables": {}},
+        ]
+    )
+
+    # Then
+    assert len(document_cache) == 2
+    assert [operation.name for operation in report.operations] == ["anonymous", "Greet"]
+    assert [operation.errors for operation in report.operations] == [0, 0]
+    assert report.duration_ms >= sum(operation.duration_ms for operation in report.operations)
+    assert all(context["warmup"] is True for context in contexts)
+    assert isinstance(contexts[0]["request"], Request)
+
+
+def test_warmup_reports_operation_errors(schema):
+    # Given
+    app = GraphQLLambda(schema)
+
+    # When
+    report = app.warmup(["{ unknown }"])
+
+    # Then
+    assert report.operations[0].errors == 1
+    assert report.as_dict()["operations"] == [
+        {"name": "anonymous", "duration_ms": report.operations[0].duration_ms, "errors": 1}
+    ]
+
+
+def test_warmup_rejects_mutations(schema):
+    # Given
+    app = GraphQLLambda(schema)
+
+    # When / Then
+    with pytest.raises(ValueError, match="must be queries"):
+        app.warmup(["{ hello }", "mutation { save }"])
+
+
+def test_warmup_uses_event_loop_of_handler(schema):
+    # Given
+    app = GraphQLLambda(schema)
+    app.as_handler()
+    runner = app.event_loop_runner
+
+    # When
+    app.warmup(["{ hello }"])
+
+    # Then
+    assert app.event_loop_runner is runner
+
+
+def test_warmup_uses_custom_context_value(schema, contexts):
+    # Given
+    app = GraphQLLambda(schema)
+
+    # When
+    app.warmup(["{ hello }"], context_value={"user": None})
+
+    # Then
+    assert contexts == [{"user": None}]
+
+
+@pytest.mark.asyncio
+async def test_warmup_skips_result_cache(schema):
+    # Given
+    handler = GraphQLDirectInvokeHandler()
+    result_cache = ResultCache(shared=True)
+    handler.configure(schema, result_cache=result_cache)
+
+    result_caches = []
+
+    def resolve_hello(*_):
+        result_caches.append(handler.result_cache)
+        return "Hello!"
+
+    schema.query_type.fields["hello"].resolve = resolve_hello
+
+    # When
+    await warmup(handler, ["{ hello }"])
+
+    # Then
+    assert result_caches == [result_cache]
+    assert not len(result_cache)
+
+
+class Client:
+    def __init__(self) -> None:
+        self.closed = False
+
+    async def aclose(self) -> None:
+        self.closed = True
+
+
+def test_warmup_registers_shutdown_of_resources(schema):
+    # Given
+    app = GraphQLLambda(schema, resources={"client": Resource(Client)})
+
+    # When
+    with patch("ariadne_lambda.event_loop.signal.signal"):
+        app.warmup(["{ hello }"])
+        app.as_handler()
+    client = app.resources.resources["client"].value
+    app.event_loop_runner.shutdown()
+
+    # Then
+    assert client.closed
+    assert app.event_loop_runner.shutdown_callbacks == [app.resources.shutdown]